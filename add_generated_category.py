@@ -0,0 +1,46 @@
+from store.postgres import get_connection
+
+print("Making material_prices_raw.material_category a generated column...")
+
+with get_connection() as conn:
+    with conn.cursor() as cur:
+        try:
+            cur.execute("""
+                SELECT is_generated
+                FROM information_schema.columns
+                WHERE table_name = 'material_prices_raw' AND column_name = 'material_category'
+            """)
+            row = cur.fetchone()
+            if row and row[0] == 'ALWAYS':
+                print("Already generated - nothing to do.")
+            else:
+                # Existing values were written by Python with the same rules
+                cur.execute("""
+                    ALTER TABLE material_prices_raw
+                    DROP COLUMN IF EXISTS material_category,
+                    ADD COLUMN material_category VARCHAR(50) GENERATED ALWAYS AS (
+                        CASE
+                            WHEN material_name ~* '(copper|cu|aluminum|aluminium|al|steel|iron|hms|brass|bronze|lead|pb|zinc|zn)' THEN 'metals'
+                            WHEN material_name ~* '(plastic|hdpe|ldpe|pet|pvc|pp)' THEN 'plastics'
+                            WHEN material_name ~* '(paper|cardboard|occ)' THEN 'paper'
+                            ELSE 'other'
+                        END
+                    ) STORED
+                """)
+                conn.commit()
+                print("✅ Column converted successfully!")
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            conn.rollback()
+
+# Verify
+from store.postgres import execute_query
+cols = execute_query("""
+    SELECT column_name 
+    FROM information_schema.columns 
+    WHERE table_name = 'material_prices_raw' AND column_name = 'material_category' AND is_generated = 'ALWAYS'
+""")
+if cols:
+    print(f"Verified: material_category is generated")
+else:
+    print("Generated column NOT found!")
@@ -0,0 +1,18 @@
+"""
+Install the hll (HyperLogLog) extension so project_ai_metrics.py can
+estimate distinct materials per industry instead of running an exact
+COUNT(DISTINCT). Skipped when the server does not ship hll.
+"""
+from store.postgres import get_connection
+
+print("Adding hll extension...")
+
+with get_connection() as conn:
+    with conn.cursor() as cur:
+        cur.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'hll'")
+        if cur.fetchone():
+            cur.execute("CREATE EXTENSION IF NOT EXISTS hll")
+            conn.commit()
+            print("✅ hll")
+        else:
+            print("⚠️ hll is not available on this server; metrics stay exact")
@@ -0,0 +1,26 @@
+"""
+Add the pg_trgm GIN index on waste_listings.material so substring and
+regex material searches (check_metal, ILIKE '%...%') can use an index
+instead of a sequential scan.
+
+The index is built CONCURRENTLY so waste_listings stays writable.
+"""
+from store.postgres import get_connection
+
+print("Adding material trigram index...")
+
+with get_connection() as conn:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            cur.execute("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_waste_material_trgm
+                ON waste_listings USING gin (material gin_trgm_ops)
+            """)
+            print("✅ idx_waste_material_trgm")
+            cur.execute("ANALYZE waste_listings")
+            print("✅ ANALYZE")
+    finally:
+        conn.autocommit = False
@@ -0,0 +1,61 @@
+"""
+Add the lower(trim()) expression indexes used by the valuation join, the
+covering indexes for the exact-match join, and rebuild mv_valuation_rollup
+with the normalized join key.
+
+Indexes are built CONCURRENTLY so waste_listings stays writable.
+"""
+from store.postgres import get_connection
+
+print("Adding valuation join indexes...")
+
+with get_connection() as conn:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mtm_waste_lower ON material_type_mapping (lower(trim(waste_material)))")
+            print("✅ idx_mtm_waste_lower")
+            cur.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_wl_material_lower ON waste_listings (lower(trim(material)))")
+            print("✅ idx_wl_material_lower")
+            cur.execute("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_wl_material_qty_covering ON waste_listings (material)
+                INCLUDE (quantity_tons, source_company) WHERE quantity_tons > 0
+            """)
+            print("✅ idx_wl_material_qty_covering")
+            cur.execute("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_mtm_waste_covering ON material_type_mapping (waste_material)
+                INCLUDE (material_type_id)
+            """)
+            print("✅ idx_mtm_waste_covering")
+            cur.execute("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_valuations_type_price ON material_valuations (material_type_id)
+                INCLUDE (price_per_ton_usd)
+            """)
+            print("✅ idx_valuations_type_price")
+            # Fresh statistics so the planner picks the new indexes up
+            cur.execute("ANALYZE waste_listings, material_type_mapping, material_valuations")
+            print("✅ ANALYZE")
+    finally:
+        conn.autocommit = False
+
+print("Rebuilding mv_valuation_rollup with the normalized join...")
+
+with get_connection() as conn:
+    with conn.cursor() as cur:
+        cur.execute("DROP MATERIALIZED VIEW IF EXISTS mv_valuation_rollup")
+        cur.execute("""
+            CREATE MATERIALIZED VIEW mv_valuation_rollup AS
+            SELECT 
+                mv.material_type_id,
+                mv.material_name,
+                COUNT(*) as records,
+                SUM(wl.quantity_tons) as tons,
+                SUM(wl.quantity_tons * mv.price_per_ton_usd) as value
+            FROM waste_listings wl
+            JOIN material_type_mapping mtm ON lower(trim(wl.material)) = lower(trim(mtm.waste_material))
+            JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
+            GROUP BY mv.material_type_id, mv.material_name
+        """)
+        cur.execute("CREATE UNIQUE INDEX idx_valuation_rollup_type_id ON mv_valuation_rollup(material_type_id)")
+        print("✅ mv_valuation_rollup rebuilt")
@@ -2,6 +2,7 @@
 Apply pricing schema and mappings using proper connection handling.
 """
 from store.postgres import get_connection, execute_query
+from processors.pricing_processor import refresh_valuation_rollup
 
 print("="*60)
 print("STEP 1: CREATE TABLES")
@@ -32,6 +33,20 @@ with get_connection() as conn:
                 created_at TIMESTAMP DEFAULT NOW()
             )
         """)
+        cur.execute("""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS mv_valuation_rollup AS
+            SELECT 
+                mv.material_type_id,
+                mv.material_name,
+                COUNT(*) as records,
+                SUM(wl.quantity_tons) as tons,
+                SUM(wl.quantity_tons * mv.price_per_ton_usd) as value
+            FROM waste_listings wl
+            JOIN material_type_mapping mtm ON lower(trim(wl.material)) = lower(trim(mtm.waste_material))
+            JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
+            GROUP BY mv.material_type_id, mv.material_name
+        """)
+        cur.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_valuation_rollup_type_id ON mv_valuation_rollup(material_type_id)")
         conn.commit()
         print("[OK] Tables created")
 
@@ -104,6 +119,7 @@ with get_connection() as conn:
         conn.commit()
 
 print(f"[OK] Mapped {mapped} materials")
+refresh_valuation_rollup()
 
 print("\n" + "="*60)
 print("SUMMARY")
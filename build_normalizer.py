@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Symbio Data Engine - Optional Native Normalizer Build
+=====================================================
+Compiles processors/normalizer.py to a C extension with mypyc.
+
+Python picks up the compiled .so next to normalizer.py automatically;
+if it was never built (or was cleaned), the pure-Python module is used.
+
+Usage:
+    pip install mypy
+    python build_normalizer.py          # build in place
+    python build_normalizer.py --clean  # remove the build, back to pure Python
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.resolve()
+TARGET = "processors/normalizer.py"
+
+
+def clean():
+    """Remove compiled extensions and mypyc build artifacts."""
+    for path in (BASE_DIR / "processors").glob("normalizer*.so"):
+        path.unlink()
+        print(f"Removed {path.relative_to(BASE_DIR)}")
+    for path in (BASE_DIR / "processors").glob("normalizer*.pyd"):
+        path.unlink()
+        print(f"Removed {path.relative_to(BASE_DIR)}")
+    shutil.rmtree(BASE_DIR / "build", ignore_errors=True)
+
+
+def build() -> int:
+    """Compile the normalizer in place. Returns the mypyc exit code."""
+    if shutil.which("mypyc") is None:
+        print("mypyc not found. Run: pip install mypy")
+        return 1
+
+    print(f"Compiling {TARGET} with mypyc...")
+    result = subprocess.run(
+        ["mypyc", "--ignore-missing-imports", TARGET],
+        cwd=BASE_DIR,
+    )
+
+    if result.returncode == 0:
+        print("✅ Native normalizer built. Run with --clean to revert.")
+    else:
+        print("❌ Build failed - the pure-Python normalizer is still in use.")
+    return result.returncode
+
+
+if __name__ == "__main__":
+    if "--clean" in sys.argv:
+        clean()
+    else:
+        sys.exit(build())
@@ -4,6 +4,7 @@ Maps all 586 materials to available price categories.
 Uses hierarchical matching: specific → category → default.
 """
 from store.postgres import execute_query, get_connection
+from processors.pricing_processor import refresh_valuation_rollup
 from collections import defaultdict
 
 print("="*70)
@@ -185,6 +186,7 @@ with get_connection() as conn:
         conn.commit()
 
 print(f"[OK] {len(mapped)} mappings stored")
+refresh_valuation_rollup()
 
 # Show coverage by price category
 print("\n" + "="*70)
@@ -77,6 +77,10 @@ TESSERACT_CMD = os.getenv("TESSERACT_CMD", r"C:\Program Files\Tesseract-OCR\tess
 # Extraction confidence threshold
 MIN_EXTRACTION_CONFIDENCE = float(os.getenv("MIN_EXTRACTION_CONFIDENCE", "0.7"))
 
+# Validate extractions with msgspec (processors/fast_models.py) instead of
+# Pydantic. Requires msgspec; falls back to Pydantic if it is missing.
+USE_FAST_VALIDATOR = os.getenv("USE_FAST_VALIDATOR", "false").lower() == "true"
+
 # ============================================
 # LLM / AI CONFIGURATION
 # ============================================
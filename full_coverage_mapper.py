@@ -3,6 +3,7 @@ Map ALL 586 materials to pricing using category-based defaults.
 Every material gets a price - either specific or default by category.
 """
 from store.postgres import execute_query, get_connection
+from processors.pricing_processor import refresh_valuation_rollup
 
 print("="*70)
 print("FULL COVERAGE PRICING MAPPER")
@@ -136,6 +137,7 @@ with get_connection() as conn:
         conn.commit()
 
 print(f"[OK] {len(mapped)} mappings stored")
+refresh_valuation_rollup()
 
 # Verify coverage
 print("\n" + "="*70)
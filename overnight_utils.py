@@ -0,0 +1,26 @@
+"""
+Helpers shared by the overnight runners (run_overnight.py, run_mega_overnight.py).
+"""
+import os
+from pathlib import Path
+
+PDF_DIR = "data/raw/csr_reports"
+
+
+def count_pdfs(pdf_dir: str = PDF_DIR) -> int:
+    """Count PDFs with one scandir pass (no Path objects, no list)."""
+    if not os.path.isdir(pdf_dir):
+        return 0
+    with os.scandir(pdf_dir) as it:
+        return sum(1 for e in it if e.name.endswith(".pdf"))
+
+
+def export_sizes(paths: list) -> dict:
+    """Size in bytes of each export file; missing files map to None."""
+    sizes = {}
+    for p in paths:
+        try:
+            sizes[p] = Path(p).stat().st_size
+        except OSError:
+            sizes[p] = None
+    return sizes
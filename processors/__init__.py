@@ -17,6 +17,10 @@ from .models import (
     SymbiosisExchangeExtraction,
     ExtractionResult,
     validate_and_create,
+    validate_and_create_batch,
+    validate_and_create_trusted,
+    CitationIndex,
+    validate_citation_batch,
 )
 
 
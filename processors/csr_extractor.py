@@ -79,8 +79,8 @@ class CSRExtractor:
     ENERGY_UNITS = ['mwh', 'gwh', 'twh', 'kwh', 'gj', 'tj', 'mj', 'btu']
     MASS_UNITS = ['mt', 'tonnes', 'tons', 'kg', 'kilotons', 'kt']
     
-    def __init__(self):
-        self.pdf_processor = PDFProcessor()
+    def __init__(self, pdf_backend: Optional[str] = None, ocr_workers: Optional[int] = None):
+        self.pdf_processor = PDFProcessor(backend=pdf_backend, ocr_workers=ocr_workers)
         
         # WASTE patterns
         self.waste_patterns = [
@@ -156,17 +156,33 @@ class CSRExtractor:
         """Extract all data categories from a CSR PDF."""
         pdf_path = Path(pdf_path)
         
-        empty_result = {"waste_data": [], "emissions": [], "financials": [], "energy": [], "carbon_credits": []}
-        
         if not pdf_path.exists():
-            return empty_result
+            return self._empty_result()
         
         text = self.pdf_processor.extract_text(pdf_path)
+        return self._extract_from_text(text, pdf_path.name, company)
+    
+    def extract_from_bytes(self, pdf_bytes: bytes, filename: str, company: str = "unknown") -> dict:
+        """
+        Extract all data categories from an in-memory CSR PDF.
         
+        Args:
+            pdf_bytes: PDF file contents
+            filename: Original file name (used for year detection)
+            company: Company the report belongs to
+        """
+        text = self.pdf_processor.extract_text(pdf_bytes)
+        return self._extract_from_text(text, filename, company)
+    
+    def _empty_result(self) -> dict:
+        return {"waste_data": [], "emissions": [], "financials": [], "energy": [], "carbon_credits": []}
+    
+    def _extract_from_text(self, text: str, filename: str, company: str) -> dict:
+        """Run all category extractors over a report's text."""
         if not text:
-            return empty_result
+            return self._empty_result()
         
-        year = self._extract_year(pdf_path.name, text)
+        year = self._extract_year(filename, text)
         
         waste_data = self._extract_waste(text, company, year)
         emissions = self._extract_emissions(text, company, year)
@@ -28,6 +28,13 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Optional msgspec fast path (see config.USE_FAST_VALIDATOR)
+try:
+    from .fast_models import FAST_MODELS, validate_and_explain_fast, to_dict
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 
 # Extraction schemas for different document types
 # 🛡️ NOTE: source_quote and extraction_confidence are REQUIRED
@@ -69,6 +76,10 @@ EXTRACTION_SCHEMAS = {
     },
 }
 
+# Schema detection keywords (bytes for bytes.find scanning)
+CARBON_KEYWORDS = (b"co2", b"carbon", b"emission", b"ghg", b"greenhouse")
+SYMBIOSIS_KEYWORDS = (b"symbiosis", b"exchange", b"industrial park", b"eco-park")
+
 
 class Extractor:
     """
@@ -260,14 +271,16 @@ Example: [{{"_schema": "waste_listing", "material": "...", "source_quote": "..."
     
     def _detect_schema(self, text: str, doc_type: str = None) -> str:
         """Detect appropriate schema based on content."""
-        text_lower = text.lower()
+        # Keywords are ASCII, so non-ASCII chars can be dropped and the
+        # scan done with bytes.find (C fast-path) on a single buffer
+        text_b = text.lower().encode("ascii", "ignore")
         
         # Check for carbon/emissions content
-        if any(word in text_lower for word in ["co2", "carbon", "emission", "ghg", "greenhouse"]):
+        if any(text_b.find(kw) != -1 for kw in CARBON_KEYWORDS):
             return "carbon_emission"
         
         # Check for symbiosis/exchange content
-        if any(word in text_lower for word in ["symbiosis", "exchange", "industrial park", "eco-park"]):
+        if any(text_b.find(kw) != -1 for kw in SYMBIOSIS_KEYWORDS):
             return "symbiosis_exchange"
         
         # Default to waste listing
@@ -296,6 +309,12 @@ Example: [{{"_schema": "waste_listing", "material": "...", "source_quote": "..."
         if not model_class:
             return ExtractionResult.failure(schema, f"Unknown schema: {schema}")
         
+        if config.USE_FAST_VALIDATOR and MSGSPEC_AVAILABLE:
+            fast_record, reason = validate_and_explain_fast(FAST_MODELS[schema], raw_data, original_text)
+            if fast_record is None:
+                return ExtractionResult.failure(schema, reason)
+            return ExtractionResult.success_fast(schema, to_dict(fast_record))
+        
         record = validate_and_create(model_class, raw_data, original_text)
         
         if record:
@@ -0,0 +1,179 @@
+"""
+Symbio Data Engine - Fast Extraction Models
+===========================================
+msgspec mirrors of the hot extraction models in models.py.
+
+Same fields, bounds and review rules as the Pydantic models, but
+validated in C by msgspec. Opt-in via USE_FAST_VALIDATOR; the Pydantic
+models remain the reference ("safe") schema.
+"""
+
+from typing import Annotated, Optional
+
+import msgspec
+from msgspec import Meta
+
+from .models import (
+    MIN_CONFIDENCE_FOR_AUTO_ACCEPT,
+    MIN_QUOTE_LENGTH,
+    MIN_YEAR,
+    MAX_YEAR,
+    _quote_in_text,
+)
+
+
+# Constrained types shared by the models below
+Year = Annotated[int, Meta(ge=MIN_YEAR, le=MAX_YEAR)]
+CompanyName = Annotated[str, Meta(min_length=2, max_length=255)]
+MaterialName = Annotated[str, Meta(min_length=2, max_length=100)]
+Str50 = Annotated[str, Meta(max_length=50)]
+Str100 = Annotated[str, Meta(max_length=100)]
+Str255 = Annotated[str, Meta(max_length=255)]
+NonNegative = Annotated[float, Meta(ge=0)]
+
+
+# ============================================
+# BASE MODEL WITH CITATION REQUIREMENT
+# ============================================
+class CitedRecordFast(msgspec.Struct, kw_only=True):
+    """msgspec counterpart of CitedRecord."""
+
+    source_quote: Annotated[str, Meta(min_length=MIN_QUOTE_LENGTH)]
+    extraction_confidence: Annotated[float, Meta(ge=0.0, le=1.0)]
+    requires_review: bool = False
+
+    def __post_init__(self):
+        """Flag for review if confidence below threshold."""
+        if self.extraction_confidence < MIN_CONFIDENCE_FOR_AUTO_ACCEPT:
+            self.requires_review = True
+
+
+# ============================================
+# SYMBIOFLOWS: Waste Listings
+# ============================================
+class WasteListingExtractionFast(CitedRecordFast, kw_only=True):
+    """msgspec counterpart of WasteListingExtraction."""
+
+    material: MaterialName
+    material_category: Optional[Str50] = None
+    treatment_method: Optional[str] = None
+    quantity_tons: Optional[Annotated[float, Meta(gt=0, le=100_000_000)]] = None
+    original_quantity: Optional[float] = None
+    original_unit: Optional[str] = None
+    price_per_ton: Optional[Annotated[float, Meta(gt=0, le=1_000_000)]] = None
+    currency: Optional[Annotated[str, Meta(pattern=r"^[A-Z]{3}$")]] = None
+    source_company: Optional[Str255] = None
+    source_location: Optional[Str255] = None
+    quality_grade: Optional[Annotated[str, Meta(pattern=r"^[A-C]$|^contaminated$")]] = None
+    year: Optional[Year] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Normalize material name
+        self.material = self.material.strip().lower()
+
+
+# ============================================
+# SYMBIOTRUST: Carbon Emissions
+# ============================================
+class CarbonEmissionExtractionFast(CitedRecordFast, kw_only=True):
+    """msgspec counterpart of CarbonEmissionExtraction."""
+
+    company: CompanyName
+    facility: Optional[Str255] = None
+    year: Year
+    co2_tons: Optional[Annotated[float, Meta(gt=0, le=10_000_000_000)]] = None
+    co2_scope1: Optional[NonNegative] = None
+    co2_scope2: Optional[NonNegative] = None
+    co2_scope3: Optional[NonNegative] = None
+    co2_avoided_tons: Optional[NonNegative] = None
+    methodology: Optional[Str100] = None
+
+    def __post_init__(self):
+        super().__post_init__()
+        # Validate that scopes don't exceed total if all provided
+        if self.co2_tons and self.co2_scope1 and self.co2_scope2:
+            scope_sum = self.co2_scope1 + self.co2_scope2
+            # Allow 10% tolerance for rounding
+            if scope_sum > self.co2_tons * 1.1:
+                self.requires_review = True
+
+
+# ============================================
+# RESEARCH: Symbiosis Exchanges
+# ============================================
+class SymbiosisExchangeExtractionFast(CitedRecordFast, kw_only=True):
+    """msgspec counterpart of SymbiosisExchangeExtraction."""
+
+    eco_park: Optional[Str100] = None
+    year: Year
+    source_company: CompanyName
+    target_company: CompanyName
+    material: MaterialName
+    volume_tons: Optional[Annotated[float, Meta(gt=0, le=100_000_000)]] = None
+    exchange_type: Optional[
+        Annotated[str, Meta(pattern=r"^(waste|byproduct|energy|water|steam|heat)$")]
+    ] = None
+    co2_savings_tons: Optional[NonNegative] = None
+
+
+FAST_MODELS = {
+    "waste_listing": WasteListingExtractionFast,
+    "carbon_emission": CarbonEmissionExtractionFast,
+    "symbiosis_exchange": SymbiosisExchangeExtractionFast,
+}
+
+
+# ============================================
+# VALIDATION HELPERS
+# ============================================
+def validate_and_create_fast(
+    struct_class: type[CitedRecordFast],
+    data: dict,
+    original_text: str,
+) -> Optional[CitedRecordFast]:
+    """
+    msgspec version of validate_and_create.
+
+    Same contract: citation checked first, then typed validation
+    (lax, like Pydantic - e.g. "2020" is accepted for an int year).
+
+    Returns:
+        Validated record or None if validation fails
+    """
+    return validate_and_explain_fast(struct_class, data, original_text)[0]
+
+
+def validate_and_explain_fast(
+    struct_class: type[CitedRecordFast],
+    data: dict,
+    original_text: str,
+) -> tuple[Optional[CitedRecordFast], Optional[str]]:
+    """
+    validate_and_create_fast that also says why a record was rejected.
+
+    Returns:
+        (record, None) if valid, else (None, rejection reason) - the
+        reason carries msgspec's message, e.g. "Expected `int` >= 1990
+        - at `$.year`"
+    """
+    quote = data.get("source_quote")
+    if not isinstance(quote, str) or not _quote_in_text(quote, original_text):
+        # Citation not found - record is REJECTED
+        return None, "Citation not found in source text"
+
+    try:
+        return msgspec.convert(data, type=struct_class, strict=False), None
+    except msgspec.ValidationError as e:
+        # Validation failed - record is REJECTED
+        return None, f"Validation failed: {e}"
+
+
+def to_dict(record: CitedRecordFast) -> dict:
+    """
+    Convert a fast record to a plain dict (like model_dump).
+
+    None fields are left out, matching the Pydantic path's
+    exclude_unset=True dump (the inserters drop them anyway).
+    """
+    return {k: v for k, v in msgspec.structs.asdict(record).items() if v is not None}
@@ -7,9 +7,24 @@ All extracted data MUST pass through these models.
 Any validation failure = record discarded.
 """
 
+import unicodedata
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, model_validator
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import pydivsufsort
+    PYDIVSUFSORT_AVAILABLE = True
+except ImportError:
+    PYDIVSUFSORT_AVAILABLE = False
 
 
 # ============================================
@@ -59,6 +74,11 @@ class CitedRecord(BaseModel):
         if self.extraction_confidence < MIN_CONFIDENCE_FOR_AUTO_ACCEPT:
             self.requires_review = True
         return self
+    
+    @property
+    def needs_review(self) -> bool:
+        """Whether the record must be manually reviewed."""
+        return self.requires_review
 
 
 # ============================================
@@ -199,7 +219,7 @@ class CarbonEmissionExtraction(CitedRecord):
     def validate_scope_totals(self):
         """Validate that scopes don't exceed total if all provided."""
         if self.co2_tons and self.co2_scope1 and self.co2_scope2:
-            scope_sum = (self.co2_scope1 or 0) + (self.co2_scope2 or 0)
+            scope_sum = self.co2_scope1 + self.co2_scope2
             # Allow 10% tolerance for rounding
             if scope_sum > self.co2_tons * 1.1:
                 self.requires_review = True
@@ -263,7 +283,57 @@ class SymbiosisExchangeExtraction(CitedRecord):
 # ============================================
 # VALIDATION HELPERS
 # ============================================
-def validate_citation(record: CitedRecord, original_text: str) -> bool:
+# Typographic characters that LLMs and PDF extractors disagree on
+_QUOTE_VARIANTS = str.maketrans({
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2026": "...",
+    "\u00a0": " ",
+})
+
+
+def normalize_citation_text(text: str) -> str:
+    """
+    Canonical form for citation matching.
+    
+    Unicode NFC, curly quotes/dashes/ellipsis/nbsp mapped to ASCII,
+    lowercased. Applied to both the quote and the document.
+    """
+    return unicodedata.normalize("NFC", text).translate(_QUOTE_VARIANTS).lower()
+
+
+@lru_cache(maxsize=32)
+def _normalized_document(text: str) -> str:
+    """Normalize a source document once for all records cited from it."""
+    return normalize_citation_text(text)
+
+
+def _quote_in_text(
+    quote: str,
+    original_text: str,
+    pre_normalized_text: Optional[str] = None,
+) -> bool:
+    """Case-insensitive substring check of a quote against source text."""
+    if not quote or not original_text:
+        return False
+    
+    # Normalize both for comparison
+    quote_normalized = normalize_citation_text(quote).strip()
+    text_normalized = pre_normalized_text or _normalized_document(original_text)
+    
+    # Check for substring match
+    return quote_normalized in text_normalized
+
+
+def validate_citation(
+    record: CitedRecord,
+    original_text: str,
+    pre_normalized_text: Optional[str] = None,
+) -> bool:
     """
     Validate that the source_quote exists in the original text.
     
@@ -273,19 +343,146 @@ def validate_citation(record: CitedRecord, original_text: str) -> bool:
     Args:
         record: Extracted record with source_quote
         original_text: Original text the extraction came from
+        pre_normalized_text: normalize_citation_text(original_text), if the
+            caller already has it
     
     Returns:
         True if quote is found, False otherwise
     """
-    if not record.source_quote or not original_text:
-        return False
+    return _quote_in_text(record.source_quote, original_text, pre_normalized_text)
+
+
+class CitationIndex:
+    """
+    Suffix-array index over one (citation-normalized) source document.
     
-    # Normalize both for comparison
-    quote_normalized = record.source_quote.lower().strip()
-    text_normalized = original_text.lower()
+    Built once per document, it answers each citation lookup with a
+    binary search (O(|quote| log |text|)) instead of a full scan, which
+    pays off when many records cite the same long report. Falls back to
+    plain substring search if pydivsufsort is not installed.
+    """
     
-    # Check for substring match
-    return quote_normalized in text_normalized
+    def __init__(self, original_text: str):
+        self.normalized = _normalized_document(original_text) if original_text else ""
+        self._data = self.normalized.encode("utf-8")
+        self._sa = (
+            pydivsufsort.divsufsort(self._data)
+            if PYDIVSUFSORT_AVAILABLE and self._data
+            else None
+        )
+    
+    def contains(self, quote: str) -> bool:
+        """Case-insensitive check that quote occurs in the document."""
+        if not quote or not self.normalized:
+            return False
+        
+        quote_normalized = normalize_citation_text(quote).strip()
+        if self._sa is None:
+            return quote_normalized in self.normalized
+        
+        # Lower-bound search for the first suffix >= quote
+        needle = quote_normalized.encode("utf-8")
+        size = len(needle)
+        data, sa = self._data, self._sa
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = int(sa[mid])
+            if data[start:start + size] < needle:
+                lo = mid + 1
+            else:
+                hi = mid
+        
+        if lo == len(sa):
+            return False
+        start = int(sa[lo])
+        return data[start:start + size] == needle
+
+
+def quotes_in_text(quotes: list[Optional[str]], original_text: str) -> list[bool]:
+    """
+    Check many quotes against one document in a single pass.
+    
+    Builds an Aho-Corasick automaton over all normalized quotes and
+    scans the normalized document once, instead of one scan per quote.
+    Falls back to per-quote substring checks without pyahocorasick.
+    
+    Args:
+        quotes: Quotes to look for (None/empty quotes are never found)
+        original_text: Original text the quotes should come from
+    
+    Returns:
+        One bool per quote, True if found
+    """
+    if not original_text:
+        return [False] * len(quotes)
+    
+    if not AHOCORASICK_AVAILABLE:
+        return [_quote_in_text(quote, original_text) for quote in quotes]
+    
+    text_normalized = _normalized_document(original_text)
+    found = [False] * len(quotes)
+    
+    automaton = ahocorasick.Automaton()
+    for i, quote in enumerate(quotes):
+        if not quote:
+            continue
+        quote_normalized = normalize_citation_text(quote).strip()
+        if not quote_normalized:
+            # Empty after stripping - trivially a substring
+            found[i] = True
+        elif quote_normalized in automaton:
+            automaton.get(quote_normalized).append(i)
+        else:
+            automaton.add_word(quote_normalized, [i])
+    
+    if len(automaton) == 0:
+        return found
+    
+    automaton.make_automaton()
+    remaining = len(automaton)
+    for _, indices in automaton.iter(text_normalized):
+        if not found[indices[0]]:
+            for i in indices:
+                found[i] = True
+            remaining -= 1
+            if remaining == 0:
+                break
+    
+    return found
+
+
+def validate_citation_batch(
+    records: list[CitedRecord],
+    index: CitationIndex,
+) -> list[bool]:
+    """
+    Validate many records' citations against one indexed document.
+    
+    Args:
+        records: Extracted records with source_quote
+        index: CitationIndex of the original text
+    
+    Returns:
+        One bool per record, True if its quote is found
+    """
+    return [index.contains(record.source_quote) for record in records]
+
+
+@lru_cache(maxsize=16)
+def _get_adapter(model_class: type[CitedRecord]) -> TypeAdapter:
+    """Build (once) and return the validator for a model class."""
+    return TypeAdapter(model_class)
+
+
+# Build the hot validators at import so schema and pattern compilation
+# (currency, quality_grade, exchange_type) happens exactly once
+for _model_class in (
+    WasteListingExtraction,
+    CarbonEmissionExtraction,
+    SymbiosisExchangeExtraction,
+):
+    _get_adapter(_model_class)
 
 
 def validate_and_create(
@@ -296,6 +493,9 @@ def validate_and_create(
     """
     Validate data and create record only if citation is valid.
     
+    The citation is checked on the raw quote first, so records that
+    would be rejected never pay for full Pydantic validation.
+    
     Args:
         model_class: Pydantic model class to use
         data: Extracted data dict
@@ -304,25 +504,90 @@ def validate_and_create(
     Returns:
         Validated record or None if validation fails
     """
+    quote = data.get("source_quote")
+    if not isinstance(quote, str) or not _quote_in_text(quote, original_text):
+        # Citation not found - record is REJECTED
+        return None
+    
     try:
-        record = model_class(**data)
-        
-        if validate_citation(record, original_text):
-            return record
-        else:
-            # Citation not found - record is REJECTED
-            return None
-            
+        return _get_adapter(model_class).validate_python(data)
     except Exception:
         # Validation failed - record is REJECTED
         return None
 
 
+def validate_and_create_batch(
+    model_class: type[CitedRecord],
+    data_list: list[dict],
+    original_text: str,
+) -> list[Optional[CitedRecord]]:
+    """
+    Batch version of validate_and_create for records from one document.
+    
+    All citations are checked with a single quotes_in_text pass; only
+    records whose quote is found are validated with Pydantic.
+    
+    Args:
+        model_class: Pydantic model class to use
+        data_list: Extracted data dicts
+        original_text: Original text for citation validation
+    
+    Returns:
+        Validated record or None, one per input dict
+    """
+    quotes = [
+        quote if isinstance(quote := data.get("source_quote"), str) else None
+        for data in data_list
+    ]
+    found = quotes_in_text(quotes, original_text)
+    adapter = _get_adapter(model_class)
+    
+    records: list[Optional[CitedRecord]] = []
+    for data, is_cited in zip(data_list, found):
+        if not is_cited:
+            # Citation not found - record is REJECTED
+            records.append(None)
+            continue
+        try:
+            records.append(adapter.validate_python(data))
+        except Exception:
+            # Validation failed - record is REJECTED
+            records.append(None)
+    
+    return records
+
+
+def validate_and_create_trusted(
+    model_class: type[CitedRecord],
+    data: dict,
+) -> CitedRecord:
+    """
+    Create a record WITHOUT validation.
+    
+    Only for data that already passed validation (e.g. rows read back
+    from the database). Never use on raw LLM or scraper output.
+    
+    Args:
+        model_class: Pydantic model class to use
+        data: Previously validated data dict
+    
+    Returns:
+        Record built via model_construct
+    """
+    return model_class.model_construct(**data)
+
+
 # ============================================
 # EXTRACTION RESULT CONTAINER
 # ============================================
-class ExtractionResult(BaseModel):
-    """Container for extraction results with metadata."""
+@dataclass(slots=True)
+class ExtractionResult:
+    """
+    Container for extraction results with metadata.
+    
+    Plain dataclass: it only carries data that already passed model
+    validation, so it needs no validation of its own.
+    """
     
     record_type: str
     data: Optional[dict] = None
@@ -336,11 +601,23 @@ class ExtractionResult(BaseModel):
         record_type: str,
         record: CitedRecord,
     ) -> "ExtractionResult":
+        # Unset fields are only defaults (None) that the inserters drop anyway
+        data = record.model_dump(mode="python", warnings=False, exclude_unset=True)
+        data["requires_review"] = record.needs_review
+        return cls.success_fast(record_type, data)
+    
+    @classmethod
+    def success_fast(
+        cls,
+        record_type: str,
+        record_dict: dict,
+    ) -> "ExtractionResult":
+        """Wrap an already-dumped, already-validated record dict."""
         return cls(
             record_type=record_type,
-            data=record.model_dump(),
+            data=record_dict,
             is_valid=True,
-            requires_review=record.requires_review,
+            requires_review=record_dict.get("requires_review", False),
         )
     
     @classmethod
@@ -13,11 +13,26 @@ Operations:
 
 import logging
 import re
+import unicodedata
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 from rapidfuzz import fuzz, process
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +59,40 @@ UNIT_CONVERSIONS = {
     "cwt": 0.0453592,  # Hundredweight (US)
 }
 
+# Unit lookup keyed by common raw spellings ("metric tons", "Tonnes", ...)
+# so the hot path is a single dict.get with no string normalization
+_UNIT_LOOKUP = {
+    **{unit.replace("_", " "): f for unit, f in UNIT_CONVERSIONS.items()},
+    **{unit.replace("_", " ").title(): f for unit, f in UNIT_CONVERSIONS.items()},
+    **{unit.replace("_", " ").upper(): f for unit, f in UNIT_CONVERSIONS.items()},
+    **UNIT_CONVERSIONS,
+}
+
+# Vectorized lookup: unit name -> index into _UNIT_FACTORS.
+# The trailing NaN slot marks units with no known conversion.
+_UNIT_INDEX = {unit: i for i, unit in enumerate(UNIT_CONVERSIONS)}
+_UNKNOWN_UNIT = len(_UNIT_INDEX)
+_UNIT_FACTORS = np.array([*UNIT_CONVERSIONS.values(), np.nan], dtype=np.float64)
+
+# Precompiled patterns (compiled once at import, reused per call)
+QUANTITY_PATTERN = re.compile(
+    r"([\d,]+\.?\d*)\s*(metric\s*tons?|tonnes?|tons?|kg|kilograms?|lbs?|pounds?|mt|t)\b",
+    re.IGNORECASE,
+)
+YEAR_PATTERN = re.compile(r"(19|20)\d{2}")
+
+# Date formats tried in order by parse_date (cold path after the fast paths)
+DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%Y/%m/%d",
+    "%d-%m-%Y",
+    "%B %d, %Y",
+    "%d %B %Y",
+    "%Y",
+)
+
 # Material category mapping
 MATERIAL_CATEGORIES = {
     "metals": [
@@ -77,6 +126,101 @@ MATERIAL_CATEGORIES = {
 }
 
 
+def _build_material_automaton():
+    """
+    Build an Aho-Corasick automaton over all category keywords.
+    
+    Each keyword maps to the index of its category in MATERIAL_CATEGORIES,
+    so the lowest index among matches reproduces the dict-order priority
+    of the plain keyword scan.
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, keywords in enumerate(MATERIAL_CATEGORIES.values()):
+        for keyword in keywords:
+            # First category wins if a keyword is listed twice
+            if keyword not in automaton:
+                automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_NAMES = tuple(MATERIAL_CATEGORIES)
+_MATERIAL_AUTOMATON = _build_material_automaton() if AHOCORASICK_AVAILABLE else None
+
+
+def _sort_tokens(name: str) -> str:
+    """Lowercase a name and sort its tokens (token_sort_ratio preprocessing)."""
+    return " ".join(sorted(name.lower().split()))
+
+
+def _lnrm_key(name: str) -> str:
+    """Lowercased-normalized form of a name, used as an exact-match key."""
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    return " ".join(ascii_name.lower().split())
+
+
+@lru_cache(maxsize=4096)
+def _categorize_material(material_lower: str) -> Optional[str]:
+    """Cached category lookup for an already-lowercased material name."""
+    if _MATERIAL_AUTOMATON is not None:
+        # Single pass over the string; keep the highest-priority category
+        best = min(
+            (rank for _, rank in _MATERIAL_AUTOMATON.iter(material_lower)),
+            default=None,
+        )
+        return _CATEGORY_NAMES[best] if best is not None else None
+    
+    for category, keywords in MATERIAL_CATEGORIES.items():
+        for keyword in keywords:
+            if keyword in material_lower:
+                return category
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Cached date parsing for an already-stripped date string."""
+    # Fast paths for the common ISO date and bare year forms
+    if date_str.isascii() and date_str.isdigit() and len(date_str) == 4:
+        try:
+            return datetime(int(date_str), 1, 1)
+        except ValueError:
+            pass
+    elif (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and date_str.replace("-", "").isascii()
+        and date_str.replace("-", "").isdigit()
+    ):
+        # Only this exact YYYY-MM-DD shape: other ISO forms (basic, week,
+        # datetimes) go through DATE_FORMATS/YEAR_PATTERN below either way,
+        # so the result doesn't depend on ciso8601 being installed
+        try:
+            if CISO8601_AVAILABLE:
+                return ciso8601.parse_datetime_as_naive(date_str)
+            return datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
+        except ValueError:
+            pass
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    # Try to extract year
+    year_match = YEAR_PATTERN.search(date_str)
+    if year_match:
+        try:
+            return datetime(int(year_match.group()), 1, 1)
+        except ValueError:
+            pass
+    
+    return None
+
+
 class Normalizer:
     """
     Data normalization processor.
@@ -84,7 +228,7 @@ class Normalizer:
     Standardizes units, resolves entities, and maps categories.
     """
     
-    def __init__(self, company_list: list[str] = None):
+    def __init__(self, company_list: Optional[list[str]] = None):
         """
         Initialize normalizer.
         
@@ -92,28 +236,25 @@ class Normalizer:
             company_list: List of known company names for matching
         """
         self.known_companies = company_list or []
+        # Token-sorted forms, so matching is a plain ratio (no re-sorting)
+        self._known_sorted = [_sort_tokens(c) for c in self.known_companies]
+        # Exact lookup on the normalized form; fuzzy matching only on misses
+        self._lnrm_index: dict[str, str] = {}
+        for company in self.known_companies:
+            self._lnrm_index.setdefault(_lnrm_key(company), company)
     
     def normalize(self, text: str) -> str:
         """
         Apply all normalizations to text.
         
-        Finds quantity-unit pairs and normalizes them to metric tons.
-        This modifies the text in-place for downstream processing.
+        Quantities are left exactly as written: extracted source quotes
+        must verify against the raw document, and the extractor records
+        amounts in their original units. Metric-ton values are carried
+        alongside by extract_quantities().
         
         Returns:
-            Text with normalized values
+            Text ready for extraction
         """
-        if not text:
-            return text
-        
-        # Find and normalize quantities
-        quantities = self.extract_quantities(text)
-        
-        for q in reversed(quantities):  # Reverse to preserve positions
-            original = f"{q['original_value']:,.2f} {q['original_unit']}"
-            normalized = f"{q['metric_tons']:,.4f} metric_tons"
-            text = text.replace(original, normalized, 1)
-        
         return text
     
     def normalize_quantity(
@@ -133,14 +274,17 @@ class Normalizer:
         Returns:
             Tuple of (converted_value, target_unit)
         """
-        unit_lower = unit.lower().strip().replace(" ", "_")
+        # Common spellings hit directly; only unusual ones get normalized
+        factor = _UNIT_LOOKUP.get(unit)
+        if factor is None:
+            factor = UNIT_CONVERSIONS.get(unit.lower().strip().replace(" ", "_"))
         
-        if unit_lower not in UNIT_CONVERSIONS:
+        if factor is None:
             logger.warning(f"Unknown unit: {unit}")
             return value, unit
         
         # Convert to metric tons first
-        mt_value = value * UNIT_CONVERSIONS[unit_lower]
+        mt_value = value * factor
         
         if target_unit == "metric_ton":
             return round(mt_value, 4), "metric_ton"
@@ -162,14 +306,7 @@ class Normalizer:
         Returns:
             Category name or None
         """
-        material_lower = material.lower()
-        
-        for category, keywords in MATERIAL_CATEGORIES.items():
-            for keyword in keywords:
-                if keyword in material_lower:
-                    return category
-        
-        return None
+        return _categorize_material(material.lower())
     
     def resolve_company(
         self,
@@ -186,20 +323,60 @@ class Normalizer:
         Returns:
             Tuple of (matched_name, confidence_score)
         """
-        if not self.known_companies:
-            return name, 1.0
+        return self.resolve_companies([name], threshold)[0]
+    
+    def resolve_companies(
+        self,
+        names: list[str],
+        threshold: int = 85,
+    ) -> list[tuple[str, float]]:
+        """
+        Match many company names against known companies in one call.
+        
+        Names whose normalized form (accents stripped, lowercased,
+        whitespace collapsed) is a known company resolve by dict lookup;
+        only the misses are scored with rapidfuzz cdist (token-sort
+        ratio over pre-sorted tokens).
         
-        # Use rapidfuzz for matching
-        result = process.extractOne(
-            name,
-            self.known_companies,
-            scorer=fuzz.token_sort_ratio,
+        Args:
+            names: Company names to resolve
+            threshold: Minimum match score (0-100)
+        
+        Returns:
+            List of (matched_name, confidence_score), one per input name
+        """
+        if not self.known_companies:
+            return [(name, 1.0) for name in names]
+        
+        # Misses default to (name, 0.0) until fuzzy matching finds better
+        resolved: list[tuple[str, float]] = []
+        misses = []
+        for i, name in enumerate(names):
+            exact = self._lnrm_index.get(_lnrm_key(name))
+            if exact is not None:
+                resolved.append((exact, 1.0))
+            else:
+                resolved.append((name, 0.0))
+                misses.append(i)
+        
+        if not misses:
+            return resolved
+        
+        scores = process.cdist(
+            [_sort_tokens(names[i]) for i in misses],
+            self._known_sorted,
+            scorer=fuzz.ratio,
+            score_cutoff=threshold,
+            workers=-1,
         )
+        best = scores.argmax(axis=1)
         
-        if result and result[1] >= threshold:
-            return result[0], result[1] / 100.0
+        for i, idx, row in zip(misses, best, scores):
+            score = float(row[idx])
+            if score >= threshold:
+                resolved[i] = (self.known_companies[idx], score / 100.0)
         
-        return name, 0.0
+        return resolved
     
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """
@@ -211,34 +388,7 @@ class Normalizer:
         Returns:
             datetime object or None
         """
-        formats = [
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%Y/%m/%d",
-            "%d-%m-%Y",
-            "%B %d, %Y",
-            "%d %B %Y",
-            "%Y",
-        ]
-        
-        date_str = date_str.strip()
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        
-        # Try to extract year
-        year_match = re.search(r"(19|20)\d{2}", date_str)
-        if year_match:
-            try:
-                return datetime(int(year_match.group()), 1, 1)
-            except ValueError:
-                pass
-        
-        return None
+        return _parse_date_cached(date_str.strip())
     
     def extract_quantities(self, text: str) -> list[dict]:
         """
@@ -250,12 +400,10 @@ class Normalizer:
         Returns:
             List of dicts with value, unit, metric_tons
         """
-        # Pattern: number followed by unit
-        pattern = r"([\d,]+\.?\d*)\s*(metric\s*tons?|tonnes?|tons?|kg|kilograms?|lbs?|pounds?|mt|t)\b"
-        
         quantities = []
         
-        for match in re.finditer(pattern, text, re.IGNORECASE):
+        # Pattern: number followed by unit
+        for match in QUANTITY_PATTERN.finditer(text):
             value_str = match.group(1).replace(",", "")
             unit = match.group(2).lower()
             
@@ -272,6 +420,65 @@ class Normalizer:
                 continue
         
         return quantities
+    
+    def extract_quantities_batch(self, texts: list[str]) -> list[list[dict]]:
+        """
+        Extract quantity-unit pairs from many texts at once.
+        
+        Regex matching is done per text, but number parsing and unit
+        conversion run as a single vectorized NumPy pass over the corpus.
+        For a single text use extract_quantities(), which skips the
+        array setup.
+        
+        Args:
+            texts: Texts to search
+        
+        Returns:
+            One list of quantity dicts per input text
+        """
+        owners = []
+        value_strs = []
+        units = []
+        unit_idx = []
+        
+        for i, text in enumerate(texts):
+            for match in QUANTITY_PATTERN.finditer(text):
+                value_str = match.group(1).replace(",", "")
+                if not value_str.strip("."):
+                    # No digits (e.g. a lone comma) - not a number
+                    continue
+                
+                unit = match.group(2).lower()
+                owners.append(i)
+                value_strs.append(value_str)
+                units.append(unit)
+                unit_idx.append(
+                    _UNIT_INDEX.get(unit.strip().replace(" ", "_"), _UNKNOWN_UNIT)
+                )
+        
+        results: list[list[dict]] = [[] for _ in texts]
+        if not value_strs:
+            return results
+        
+        values = np.array(value_strs).astype(np.float64)
+        factors = _UNIT_FACTORS[np.array(unit_idx, dtype=np.intp)]
+        unknown = np.isnan(factors)
+        # Unknown units pass through unconverted, as in normalize_quantity
+        metric_tons = np.where(unknown, values, np.round(values * factors, 4))
+        
+        for unit in {units[j] for j in np.flatnonzero(unknown)}:
+            logger.warning(f"Unknown unit: {unit}")
+        
+        for owner, value, unit, mt_value in zip(
+            owners, values.tolist(), units, metric_tons.tolist()
+        ):
+            results[owner].append({
+                "original_value": value,
+                "original_unit": unit,
+                "metric_tons": mt_value,
+            })
+        
+        return results
 
 
 # Convenience functions
@@ -4,14 +4,17 @@ Symbio Data Engine - PDF Processor
 Specialized processor for PDF documents.
 
 Operations:
-1. Text extraction (PyPDF2)
+1. Text extraction (pypdfium2 / PyPDF2)
 2. Table extraction (Camelot/Tabula)
 3. OCR fallback (Tesseract)
 4. Image extraction for scanned documents
 """
 
+import io
 import logging
 import os
+import shutil
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
 
@@ -19,99 +22,176 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Text backends in order of preference; pypdfium2 (PDFium, C++) is much
+# faster than pure-Python PyPDF2 for plain text extraction
+TEXT_BACKENDS = ("pypdfium2", "pypdf2")
+
+
+def _open_pdf(source: Path | bytes):
+    """Binary file object for a PDF path or in-memory PDF bytes."""
+    return io.BytesIO(source) if isinstance(source, bytes) else open(source, "rb")
+
+
+def _describe(source: Path | bytes) -> str:
+    """Log label for a PDF path or in-memory PDF bytes."""
+    return f"<{len(source)} bytes>" if isinstance(source, bytes) else str(source)
+
+
+def _ocr_page(page_path: str) -> str:
+    """
+    OCR a single rasterized page, then delete its image file.
+    
+    Module-level so Pool workers can pickle it.
+    """
+    import pytesseract
+    from PIL import Image
+    
+    # Set tesseract path if configured
+    if config.TESSERACT_CMD:
+        pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_CMD
+    
+    with Image.open(page_path) as image:
+        page_text = pytesseract.image_to_string(image)
+    
+    os.unlink(page_path)
+    return page_text
+
 
 class PDFProcessor:
     """
     PDF processing for sustainability reports and documents.
     
     Uses multiple extraction methods:
-    1. PyPDF2 for text extraction
+    1. pypdfium2 or PyPDF2 for text extraction
     2. Camelot for table extraction (lattice-based tables)
     3. Tabula for table extraction (stream-based tables)
     4. Tesseract OCR for scanned documents
     """
     
-    def __init__(self):
-        """Initialize PDF processor with available backends."""
+    def __init__(self, backend: Optional[str] = None, ocr_workers: Optional[int] = None):
+        """
+        Initialize PDF processor with available backends.
+        
+        Args:
+            backend: Preferred text backend (one of TEXT_BACKENDS); others
+                     are still tried as fallbacks. Defaults to the fastest
+                     installed one.
+            ocr_workers: Processes used to OCR pages in parallel. Defaults
+                     to the CPU count; pass 1 when the caller already runs
+                     one processor per core.
+        """
+        if backend is not None and backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown PDF backend: {backend} (expected one of {TEXT_BACKENDS})")
+        
+        self.has_pdfium = self._check_pdfium()
         self.has_pypdf = self._check_pypdf()
         self.has_camelot = self._check_camelot()
         self.has_tabula = self._check_tabula()
         self.has_tesseract = self._check_tesseract()
+        self.ocr_workers = ocr_workers or os.cpu_count() or 1
+        
+        available = {"pypdfium2": self.has_pdfium, "pypdf2": self.has_pypdf}
+        order = [backend] if backend else []
+        order += [b for b in TEXT_BACKENDS if b != backend]
+        self.text_backends = [b for b in order if available[b]]
         
         logger.info(
-            f"PDF backends - PyPDF2: {self.has_pypdf}, "
+            f"PDF backends - pypdfium2: {self.has_pdfium}, "
+            f"PyPDF2: {self.has_pypdf}, "
             f"Camelot: {self.has_camelot}, "
             f"Tabula: {self.has_tabula}, "
             f"Tesseract: {self.has_tesseract}"
         )
     
+    # Probes use find_spec/which so no backend module is imported here;
+    # the real imports happen lazily inside the extraction methods.
+    def _check_pdfium(self) -> bool:
+        return find_spec("pypdfium2") is not None
+    
     def _check_pypdf(self) -> bool:
-        try:
-            import PyPDF2
-            return True
-        except ImportError:
-            return False
+        return find_spec("PyPDF2") is not None
     
     def _check_camelot(self) -> bool:
-        try:
-            import camelot
-            return True
-        except ImportError:
-            return False
+        return find_spec("camelot") is not None
     
     def _check_tabula(self) -> bool:
-        try:
-            import tabula
-            return True
-        except ImportError:
-            return False
+        return find_spec("tabula") is not None
     
     def _check_tesseract(self) -> bool:
-        try:
-            import pytesseract
-            # Check if tesseract is installed
-            pytesseract.get_tesseract_version()
-            return True
-        except Exception:
+        if find_spec("pytesseract") is None:
             return False
+        # Check if tesseract is installed (configured path or on PATH)
+        return bool(
+            (config.TESSERACT_CMD and shutil.which(config.TESSERACT_CMD))
+            or shutil.which("tesseract")
+        )
     
-    def extract_text(self, file_path: str | Path) -> str:
+    def extract_text(self, file_path: str | Path | bytes) -> str:
         """
         Extract text from PDF.
         
         Args:
-            file_path: Path to PDF file
+            file_path: Path to PDF file, or the PDF's contents as bytes
         
         Returns:
             Extracted text content
         """
-        file_path = Path(file_path)
-        
-        if not file_path.exists():
-            raise FileNotFoundError(f"PDF not found: {file_path}")
+        if not isinstance(file_path, bytes):
+            file_path = Path(file_path)
+            
+            if not file_path.exists():
+                raise FileNotFoundError(f"PDF not found: {file_path}")
         
-        # Try PyPDF2 first
-        if self.has_pypdf:
-            text = self._extract_with_pypdf(file_path)
+        # Text layer first, fastest backend first
+        for backend in self.text_backends:
+            if backend == "pypdfium2":
+                text = self._extract_with_pdfium(file_path)
+            else:
+                text = self._extract_with_pypdf(file_path)
             if text and len(text.strip()) > 100:
                 return text
         
         # Fall back to OCR if text extraction failed
         if self.has_tesseract:
-            logger.info(f"Falling back to OCR for {file_path}")
+            logger.info(f"Falling back to OCR for {_describe(file_path)}")
             return self._extract_with_ocr(file_path)
         
-        logger.warning(f"No PDF extraction method available for {file_path}")
+        logger.warning(f"No PDF extraction method available for {_describe(file_path)}")
         return ""
     
-    def _extract_with_pypdf(self, file_path: Path) -> str:
+    def _extract_with_pdfium(self, file_path: Path | bytes) -> str:
+        """Extract text using pypdfium2."""
+        try:
+            import pypdfium2 as pdfium
+            
+            text_parts = []
+            
+            pdf = pdfium.PdfDocument(file_path if isinstance(file_path, bytes) else str(file_path))
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if page_text:
+                        text_parts.append(page_text)
+            finally:
+                pdf.close()
+            
+            return "\n\n".join(text_parts)
+            
+        except Exception as e:
+            logger.warning(f"pypdfium2 extraction failed: {e}")
+            return ""
+    
+    def _extract_with_pypdf(self, file_path: Path | bytes) -> str:
         """Extract text using PyPDF2."""
         try:
             import PyPDF2
             
             text_parts = []
             
-            with open(file_path, "rb") as f:
+            with _open_pdf(file_path) as f:
                 reader = PyPDF2.PdfReader(f)
                 
                 for page in reader.pages:
@@ -125,33 +205,40 @@ class PDFProcessor:
             logger.warning(f"PyPDF2 extraction failed: {e}")
             return ""
     
-    def _extract_with_ocr(self, file_path: Path) -> str:
+    def _extract_with_ocr(self, file_path: Path | bytes) -> str:
         """Extract text using OCR (for scanned documents)."""
         try:
-            import gc
-            import pytesseract
-            from pdf2image import convert_from_path
-            
-            # Set tesseract path if configured
-            if config.TESSERACT_CMD:
-                pytesseract.pytesseract.tesseract_cmd = config.TESSERACT_CMD
+            import tempfile
+            from multiprocessing import Pool
+            from pdf2image import convert_from_bytes, convert_from_path
             
-            # Convert PDF pages to images
-            images = convert_from_path(file_path)
+            workers = self.ocr_workers
+            convert = convert_from_bytes if isinstance(file_path, bytes) else convert_from_path
             
-            text_parts = []
-            
-            for i, image in enumerate(images):
-                page_text = pytesseract.image_to_string(image)
-                text_parts.append(page_text)
-                logger.debug(f"OCR page {i+1}: {len(page_text)} chars")
+            with tempfile.TemporaryDirectory() as tmpdir:
+                # 🛡️ MEMORY: Rasterize pages to disk and keep only the paths,
+                # so at most one page image per worker is ever in RAM
+                page_paths = convert(
+                    file_path,
+                    dpi=200,
+                    output_folder=tmpdir,
+                    fmt="jpeg",
+                    paths_only=True,
+                    thread_count=workers,
+                )
+                
+                if not page_paths:
+                    return ""
                 
-                # 🛡️ MEMORY: Explicitly delete image after processing
-                del image
+                # Tesseract is single-threaded per call - OCR pages in parallel
+                if workers > 1:
+                    with Pool(min(workers, len(page_paths))) as pool:
+                        text_parts = pool.map(_ocr_page, page_paths)
+                else:
+                    text_parts = [_ocr_page(p) for p in page_paths]
             
-            # 🛡️ MEMORY: Clean up all images and force GC
-            del images
-            gc.collect()
+            for i, page_text in enumerate(text_parts):
+                logger.debug(f"OCR page {i+1}: {len(page_text)} chars")
             
             return "\n\n".join(text_parts)
             
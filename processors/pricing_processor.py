@@ -4,15 +4,92 @@ Symbio Data Engine - Pricing Processor
 Store and aggregate pricing data from spiders.
 """
 
+import atexit
+import csv
+import io
 import logging
+import re
+import weakref
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Union
 
-from store.postgres import execute_query, get_pool
+from psycopg2.extras import execute_values
+
+from store.postgres import execute_query, get_connection
 
 logger = logging.getLogger(__name__)
 
 
+# Scalar inserts are buffered and COPY'd in batches of this size
+RAW_PRICE_BATCH_SIZE = 1000
+
+# material_category is a generated column (see pricing_schema.sql)
+_RAW_PRICE_COLUMNS = (
+    "material_name, price_value, price_unit, "
+    "currency, source, source_url, region, price_date"
+)
+_raw_price_buffer: list[dict] = []
+
+
+def insert_raw_prices_bulk(rows: Iterable[dict]) -> int:
+    """
+    Bulk-load raw prices into material_prices_raw with COPY FROM STDIN.
+    
+    Args:
+        rows: Dicts with the same keys as insert_raw_price's arguments
+              (material_name, price_value, price_unit, source, and
+              optionally source_url, currency, region, price_date)
+    
+    Returns:
+        Number of rows written (0 on failure)
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    count = 0
+    for row in rows:
+        writer.writerow((
+            row["material_name"].lower().strip(),
+            row["price_value"],
+            row["price_unit"],
+            row.get("currency", "USD"),
+            row["source"],
+            row.get("source_url"),
+            row.get("region", "us"),
+            row.get("price_date"),
+        ))
+        count += 1
+    
+    if not count:
+        return 0
+    
+    buf.seek(0)
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.copy_expert(
+                    f"COPY material_prices_raw ({_RAW_PRICE_COLUMNS}) "
+                    "FROM STDIN WITH (FORMAT CSV, NULL '')",
+                    buf,
+                )
+        return count
+    except Exception as e:
+        logger.error(f"Failed to bulk insert {count} raw prices: {e}")
+        return 0
+
+
+def flush_raw_prices() -> int:
+    """Write any buffered insert_raw_price rows. Returns rows written."""
+    if not _raw_price_buffer:
+        return 0
+    rows = _raw_price_buffer[:]
+    _raw_price_buffer.clear()
+    return insert_raw_prices_bulk(rows)
+
+
+atexit.register(flush_raw_prices)
+
+
 def insert_raw_price(
     material_name: str,
     price_value: float,
@@ -22,33 +99,94 @@ def insert_raw_price(
     currency: str = "USD",
     region: str = "us",
     price_date: Optional[str] = None,
-) -> Optional[int]:
-    """Insert a raw price into material_prices_raw table."""
-    try:
-        result = execute_query(
-            """
-            INSERT INTO material_prices_raw 
-                (material_name, material_category, price_value, price_unit, 
-                 currency, source, source_url, region, price_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
-            """,
-            (
-                material_name.lower().strip(),
-                _categorize_material(material_name),
-                price_value,
-                price_unit,
-                currency,
-                source,
-                source_url,
-                region,
-                price_date,
-            ),
-        )
-        return result[0]["id"] if result else None
-    except Exception as e:
-        logger.error(f"Failed to insert raw price: {e}")
-        return None
+) -> int:
+    """
+    Queue a raw price for material_prices_raw.
+    
+    Rows are buffered and written with COPY once RAW_PRICE_BATCH_SIZE
+    accumulate; call flush_raw_prices() at the end of a batch (it also
+    runs at interpreter exit).
+    
+    Returns:
+        Number of rows written by this call (0 while still buffering)
+    """
+    _raw_price_buffer.append({
+        "material_name": material_name,
+        "price_value": price_value,
+        "price_unit": price_unit,
+        "source": source,
+        "source_url": source_url,
+        "currency": currency,
+        "region": region,
+        "price_date": price_date,
+    })
+    if len(_raw_price_buffer) >= RAW_PRICE_BATCH_SIZE:
+        return flush_raw_prices()
+    return 0
+
+
+# Hot single-row statements, PREPAREd once per pooled connection so
+# repeat calls skip parse/plan. Each has a "_id" variant with RETURNING.
+_UPSERT_VALUATION_SQL = """
+    INSERT INTO material_valuations 
+        (material_type_id, material_name, material_category,
+         price_per_ton_usd, price_per_lb_usd, source_count, 
+         confidence_score, last_updated)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, NOW())
+    ON CONFLICT (material_type_id) 
+    DO UPDATE SET
+        price_per_ton_usd = EXCLUDED.price_per_ton_usd,
+        price_per_lb_usd = EXCLUDED.price_per_lb_usd,
+        source_count = EXCLUDED.source_count,
+        confidence_score = EXCLUDED.confidence_score,
+        last_updated = NOW()
+"""
+
+_MATERIAL_MAPPING_SQL = """
+    INSERT INTO material_type_mapping 
+        (waste_material, material_type_id, match_confidence)
+    VALUES ($1, $2, $3)
+    ON CONFLICT (waste_material) DO UPDATE SET
+        material_type_id = EXCLUDED.material_type_id,
+        match_confidence = EXCLUDED.match_confidence
+"""
+
+_PREPARED_STATEMENTS = {
+    "ups_valuation": _UPSERT_VALUATION_SQL,
+    "ups_valuation_id": _UPSERT_VALUATION_SQL + " RETURNING id",
+    "ups_material_mapping": _MATERIAL_MAPPING_SQL,
+    "ups_material_mapping_id": _MATERIAL_MAPPING_SQL + " RETURNING id",
+}
+
+# Connection -> names already PREPAREd on it (dropped with the connection)
+_prepared_on: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _execute_prepared(name: str, params: tuple, return_id: bool):
+    """
+    EXECUTE a prepared single-row INSERT/upsert, preparing it on first use.
+    
+    With return_id the RETURNING variant runs and the id is returned;
+    otherwise success is read from cur.rowcount, which skips building
+    and fetching a result set.
+    """
+    if return_id:
+        name += "_id"
+    
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            prepared = _prepared_on.setdefault(conn, set())
+            if name not in prepared:
+                cur.execute(f"PREPARE {name} AS {_PREPARED_STATEMENTS[name]}")
+                prepared.add(name)
+            
+            placeholders = ", ".join(["%s"] * len(params))
+            cur.execute(f"EXECUTE {name} ({placeholders})", params)
+            
+            if return_id:
+                row = cur.fetchone()
+                return row[0] if row else None
+            return cur.rowcount > 0
 
 
 def upsert_valuation(
@@ -59,25 +197,17 @@ def upsert_valuation(
     source_count: int = 1,
     confidence_score: float = 0.5,
     material_category: str = None,
-) -> Optional[int]:
-    """Upsert aggregated valuation into material_valuations table."""
+    return_id: bool = False,
+) -> Union[Optional[int], bool]:
+    """
+    Upsert aggregated valuation into material_valuations table.
+    
+    Returns:
+        Row id if return_id, else whether a row was written
+    """
     try:
-        result = execute_query(
-            """
-            INSERT INTO material_valuations 
-                (material_type_id, material_name, material_category,
-                 price_per_ton_usd, price_per_lb_usd, source_count, 
-                 confidence_score, last_updated)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW())
-            ON CONFLICT (material_type_id) 
-            DO UPDATE SET
-                price_per_ton_usd = EXCLUDED.price_per_ton_usd,
-                price_per_lb_usd = EXCLUDED.price_per_lb_usd,
-                source_count = EXCLUDED.source_count,
-                confidence_score = EXCLUDED.confidence_score,
-                last_updated = NOW()
-            RETURNING id
-            """,
+        return _execute_prepared(
+            "ups_valuation",
             (
                 material_type_id,
                 material_name.lower().strip(),
@@ -87,8 +217,8 @@ def upsert_valuation(
                 source_count,
                 confidence_score,
             ),
+            return_id,
         )
-        return result[0]["id"] if result else None
     except Exception as e:
         logger.error(f"Failed to upsert valuation: {e}")
         return None
@@ -98,67 +228,89 @@ def create_material_mapping(
     waste_material: str,
     material_type_id: str,
     match_confidence: float = 1.0,
-) -> Optional[int]:
-    """Create mapping from waste_listings material to valuation material."""
+    return_id: bool = False,
+) -> Union[Optional[int], bool]:
+    """
+    Create mapping from waste_listings material to valuation material.
+    
+    Returns:
+        Row id if return_id, else whether a row was written
+    """
     try:
-        result = execute_query(
-            """
-            INSERT INTO material_type_mapping 
-                (waste_material, material_type_id, match_confidence)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (waste_material) DO UPDATE SET
-                material_type_id = EXCLUDED.material_type_id,
-                match_confidence = EXCLUDED.match_confidence
-            RETURNING id
-            """,
+        return _execute_prepared(
+            "ups_material_mapping",
             (waste_material.lower().strip(), material_type_id, match_confidence),
+            return_id,
         )
-        return result[0]["id"] if result else None
     except Exception as e:
         logger.error(f"Failed to create mapping: {e}")
         return None
 
 
+def refresh_valuation_rollup() -> bool:
+    """
+    Refresh mv_valuation_rollup after price, mapping or waste_listings changes.
+    
+    CONCURRENTLY keeps the view readable while it rebuilds.
+    
+    Returns:
+        True if the refresh succeeded
+    """
+    try:
+        execute_query("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_valuation_rollup", fetch=False)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to refresh valuation rollup: {e}")
+        return False
+
+
+# Category keywords, matched as substrings in priority order (metals
+# first). Keep in sync with material_prices_raw.material_category in
+# store/pricing_schema.sql. The lookaheads keep that priority in a
+# single regex scan; the empty named group that matches tells us the
+# category.
+_CATEGORY_RE = re.compile(
+    r"^(?:"
+    r"(?=.*?(?:copper|cu|aluminum|aluminium|al|steel|iron|hms|brass|bronze"
+    r"|lead|pb|zinc|zn))(?P<metals>)"
+    r"|(?=.*?(?:plastic|hdpe|ldpe|pet|pvc|pp))(?P<plastics>)"
+    r"|(?=.*?(?:paper|cardboard|occ))(?P<paper>)"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=4096)
 def _categorize_material(name: str) -> str:
     """Categorize material based on name."""
-    name_lower = name.lower()
-    
-    if any(w in name_lower for w in ["copper", "cu"]):
-        return "metals"
-    elif any(w in name_lower for w in ["aluminum", "aluminium", "al"]):
-        return "metals"
-    elif any(w in name_lower for w in ["steel", "iron", "hms"]):
-        return "metals"
-    elif any(w in name_lower for w in ["brass", "bronze"]):
-        return "metals"
-    elif any(w in name_lower for w in ["lead", "pb"]):
-        return "metals"
-    elif any(w in name_lower for w in ["zinc", "zn"]):
-        return "metals"
-    elif any(w in name_lower for w in ["plastic", "hdpe", "ldpe", "pet", "pvc", "pp"]):
-        return "plastics"
-    elif any(w in name_lower for w in ["paper", "cardboard", "occ"]):
-        return "paper"
-    else:
-        return "other"
+    match = _CATEGORY_RE.match(name)
+    return match.lastgroup if match else "other"
+
+
+# ASCII uppercase + drop spaces in one translate() pass
+_UP_NOSPACE = {ord(" "): None, **{c: c - 32 for c in range(ord("a"), ord("z") + 1)}}
+
+# Common abbreviations
+_TYPE_ID_PREFIXES = (
+    ("COPPER", "CU"),
+    ("ALUMINUM", "AL"),
+    ("STEEL", "ST"),
+    ("BRASS", "BR"),
+    ("LEAD", "PB"),
+    ("ZINC", "ZN"),
+)
 
 
+@lru_cache(maxsize=4096)
 def generate_material_type_id(material_name: str) -> str:
     """Generate a material type ID from name."""
     # copper bare bright -> CU-BAREBRGHT
-    name = material_name.upper().replace(" ", "")
-    
-    # Common abbreviations
-    prefixes = {
-        "COPPER": "CU",
-        "ALUMINUM": "AL",
-        "STEEL": "ST",
-        "BRASS": "BR",
-        "LEAD": "PB",
-        "ZINC": "ZN",
-    }
-    
-    for full, abbr in prefixes.items():
+    if material_name.isascii():
+        name = material_name.translate(_UP_NOSPACE)
+    else:
+        name = material_name.upper().replace(" ", "")
+    
+    for full, abbr in _TYPE_ID_PREFIXES:
         if name.startswith(full):
             suffix = name[len(full):][:8]  # Take up to 8 chars after prefix
             return f"{abbr}-{suffix}" if suffix else abbr
@@ -167,26 +319,79 @@ def generate_material_type_id(material_name: str) -> str:
     return name[:12]
 
 
-def store_spider_results(results: dict) -> dict:
-    """Store spider results into database."""
+def store_spider_results(results: dict, refresh_rollup: bool = False) -> dict:
+    """
+    Store spider results into database.
+    
+    All valuations are sent as one multi-row upsert (execute_values)
+    instead of one round-trip per material.
+    
+    Args:
+        results: Spider output with a "prices" mapping
+        refresh_rollup: Also refresh mv_valuation_rollup. Leave off when
+            storing batches and call refresh_valuation_rollup() once at
+            the end of the run.
+    
+    Returns:
+        Counts of stored raw prices and valuations
+    """
     stored = {"raw": 0, "valuations": 0}
     
+    # One row per type ID; a later material with the same ID wins, as it
+    # did with sequential upserts (and a multi-row ON CONFLICT would fail)
+    rows_by_type = {}
     for material_name, data in results.get("prices", {}).items():
-        # Generate type ID
-        type_id = generate_material_type_id(material_name)
-        
-        # Store valuation
-        val_id = upsert_valuation(
-            material_type_id=type_id,
-            material_name=material_name,
-            price_per_ton_usd=data["price_per_ton_usd"],
-            price_per_lb_usd=data["price_per_lb_usd"],
-            source_count=data["source_count"],
-            confidence_score=data["confidence"],
+        # Normalize once; both cached helpers key on the canonical form
+        canonical = material_name.lower().strip()
+        type_id = generate_material_type_id(canonical)
+        rows_by_type[type_id] = (
+            type_id,
+            canonical,
+            _categorize_material(canonical),
+            data["price_per_ton_usd"],
+            data["price_per_lb_usd"],
+            data["source_count"],
+            data["confidence"],
         )
-        
-        if val_id:
-            stored["valuations"] += 1
-            logger.info(f"Stored valuation: {material_name} = ${data['price_per_ton_usd']}/ton")
+    
+    if not rows_by_type:
+        return stored
+    
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                returned = execute_values(
+                    cur,
+                    """
+                    INSERT INTO material_valuations 
+                        (material_type_id, material_name, material_category,
+                         price_per_ton_usd, price_per_lb_usd, source_count, 
+                         confidence_score, last_updated)
+                    VALUES %s
+                    ON CONFLICT (material_type_id) 
+                    DO UPDATE SET
+                        price_per_ton_usd = EXCLUDED.price_per_ton_usd,
+                        price_per_lb_usd = EXCLUDED.price_per_lb_usd,
+                        source_count = EXCLUDED.source_count,
+                        confidence_score = EXCLUDED.confidence_score,
+                        last_updated = NOW()
+                    RETURNING material_type_id
+                    """,
+                    list(rows_by_type.values()),
+                    template="(%s, %s, %s, %s, %s, %s, %s, NOW())",
+                    page_size=1000,
+                    fetch=True,
+                )
+    except Exception as e:
+        logger.error(f"Failed to upsert valuations: {e}")
+        return stored
+    
+    stored["valuations"] = len(returned)
+    for (type_id,) in returned:
+        row = rows_by_type[type_id]
+        logger.info(f"Stored valuation: {row[1]} = ${row[3]}/ton")
+    
+    if refresh_rollup:
+        refresh_valuation_rollup()
     
     return stored
@@ -1,25 +1,40 @@
 
-import psycopg2
 import pandas as pd
-from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
+from store.postgres import execute_query
+
+def hll_available():
+    """True if the hll extension is installed in this database (see add_hll_extension.py)."""
+    return bool(execute_query("SELECT 1 FROM pg_extension WHERE extname = 'hll'"))
 
 def calculate_ai_potential():
-    conn = psycopg2.connect(dbname=POSTGRES_DB, user=POSTGRES_USER, password=POSTGRES_PASSWORD, host=POSTGRES_HOST, port=POSTGRES_PORT)
-    cur = conn.cursor()
-    
     print("CALCULATING AI TRAINING POTENTIAL...\n")
     
+    # All scalar counts in one scan / one round-trip
+    counts = execute_query("""
+        SELECT
+            COUNT(*) FILTER (WHERE material_category = 'Waste from chemical processing') AS chem,
+            COUNT(*) FILTER (WHERE material_category = 'Waste from waste management facilities') AS receivers, -- Proxy for receivers
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE source_location LIKE '%,%') AS locs -- Simple check for City, Country
+        FROM waste_listings
+    """)[0]
+    
     # 1. Intelligent Filling (Imputation Potential)
     # How many "Paint Factories" do we have? (Using standard industries as proxies)
-    cur.execute("""
-        SELECT source_industry, COUNT(*) as facility_count, COUNT(DISTINCT material) as unique_waste_types
+    # Distinct materials per industry: HyperLogLog (~2% error) when the hll
+    # extension is installed, exact COUNT(DISTINCT) otherwise
+    if hll_available():
+        unique_wastes = "hll_cardinality(hll_add_agg(hll_hash_text(material)))::bigint"
+    else:
+        unique_wastes = "COUNT(DISTINCT material)"
+    industries = execute_query(f"""
+        SELECT source_industry, COUNT(*) as facility_count, {unique_wastes} as unique_waste_types
         FROM waste_listings
         WHERE source_industry IS NOT NULL
         GROUP BY source_industry
         ORDER BY facility_count DESC
         LIMIT 10
-    """)
-    industries = cur.fetchall()
+    """, as_dict=False)
     
     print("1. INTELLIGENT FILLING (Profile Prediction)")
     print("   We can teach the AI: 'If Industry X, then likely Waste Y'")
@@ -30,15 +45,12 @@ def calculate_ai_potential():
     # 2. Symbiosis Matches (Training Pairs)
     # Estimate exact matches (Material X -> Receiver Y)
     # Simple logic: Organic -> Composting, Metal -> Recycling
-    cur.execute("SELECT COUNT(*) FROM waste_listings WHERE material_category = 'Waste from chemical processing'")
-    chem = cur.fetchone()[0]
-    cur.execute("SELECT COUNT(*) FROM waste_listings WHERE material_category = 'Waste from waste management facilities'") # Proxy for receivers
-    receivers = cur.fetchone()[0]
+    chem = counts['chem']
+    receivers = counts['receivers']
     
     # In a full mesh, potential connections are Generator * Receiver (huge), but we limit to realistic radius
     # For training data, we create 1 positive match and 5 negative matches per listing
-    cur.execute("SELECT COUNT(*) FROM waste_listings")
-    total_listings = cur.fetchone()[0]
+    total_listings = counts['total']
     
     training_pairs = total_listings * 6 # 1 positive + 5 negative examples
     
@@ -50,8 +62,7 @@ def calculate_ai_potential():
 
     # 3. Logistics (Route Optimization)
     # Records with specific location
-    cur.execute("SELECT COUNT(*) FROM waste_listings WHERE source_location LIKE '%,%'") # Simple check for City, Country
-    locs = cur.fetchone()[0]
+    locs = counts['locs']
     
     print("\n3. LOGISTICS & PLANNING")
     print(f"   - Geocoded Points: {locs:,}")
@@ -1,36 +1,28 @@
 """Quick duplicate and quality check - minimal output."""
-import psycopg2
-from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
+from store.postgres import execute_query
 
-conn = psycopg2.connect(dbname=POSTGRES_DB, user=POSTGRES_USER, password=POSTGRES_PASSWORD, host=POSTGRES_HOST, port=POSTGRES_PORT)
-cur = conn.cursor()
-
-# Total
-cur.execute("SELECT COUNT(*) FROM waste_listings")
-total = cur.fetchone()[0]
-
-# Duplicates
-cur.execute("""
-    SELECT COUNT(*) FROM (
-        SELECT material, source_company, year, quantity_tons
+# Totals, nulls, bad values and duplicate patterns in one round-trip
+r = execute_query("""
+    WITH dupes AS (
+        SELECT 1
         FROM waste_listings
         WHERE material IS NOT NULL
         GROUP BY material, source_company, year, quantity_tons
         HAVING COUNT(*) > 1
-    ) d
-""")
-dupe_patterns = cur.fetchone()[0]
-
-# Nulls
-cur.execute("SELECT COUNT(*) FROM waste_listings WHERE material IS NULL OR material = ''")
-null_mat = cur.fetchone()[0]
-
-cur.execute("SELECT COUNT(*) FROM waste_listings WHERE quantity_tons IS NULL OR quantity_tons <= 0")
-bad_qty = cur.fetchone()[0]
-
-# BS check
-cur.execute("SELECT COUNT(*) FROM waste_listings WHERE year > 2025 OR year < 1970")
-bad_years = cur.fetchone()[0]
+    )
+    SELECT
+        COUNT(*) AS total,
+        COUNT(*) FILTER (WHERE material IS NULL OR material = '') AS null_mat,
+        COUNT(*) FILTER (WHERE quantity_tons IS NULL OR quantity_tons <= 0) AS bad_qty,
+        COUNT(*) FILTER (WHERE year > 2025 OR year < 1970) AS bad_years,  -- BS check
+        (SELECT COUNT(*) FROM dupes) AS dupe_patterns
+    FROM waste_listings
+""")[0]
+total = r['total']
+dupe_patterns = r['dupe_patterns']
+null_mat = r['null_mat']
+bad_qty = r['bad_qty']
+bad_years = r['bad_years']
 
 # Write results
 with open("quality_report.txt", "w") as f:
@@ -1,14 +1,12 @@
-"""Quick valuation summary."""
+"""Quick valuation summary (reads the pre-aggregated mv_valuation_rollup)."""
 from store.postgres import execute_query
 
 result = execute_query("""
     SELECT 
-        COUNT(*) as records,
-        SUM(wl.quantity_tons) as tons,
-        SUM(wl.quantity_tons * mv.price_per_ton_usd) as value
-    FROM waste_listings wl
-    JOIN material_type_mapping mtm ON wl.material = mtm.waste_material
-    JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
+        COALESCE(SUM(records), 0) as records,
+        COALESCE(SUM(tons), 0) as tons,
+        COALESCE(SUM(value), 0) as value
+    FROM mv_valuation_rollup
 """)[0]
 
 print("="*60)
@@ -22,16 +20,10 @@ print()
 # By category
 print("VALUE BY CATEGORY:")
 by_cat = execute_query("""
-    SELECT 
-        mv.material_name,
-        COUNT(*) as records,
-        SUM(wl.quantity_tons) as tons,
-        SUM(wl.quantity_tons * mv.price_per_ton_usd) as value
-    FROM waste_listings wl
-    JOIN material_type_mapping mtm ON wl.material = mtm.waste_material
-    JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
-    GROUP BY mv.material_name, mv.material_type_id
+    SELECT material_name, records, tons, value
+    FROM mv_valuation_rollup
     ORDER BY value DESC
+    LIMIT 10
 """)
-for row in by_cat[:10]:
+for row in by_cat:
     print(f"  {row['material_name']:<25} ${row['value']:>18,.0f}  ({row['tons']:,.0f} tons)")
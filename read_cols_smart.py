@@ -1,11 +1,12 @@
-import ast
+import re
+
+# Quoted tokens of a printed list: ['a', "b's", ...]
+QUOTED_TOKEN = re.compile(r"'([^']*)'|\"([^\"]*)\"")
 
 print('PARSING COLUMNS')
 with open('cols_debug.txt', 'r') as f:
-    lines = f.readlines()
-    
     current_file = None
-    for line in lines:
+    for line in f:
         line = line.strip()
         if not line: continue
         
@@ -16,10 +17,8 @@ with open('cols_debug.txt', 'r') as f:
             print('\n--- WASTE COLUMNS ---')
             current_file = 'WASTE'
         elif line.startswith('[') and current_file:
-            try:
-                cols = ast.literal_eval(line)
+            cols = [single or double for single, double in QUOTED_TOKEN.findall(line)]
+            if cols:
                 for c in cols:
                     print(c)
                 current_file = None # Only print header row
-            except:
-                pass
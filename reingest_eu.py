@@ -2,34 +2,25 @@
 Re-ingest ALL 16 EU files from the User-friendly-CSV folder.
 Clears old HTML-based eprtr docs and ingests real CSVs.
 """
-import psycopg2
 import hashlib
 import json
 from pathlib import Path
-from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
+from psycopg2.extras import execute_values
+from processors.pricing_processor import refresh_valuation_rollup
+from store.postgres import get_connection
 
 EU_CSV_DIR = Path("data/raw/eprtr/eea_t_ied-eprtr_p_2007-2023_v15_r00/User-friendly-CSV")
 
 def reingest():
-    conn = psycopg2.connect(dbname=POSTGRES_DB, user=POSTGRES_USER, password=POSTGRES_PASSWORD, host=POSTGRES_HOST, port=POSTGRES_PORT)
-    conn.autocommit = True
-    cur = conn.cursor()
-    
-    print("1. Clearing old (HTML-based) eprtr documents...")
-    # First delete waste_listings that reference eprtr documents (FK constraint)
-    cur.execute("DELETE FROM waste_listings WHERE document_id IN (SELECT id FROM documents WHERE source = 'eprtr')")
-    cur.execute("DELETE FROM documents WHERE source = 'eprtr'")
-    print("   Done - cleared old EU docs and their waste_listings")
-    
-    print("\n2. Ingesting real EU CSV files...")
-    count = 0
+    print("1. Collecting real EU CSV files...")
+    rows = []
     for csv_file in sorted(EU_CSV_DIR.glob("*.csv")):
         size_bytes = csv_file.stat().st_size
         size_mb = size_bytes / (1024 * 1024)
         
-        # Hash based on filename + size
-        hash_input = f"{csv_file.name}:{size_bytes}"
-        file_hash = hashlib.sha256(hash_input.encode()).hexdigest()
+        # Content hash (real dedup); file_digest streams through OpenSSL without holding the GIL
+        with open(csv_file, "rb") as fp:
+            file_hash = hashlib.file_digest(fp, "sha256").hexdigest()
         
         abs_path = csv_file.resolve()
         abs_url = f"file://{abs_path}"
@@ -41,15 +32,38 @@ def reingest():
             "size_mb": round(size_mb, 2)
         })
         
-        cur.execute("""
-            INSERT INTO documents (source, source_url, file_path, document_type, content_hash, status, metadata)
-            VALUES (%s, %s, %s, %s, %s, 'pending', %s)
-        """, ("eprtr", abs_url, str(abs_path), "csv", file_hash, meta_json))
-        
+        rows.append(("eprtr", abs_url, str(abs_path), "csv", file_hash, "pending", meta_json))
         print(f"   [+] {csv_file.name} ({size_mb:.1f} MB)")
-        count += 1
     
-    print(f"\n3. Ingested {count} EU CSV files. Ready for processing.")
+    # Clear + insert in one transaction: a failed ingest leaves the old docs in place
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            print("\n2. Clearing old (HTML-based) eprtr documents...")
+            # First delete waste_listings that reference eprtr documents (FK constraint)
+            # Join key index (in schemas.sql; created here for older databases)
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_waste_document ON waste_listings(document_id)")
+            cur.execute("""
+                DELETE FROM waste_listings w
+                USING documents d
+                WHERE w.document_id = d.id AND d.source = 'eprtr'
+            """)
+            cur.execute("DELETE FROM documents WHERE source = 'eprtr'")
+            print("   Done - cleared old EU docs and their waste_listings")
+            
+            inserted = 0
+            if rows:
+                # rowcount only covers the last page; count the returned rows
+                inserted = len(execute_values(cur, """
+                    INSERT INTO documents (source, source_url, file_path, document_type, content_hash, status, metadata)
+                    VALUES %s
+                    ON CONFLICT (content_hash) DO NOTHING
+                    RETURNING 1
+                """, rows, fetch=True))
+    
+    # The cleared waste_listings are still counted in the valuation rollup
+    refresh_valuation_rollup()
+    
+    print(f"\n3. Ingested {inserted} EU CSV files ({len(rows) - inserted} duplicate contents skipped). Ready for processing.")
     print("   Run: python main.py process --source eprtr")
 
 if __name__ == "__main__":
@@ -3,11 +3,32 @@ GEOSPATIAL ENRICHMENT PIPELINE (SMART SCHEMA)
 =============================================
 Enriches waste data with location (Lat/Lon/Country) by dynamically mapping E-PRTR schema.
 """
+import os
 import zipfile
+import numpy as np
 import pandas as pd
 import io
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Optional: Arrow's streaming, multithreaded CSV reader and hash join.
+# Without it we fall back to pandas (whole-file concat + merge in RAM).
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: JIT-compiled, parallel validity mask over the merged rows
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+OUTPUT_PATH = 'exports/geospatial_waste.csv'
+
 def get_best_col(cols, keywords):
     """Find best column match based on keywords."""
     cols_lower = [c.lower() for c in cols]
@@ -17,6 +38,68 @@ def get_best_col(cols, keywords):
                 return cols[i]
     return None
 
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, cache=True)
+    def _valid_mask(lat, lon, qty, out_mask):
+        for i in numba.prange(lat.shape[0]):
+            out_mask[i] = (-90.0 <= lat[i] <= 90.0) and (-180.0 <= lon[i] <= 180.0) and qty[i] > 0
+else:
+    def _valid_mask(lat, lon, qty, out_mask):
+        out_mask[:] = (lat >= -90) & (lat <= 90) & (lon >= -180) & (lon <= 180) & (qty > 0)
+
+def valid_location_mask(lat, lon, qty):
+    """
+    Rows with in-range Lat/Long and a positive quantity.
+    
+    Inputs are coerced to float64 first (unparseable -> NaN -> invalid),
+    so the kernel only ever sees numeric arrays.
+    """
+    lat, lon, qty = (pd.to_numeric(pd.Series(a), errors='coerce').to_numpy(dtype=np.float64) for a in (lat, lon, qty))
+    mask = np.empty(lat.shape[0], dtype=np.bool_)
+    _valid_mask(lat, lon, qty, mask)
+    return mask
+
+def read_csv_arrow(f, columns, rename_map):
+    """Read selected CSV columns into an Arrow table (threaded, columnar)."""
+    table = pa_csv.read_csv(
+        f,
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=lambda row: 'skip'),
+        # Join key read as text so both sides agree on its type
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c, new in rename_map.items() if new == 'FacilityID'},
+        ),
+    )
+    return table.rename_columns([rename_map.get(c, c) for c in table.column_names])
+
+def read_csv_parallel(f, usecols, workers=None):
+    """
+    Parse a CSV with pandas on several threads.
+    
+    The body is cut into byte ranges on line boundaries and each range is
+    parsed on its own worker (the C tokenizer releases the GIL). Assumes
+    no quoted newlines, which holds for the E-PRTR CSV exports.
+    """
+    workers = workers or os.cpu_count() or 1
+    data = f.read()
+    header_end = data.find(b'\n') + 1
+    header, body = data[:header_end], data[header_end:]
+    
+    # Split points: roughly equal ranges, advanced to the next newline
+    step = max(len(body) // workers, 1)
+    bounds = [0]
+    while bounds[-1] < len(body):
+        cut = body.find(b'\n', bounds[-1] + step)
+        bounds.append(len(body) if cut == -1 else cut + 1)
+    
+    def parse(span):
+        start, end = span
+        return pd.read_csv(io.BytesIO(header + body[start:end]), usecols=usecols, encoding='utf-8', on_bad_lines='skip')
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(parse, zip(bounds, bounds[1:])))
+    return pd.concat(parts, ignore_index=True) if parts else pd.read_csv(io.BytesIO(header), usecols=usecols)
+
 def run_enrichment():
     print('='*70)
     print('GEOSPATIAL ENRICHMENT PIPELINE (SMART)')
@@ -61,9 +144,6 @@ def run_enrichment():
 
             # Load Facilities
             use_cols = [c for c in [cid_col, name_col, lat_col, lon_col, coord_col, country_col, city_col] if c]
-            with z.open(fac_path) as f:
-                df_fac = pd.read_csv(f, usecols=use_cols, encoding='utf-8', on_bad_lines='skip')
-                
             # Rename for consistency
             rename_map = {cid_col: 'FacilityID'}
             if country_col: rename_map[country_col] = 'CountryCode'
@@ -71,7 +151,12 @@ def run_enrichment():
             if lat_col: rename_map[lat_col] = 'Lat'
             if lon_col: rename_map[lon_col] = 'Long'
             
-            df_fac.rename(columns=rename_map, inplace=True)
+            with z.open(fac_path) as f:
+                if PYARROW_AVAILABLE:
+                    fac = read_csv_arrow(f, use_cols, rename_map)
+                else:
+                    fac = pd.read_csv(f, usecols=use_cols, encoding='utf-8', on_bad_lines='skip')
+                    fac.rename(columns=rename_map, inplace=True)
             
             # 2. Analyze Waste Schema
             with z.open(waste_path) as f:
@@ -92,24 +177,50 @@ def run_enrichment():
                 return
 
             # Load Waste Transfers
-            print('\nLoading chunks...')
             use_waste = [c for c in [wid_col, qty_col, unit_col, class_col, treat_col] if c]
-            chunks = []
-            with z.open(waste_path) as f:
-                for chunk in pd.read_csv(f, chunksize=100000, usecols=use_waste, encoding='utf-8', on_bad_lines='skip'):
-                    chunks.append(chunk)
-            
-            df_waste = pd.concat(chunks)
-            df_waste.rename(columns={wid_col: 'FacilityID', qty_col: 'QuantityTotal'}, inplace=True)
-            
-            # 3. Merge
-            print('Merging...')
-            df_enriched = pd.merge(df_waste, df_fac, on='FacilityID', how='inner')
-            print(f'Merged Records: {len(df_enriched):,}')
+            waste_rename = {wid_col: 'FacilityID', qty_col: 'QuantityTotal'}
             
-            # 4. Save
-            df_enriched.to_csv('exports/geospatial_waste.csv', index=False)
-            print('Saved to exports/geospatial_waste.csv')
+            if PYARROW_AVAILABLE:
+                # Arrow: columnar read + hash join, no intermediate DataFrames
+                print('\nLoading waste transfers (Arrow)...')
+                with z.open(waste_path) as f:
+                    waste = read_csv_arrow(f, use_waste, waste_rename)
+                
+                # 3. Merge
+                print('Merging...')
+                enriched = waste.join(fac, keys='FacilityID', join_type='inner', right_suffix='_fac')
+                print(f'Merged Records: {enriched.num_rows:,}')
+                
+                if lat_col and lon_col:
+                    mask = valid_location_mask(
+                        enriched.column('Lat').to_numpy(zero_copy_only=False),
+                        enriched.column('Long').to_numpy(zero_copy_only=False),
+                        enriched.column('QuantityTotal').to_numpy(zero_copy_only=False),
+                    )
+                    enriched = enriched.filter(pa.array(mask))
+                    print(f'Valid Locations: {enriched.num_rows:,}')
+                
+                # 4. Save
+                pa_csv.write_csv(enriched, OUTPUT_PATH, pa_csv.WriteOptions(quoting_style='needed'))
+            else:
+                print('\nLoading waste transfers (parallel)...')
+                with z.open(waste_path) as f:
+                    df_waste = read_csv_parallel(f, use_waste)
+                df_waste.rename(columns=waste_rename, inplace=True)
+                
+                # 3. Merge
+                print('Merging...')
+                df_enriched = pd.merge(df_waste, fac, on='FacilityID', how='inner')
+                print(f'Merged Records: {len(df_enriched):,}')
+                
+                if lat_col and lon_col:
+                    mask = valid_location_mask(df_enriched['Lat'], df_enriched['Long'], df_enriched['QuantityTotal'])
+                    df_enriched = df_enriched[mask]
+                    print(f'Valid Locations: {len(df_enriched):,}')
+                
+                # 4. Save
+                df_enriched.to_csv(OUTPUT_PATH, index=False)
+            print(f'Saved to {OUTPUT_PATH}')
 
     except Exception as e:
         print(f'ERROR: {e}')
@@ -1,13 +1,23 @@
 """
 Run full CSR pipeline: spider → PDF processor → extractor → database.
 """
+import hashlib
 import logging
+import os
+import pickle
+import queue
+import re
+import sqlite3
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain
 from pathlib import Path
 
 from spiders.csr_spider import CSRSpider
 from processors.csr_extractor import CSRExtractor
 from processors.pdf_processor import PDFProcessor
-from store.postgres import execute_query, get_connection, insert_waste_listing, insert_carbon_emission
+from processors.pricing_processor import refresh_valuation_rollup
+from store.postgres import insert_carbon_emissions, insert_waste_listings, session
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +26,74 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Extraction results keyed by PDF content hash plus the company and file
+# name the results were built from (company comes from the folder, year from
+# the file name, and both end up in the rows); bump EXTRACTOR_VERSION when
+# the CSRExtractor patterns change so stale results are re-extracted
+EXTRACT_CACHE_PATH = Path("data/cache/csr_extract.sqlite")
+EXTRACTOR_VERSION = "1"
+
+
+def _open_extract_cache(path: Path = EXTRACT_CACHE_PATH) -> sqlite3.Connection:
+    """Open (creating if needed) the SQLite extraction cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS csr_extract_results (
+            sha1 TEXT NOT NULL,
+            company TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            extractor_version TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            PRIMARY KEY (sha1, company, filename)
+        )
+    """)
+    return conn
+
+
+def _prefetch_pdfs(pdf_paths: list, q: queue.Queue) -> None:
+    """
+    Read PDFs into memory ahead of the consumer; None marks the end.
+    
+    Items are (path, bytes), or (path, exception) when a file cannot be
+    read. The sentinel is always sent so the consumer never blocks forever.
+    """
+    try:
+        for pdf_path in pdf_paths:
+            try:
+                q.put((pdf_path, pdf_path.read_bytes()))
+            except OSError as e:
+                q.put((pdf_path, e))
+    finally:
+        q.put(None)
+
+
+# Per-process extractor (PDF libraries are not fork-safe to share)
+_worker_extractor = None
+
+
+# Known companies, matched anywhere in the (lowercased) path in one scan
+COMPANIES = ["borouge", "adnoc", "sabic"]
+COMPANY_PATTERN = re.compile("|".join(COMPANIES))
+
+
+def _company_for(pdf_path: Path) -> str:
+    """Determine company from path or filename."""
+    # The full path includes the filename, so one search covers both
+    match = COMPANY_PATTERN.search(str(pdf_path).lower())
+    return match.group(0) if match else "unknown"
+
+
+def _extract_worker(args: tuple) -> dict:
+    """Extract one PDF in a worker process. Takes (pdf_bytes, filename, company)."""
+    global _worker_extractor
+    if _worker_extractor is None:
+        # The pool already runs one worker per core; OCR stays in-process
+        _worker_extractor = CSRExtractor(ocr_workers=1)
+    pdf_bytes, filename, company = args
+    return _worker_extractor.extract_from_bytes(pdf_bytes, filename, company)
+
+
 def run_csr_pipeline(limit: int = 5, store_results: bool = False):
     """
     Full CSR data extraction pipeline.
@@ -48,43 +126,95 @@ def run_csr_pipeline(limit: int = 5, store_results: bool = False):
         print("No PDFs to process. Exiting.")
         return
     
-    # Initialize extractor
-    extractor = CSRExtractor()
+    # Process PDFs in parallel - text extraction is CPU-bound
+    # Per-PDF result lists, flattened once after the loop
+    waste_parts, emission_parts, financial_parts = [], [], []
+    
+    # A reader thread loads each PDF once (for both hashing and parsing) while
+    # workers parse earlier ones. Unchanged PDFs come from the cache.
+    cache = _open_extract_cache()
+    extracted = {}
+    cache_keys = {}
+    in_flight = {}
+    cached = 0
+    workers = min(os.cpu_count() or 1, len(pdfs_to_process))
+    
+    def collect(done):
+        for fut in done:
+            pdf_path = in_flight.pop(fut)
+            results = fut.result()
+            extracted[pdf_path] = results
+            # Empty results (unreadable PDF, no text) carry no text_length
+            # and are retried next run rather than cached
+            if "text_length" not in results:
+                continue
+            # Only the parent writes, so SQLite sees a single writer
+            with cache:
+                cache.execute(
+                    "INSERT OR REPLACE INTO csr_extract_results "
+                    "(sha1, company, filename, extractor_version, payload) VALUES (?, ?, ?, ?, ?)",
+                    (*cache_keys[pdf_path], EXTRACTOR_VERSION, pickle.dumps(results)),
+                )
     
-    # Process each PDF
-    all_waste = []
-    all_emissions = []
-    all_financials = []
+    prefetched = queue.Queue(maxsize=2)
+    threading.Thread(target=_prefetch_pdfs, args=(pdfs_to_process, prefetched), daemon=True).start()
+    
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        while (item := prefetched.get()) is not None:
+            pdf_path, pdf_bytes = item
+            if isinstance(pdf_bytes, Exception):
+                logger.error(f"Skipping unreadable PDF {pdf_path.name}: {pdf_bytes}")
+                continue
+            company = _company_for(pdf_path)
+            cache_keys[pdf_path] = (hashlib.sha1(pdf_bytes).hexdigest(), company, pdf_path.name)
+            row = cache.execute(
+                "SELECT payload FROM csr_extract_results "
+                "WHERE sha1 = ? AND company = ? AND filename = ? AND extractor_version = ?",
+                (*cache_keys[pdf_path], EXTRACTOR_VERSION),
+            ).fetchone()
+            if row:
+                extracted[pdf_path] = pickle.loads(row[0])
+                cached += 1
+                continue
+            
+            fut = ex.submit(_extract_worker, (pdf_bytes, pdf_path.name, company))
+            in_flight[fut] = pdf_path
+            # Bound the PDFs held in memory to a couple per worker
+            if len(in_flight) >= 2 * workers:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+        
+        collect(list(in_flight))
+    cache.close()
+    
+    print(f"\nCached extractions: {cached}, extracted: {len(cache_keys) - cached}")
     
     for pdf_path in pdfs_to_process:
+        results = extracted.get(pdf_path)
+        if results is None:
+            continue  # unreadable, logged above
         print(f"\n{'─'*40}")
-        print(f"Processing: {pdf_path.name}")
+        print(f"Processed: {pdf_path.name}")
         print(f"{'─'*40}")
         
-        # Determine company from path or filename
-        company = "unknown"
-        for comp in ["borouge", "adnoc", "sabic"]:
-            if comp in pdf_path.name.lower() or comp in str(pdf_path).lower():
-                company = comp
-                break
-        
-        # Extract data
-        results = extractor.extract_from_pdf(pdf_path, company)
-        
         print(f"  Year: {results.get('year')}")
         print(f"  Waste records: {len(results['waste_data'])}")
         print(f"  Emission records: {len(results['emissions'])}")
         print(f"  Financial records: {len(results['financials'])}")
         
-        all_waste.extend(results['waste_data'])
-        all_emissions.extend(results['emissions'])
-        all_financials.extend(results['financials'])
+        waste_parts.append(results['waste_data'])
+        emission_parts.append(results['emissions'])
+        financial_parts.append(results['financials'])
+    
+    all_waste = list(chain.from_iterable(waste_parts))
+    all_emissions = list(chain.from_iterable(emission_parts))
+    all_financials = list(chain.from_iterable(financial_parts))
     
     # Summary
     print("\n" + "="*60)
     print("EXTRACTION SUMMARY")
     print("="*60)
-    print(f"PDFs processed: {len(pdfs_to_process)}")
+    print(f"PDFs processed: {len(extracted)}")
     print(f"Waste records: {len(all_waste)}")
     print(f"Emission records: {len(all_emissions)}")
     print(f"Financial records: {len(all_financials)}")
@@ -111,44 +241,48 @@ def run_csr_pipeline(limit: int = 5, store_results: bool = False):
         print("STORING RESULTS")
         print("="*60)
         
+        waste_rows = [
+            {
+                "material": w.material,
+                "quantity_tons": w.quantity_tons,
+                "source_company": w.source_company,
+                "year": w.year,
+                "source": "csr_report",
+                "metadata": {"context": w.context, "waste_type": w.waste_type},
+            }
+            for w in all_waste
+        ]
+        emission_rows = [
+            {
+                "company": e.source_company,
+                "year": e.year,
+                "scope": e.scope or "unknown",
+                "emissions_tons": e.value if e.unit in ["tonnes", "tons", "tCO2e"] else None,
+                "source": "csr_report",
+                "metadata": {"type": e.emission_type, "context": e.context},
+            }
+            for e in all_emissions
+        ]
+        
+        # One connection, one commit; rows that fail are skipped individually
         waste_stored = 0
         emission_stored = 0
-        
-        # Store waste listings
-        for w in all_waste:
-            try:
-                insert_waste_listing({
-                    "material": w.material,
-                    "quantity_tons": w.quantity_tons,
-                    "source_company": w.source_company,
-                    "year": w.year,
-                    "source": "csr_report",
-                    "metadata": {"context": w.context, "waste_type": w.waste_type},
-                })
-                waste_stored += 1
-            except Exception as e:
-                logger.debug(f"Failed to store waste: {e}")
-        
-        # Store emissions
-        for e in all_emissions:
-            try:
-                insert_carbon_emission({
-                    "company": e.source_company,
-                    "year": e.year,
-                    "scope": e.scope or "unknown",
-                    "emissions_tons": e.value if e.unit in ["tonnes", "tons", "tCO2e"] else None,
-                    "source": "csr_report",
-                    "metadata": {"type": e.emission_type, "context": e.context},
-                })
-                emission_stored += 1
-            except Exception as e:
-                logger.debug(f"Failed to store emission: {e}")
+        try:
+            with session() as cur:
+                waste_stored = insert_waste_listings(waste_rows, cursor=cur)
+                emission_stored = insert_carbon_emissions(emission_rows, cursor=cur)
+        except Exception as e:
+            logger.error(f"Failed to store CSR results: {e}")
+            waste_stored = emission_stored = 0
         
         print(f"Waste records stored: {waste_stored}")
         print(f"Emission records stored: {emission_stored}")
+        
+        if waste_stored:
+            refresh_valuation_rollup()
     
     return {
-        "pdfs_processed": len(pdfs_to_process),
+        "pdfs_processed": len(extracted),
         "waste": all_waste,
         "emissions": all_emissions,
         "financials": all_financials,
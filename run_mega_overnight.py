@@ -17,7 +17,8 @@ import sys
 import time
 import json
 from datetime import datetime
-from pathlib import Path
+
+from overnight_utils import count_pdfs, export_sizes
 
 
 def log(msg):
@@ -25,23 +26,16 @@ def log(msg):
     print(f"[{ts}] {msg}")
 
 
-def count_pdfs():
-    pdf_dir = Path("data/raw/csr_reports")
-    return len(list(pdf_dir.glob("*.pdf"))) if pdf_dir.exists() else 0
-
-
 def run_spider(name, script):
     log(f"STARTING: {name}")
     start = time.time()
     pdfs_before = count_pdfs()
     
     try:
-        result = subprocess.run(
-            [sys.executable, script],
-            capture_output=False,
-            text=True
-        )
-        success = result.returncode == 0
+        # Child inherits our stdout/stderr fds: no pipe, no decoding
+        sys.stdout.flush()
+        proc = subprocess.Popen([sys.executable, script], stdout=None, stderr=None)
+        success = proc.wait() == 0
     except Exception as e:
         log(f"ERROR: {e}")
         success = False
@@ -58,6 +52,57 @@ def run_spider(name, script):
     }
 
 
+def run_spiders_parallel(spiders):
+    """
+    Run independent spiders concurrently and wait for all of them.
+    
+    Args:
+        spiders: List of (name, script) tuples
+    
+    Returns:
+        One result dict per spider (same shape as run_spider). pdfs_added
+        is attributed by completion order - PDFs that appeared since the
+        previous spider finished - since the spiders share one folder.
+    """
+    running = []
+    for name, script in spiders:
+        log(f"STARTING: {name}")
+        try:
+            sys.stdout.flush()
+            proc = subprocess.Popen([sys.executable, script], stdout=None, stderr=None)
+        except Exception as e:
+            log(f"ERROR: {e}")
+            proc = None
+        running.append({"name": name, "proc": proc, "start": time.time()})
+    
+    results = {}
+    pdfs_checkpoint = count_pdfs()
+    pending = [r for r in running if r["proc"] is not None]
+    for r in running:
+        if r["proc"] is None:
+            results[r["name"]] = {"name": r["name"], "success": False, "duration_min": 0.0, "pdfs_added": 0}
+    
+    while pending:
+        for r in list(pending):
+            if r["proc"].poll() is None:
+                continue
+            pending.remove(r)
+            pdfs_now = count_pdfs()
+            elapsed = (time.time() - r["start"]) / 60
+            log(f"COMPLETED: {r['name']} in {elapsed:.1f} min (+{pdfs_now - pdfs_checkpoint} PDFs)")
+            results[r["name"]] = {
+                "name": r["name"],
+                "success": r["proc"].returncode == 0,
+                "duration_min": round(elapsed, 1),
+                "pdfs_added": pdfs_now - pdfs_checkpoint
+            }
+            pdfs_checkpoint = pdfs_now
+        if pending:
+            time.sleep(5)
+    
+    return [results[name] for name, _ in spiders]
+
+
 def main():
     start_time = datetime.now()
     pdfs_start = count_pdfs()
@@ -71,24 +116,20 @@ def main():
     
     results = []
     
-    # Spider 1: Global CSR Spider (company pages)
-    print("\n" + "="*70)
-    print("PHASE 1: GLOBAL CSR SPIDER (488 companies)")
-    print("="*70)
-    results.append(run_spider("Global CSR Spider", "global_csr_spider.py"))
-    
-    # Spider 2: Multi-Source Spider (databases)
-    print("\n" + "="*70)
-    print("PHASE 2: MULTI-SOURCE SPIDER (Report Databases)")
-    print("="*70)
-    results.append(run_spider("Multi-Source Spider", "multi_source_spider.py"))
-    
-    # Spider 3: Wayback Spider (historical)
+    # Phases 1-3 are independent (network-bound) - run them concurrently
     print("\n" + "="*70)
-    print("PHASE 3: WAYBACK SPIDER (Historical Archives)")
+    print("PHASES 1-3: SPIDERS (running in parallel)")
+    print("  1. GLOBAL CSR SPIDER (488 companies)")
+    print("  2. MULTI-SOURCE SPIDER (Report Databases)")
+    print("  3. WAYBACK SPIDER (Historical Archives)")
     print("="*70)
-    results.append(run_spider("Wayback Spider", "wayback_csr_spider.py"))
+    results.extend(run_spiders_parallel([
+        ("Global CSR Spider", "global_csr_spider.py"),
+        ("Multi-Source Spider", "multi_source_spider.py"),
+        ("Wayback Spider", "wayback_csr_spider.py"),
+    ]))
     
+    # Phases 4-5 depend on the spiders' output - run sequentially
     # Phase 4: Run extraction on all PDFs
     print("\n" + "="*70)
     print("PHASE 4: CSR DATA EXTRACTION")
@@ -128,10 +169,8 @@ def main():
         "exports/csr_carbon_credits.csv",
         "exports/industry_pricing.json"
     ]
-    for exp in exports:
-        p = Path(exp)
-        if p.exists():
-            size = p.stat().st_size
+    for exp, size in export_sizes(exports).items():
+        if size is not None:
             print(f"  ✅ {exp} ({size:,} bytes)")
         else:
             print(f"  ❌ {exp} (missing)")
@@ -1,8 +1,12 @@
 """
 Run multi-source pricing spider and store all results.
 """
+import csv
+import io
 import logging
+from psycopg2.extras import execute_values
 from store.postgres import get_connection, execute_query
+from processors.pricing_processor import refresh_valuation_rollup
 from spiders.multi_source_spider import run_multi_source_spider
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
@@ -40,16 +44,21 @@ with get_connection() as conn:
             )
         """)
         
-        # Clear old prices
-        cur.execute("DELETE FROM material_prices_raw")
+        # Clear old prices (truncate-and-reload)
+        cur.execute("TRUNCATE material_prices_raw")
         
-        # Insert new prices
-        for p in results['prices']:
-            cur.execute("""
-                INSERT INTO material_prices_raw 
-                    (material_name, price_value, price_unit, currency, source, source_url, confidence)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (p.material, p.price_value, p.price_unit, p.currency, p.source, p.source_url, p.confidence))
+        # Load new prices in one COPY
+        buf = io.StringIO()
+        csv.writer(buf).writerows(
+            (p.material, p.price_value, p.price_unit, p.currency, p.source, p.source_url, p.confidence)
+            for p in results['prices']
+        )
+        buf.seek(0)
+        cur.copy_expert("""
+            COPY material_prices_raw 
+                (material_name, price_value, price_unit, currency, source, source_url, confidence)
+            FROM STDIN WITH (FORMAT CSV, NULL '')
+        """, buf)
         
         conn.commit()
 
@@ -62,27 +71,31 @@ print("="*70)
 
 with get_connection() as conn:
     with conn.cursor() as cur:
+        # One row per type ID (truncated names can collide; last one wins)
+        rows = {}
         for material, data in results['aggregated'].items():
             type_id = material.upper().replace(" ", "-")[:20]
-            
-            cur.execute("DELETE FROM material_valuations WHERE material_type_id = %s", (type_id,))
-            cur.execute("""
-                INSERT INTO material_valuations 
-                    (material_type_id, material_name, material_category, 
-                     price_per_ton_usd, source_count, confidence_score)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (
+            rows[type_id] = (
                 type_id, 
                 material, 
                 'multi_source',
                 data['price_per_ton_usd'],
                 data['source_count'],
                 data['confidence']
-            ))
+            )
+        
+        cur.execute("DELETE FROM material_valuations WHERE material_type_id = ANY(%s)", (list(rows),))
+        execute_values(cur, """
+            INSERT INTO material_valuations 
+                (material_type_id, material_name, material_category, 
+                 price_per_ton_usd, source_count, confidence_score)
+            VALUES %s
+        """, list(rows.values()), page_size=1000)
         
         conn.commit()
 
 print(f"[OK] {len(results['aggregated'])} aggregated valuations stored")
+refresh_valuation_rollup()
 
 # Summary
 print("\n" + "="*70)
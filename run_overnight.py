@@ -11,7 +11,8 @@ import subprocess
 import sys
 import time
 from datetime import datetime
-from pathlib import Path
+
+from overnight_utils import count_pdfs, export_sizes
 
 def log(msg):
     """Print with timestamp."""
@@ -24,19 +25,18 @@ def run_command(cmd, description):
     start = time.time()
     
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=False,  # Show output in real-time
-            text=True
-        )
+        # Child inherits our stdout/stderr fds, so output shows in real
+        # time with no pipe or text decoding in between
+        sys.stdout.flush()
+        proc = subprocess.Popen(cmd, shell=True, stdout=None, stderr=None)
+        returncode = proc.wait()
         elapsed = time.time() - start
         
-        if result.returncode == 0:
+        if returncode == 0:
             log(f"COMPLETED: {description} ({elapsed/60:.1f} min)")
             return True
         else:
-            log(f"FAILED: {description} (exit code {result.returncode})")
+            log(f"FAILED: {description} (exit code {returncode})")
             return False
     except Exception as e:
         log(f"ERROR: {description} - {e}")
@@ -53,8 +53,7 @@ def main():
     results = {}
     
     # Count current PDFs
-    pdf_dir = Path("data/raw/csr_reports")
-    pdfs_before = len(list(pdf_dir.glob("*.pdf"))) if pdf_dir.exists() else 0
+    pdfs_before = count_pdfs()
     log(f"Current PDFs: {pdfs_before}")
     
     # Step 1: Run the CSR Spider
@@ -67,7 +66,7 @@ def main():
     )
     
     # Count new PDFs
-    pdfs_after = len(list(pdf_dir.glob("*.pdf"))) if pdf_dir.exists() else 0
+    pdfs_after = count_pdfs()
     new_pdfs = pdfs_after - pdfs_before
     log(f"New PDFs downloaded: {new_pdfs}")
     log(f"Total PDFs: {pdfs_after}")
@@ -115,10 +114,8 @@ def main():
     ]
     
     print("\nExport files:")
-    for exp in exports:
-        p = Path(exp)
-        if p.exists():
-            size = p.stat().st_size
+    for exp, size in export_sizes(exports).items():
+        if size is not None:
             print(f"  ✅ {exp} ({size:,} bytes)")
         else:
             print(f"  ❌ {exp} (missing)")
@@ -5,33 +5,36 @@ print("="*60)
 print("SAMPLE WASTE VALUATION")
 print("="*60)
 
-# Get some waste listings that have pricing
+# Get some waste listings that have pricing (top-10 total summed server-side)
 result = execute_query("""
-    SELECT 
-        wl.material,
-        wl.quantity_tons,
-        wl.source_company,
-        mv.price_per_ton_usd,
-        ROUND((wl.quantity_tons * mv.price_per_ton_usd)::numeric, 2) as value_usd
-    FROM waste_listings wl
-    JOIN material_type_mapping mtm ON wl.material = mtm.waste_material
-    JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
-    WHERE wl.quantity_tons > 0
+    WITH top10 AS (
+        SELECT 
+            wl.material,
+            wl.quantity_tons,
+            wl.source_company,
+            mv.price_per_ton_usd,
+            ROUND((wl.quantity_tons * mv.price_per_ton_usd)::numeric, 2) as value_usd
+        FROM waste_listings wl
+        JOIN material_type_mapping mtm ON wl.material = mtm.waste_material
+        JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
+        WHERE wl.quantity_tons > 0
+        ORDER BY value_usd DESC
+        LIMIT 10
+    )
+    SELECT *, SUM(value_usd) OVER () as top10_total
+    FROM top10
     ORDER BY value_usd DESC
-    LIMIT 10
 """)
 
 if result:
     print(f"\nTop 10 highest-value waste streams (with pricing):\n")
-    total_value = 0
     for r in result:
         print(f"  {r['material'][:35]:<35}")
         print(f"    {r['quantity_tons']:>15,.0f} tons x ${r['price_per_ton_usd']:>8,.0f}/ton = ${r['value_usd']:>15,.2f}")
         print(f"    Company: {r['source_company'][:40]}")
         print()
-        total_value += float(r['value_usd'])
     print(f"{'='*60}")
-    print(f"Top 10 total value: ${total_value:,.2f}")
+    print(f"Top 10 total value: ${result[0]['top10_total']:,.2f}")
 else:
     print("No matched records found")
 
@@ -1,12 +1,23 @@
 """Scan all EU CSV files and extract headers for column mapping."""
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 EU_DIR = Path("data/raw/eprtr/eea_t_ied-eprtr_p_2007-2023_v15_r00/User-friendly-CSV")
 
-for csv_file in EU_DIR.glob("*.csv"):
-    print(f"\n=== {csv_file.name} ===")
-    with open(csv_file, 'r', encoding='utf-8-sig') as f:
-        headers = next(csv.reader(f))
+
+def read_header(csv_file):
+    """Read only the first line (as bytes) and parse it as a CSV row."""
+    with open(csv_file, 'rb') as f:
+        first = f.readline().decode('utf-8-sig').rstrip('\r\n')
+    return next(csv.reader([first]), [])
+
+
+csv_files = list(EU_DIR.glob("*.csv"))
+
+# I/O-bound: read all headers concurrently, print in glob order
+with ThreadPoolExecutor() as pool:
+    for csv_file, headers in zip(csv_files, pool.map(read_header, csv_files)):
+        print(f"\n=== {csv_file.name} ===")
         for h in headers:
             print(f"  {h}")
@@ -8,20 +8,20 @@ headers = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"
 }
 
+# Look for resource URLs
+# CKAN usually links to /dataset/...
+_HREF_RE = re.compile(r'href=["\'](https?://[^"\']+)["\']')
+
 print(f"Scouring {url} for links...")
 try:
     with httpx.Client(timeout=30.0, follow_redirects=True) as client:
         resp = client.get(url, headers=headers)
         
-        # Look for resource URLs
-        # CKAN usually links to /dataset/...
-        links = re.findall(r'href=["\'](https?://[^"\']+)["\']', resp.text)
-        
         found = []
-        for l in set(links):
+        for l in set(_HREF_RE.findall(resp.text)):
             if "download" in l.lower() or "csv" in l.lower() or "xlsx" in l.lower():
                 found.append(l)
-                
+        
         with open("mena_links.txt", "w", encoding="utf-8") as f:
             f.write("# MANUAL DOWNLOAD LINKS (MENA)\n")
             f.write("# Click these, verify content, and save to 'data/raw/mena/'\n\n")
@@ -4,6 +4,15 @@ import re
 # The URL from the user's screenshot context (The "Holy Grail" link I provided)
 TARGET_URL = "https://www.eea.europa.eu/en/datahub/datahubitem-view/9405f714-8015-4b5b-a63c-280b82861b3d"
 
+# Look for the specific "Direct download" pattern or the file link
+# In the screenshot, it says "Direct download". 
+# The link usually points to a .zip or .xlsx or .csv
+# One alternation, one pass over the HTML: group 1 = file link, group 2 = SDI link
+_LINK_RE = re.compile(
+    r'href=["\'](?:([^"\']+\.(?:zip|xlsx|csv|mdb|accdb))|(https?://sdi\.eea\.europa\.eu/[^"\']+))["\']',
+    re.IGNORECASE,
+)
+
 print(f"🕵️ SCRAPING TARGET: {TARGET_URL}")
 
 try:
@@ -11,21 +20,18 @@ try:
         resp = client.get(TARGET_URL)
         print(f"Status: {resp.status_code}")
         
-        # Look for the specific "Direct download" pattern or the file link
-        # In the screenshot, it says "Direct download". 
-        # The link usually points to a .zip or .xlsx or .csv
-        
-        # Regex to find hrefs near "Direct download" or just all file links
-        file_links = re.findall(r'href=["\']([^"\']+\.(?:zip|xlsx|csv|mdb|accdb))["\']', resp.text)
+        file_links, sdi_links = set(), set()
+        for m in _LINK_RE.finditer(resp.text):
+            if m.group(1):
+                file_links.add(m.group(1))
+            else:
+                sdi_links.add(m.group(2))
         
         with open("direct_links.txt", "w", encoding="utf-8") as f:
             f.write("Found Direct Links:\n")
-            unique_links = list(set(file_links))
-            for l in unique_links:
+            for l in file_links:
                 f.write(f"{l}\n")
-            
-            sdi_links = re.findall(r'href=["\'](https?://sdi\.eea\.europa\.eu/[^"\']+)["\']', resp.text)
-            for l in set(sdi_links):
+            for l in sdi_links:
                 f.write(f"{l}\n")
         
         print("Done. Saved to direct_links.txt")
@@ -1,5 +1,14 @@
+import html
+import re
+
 import requests
-from bs4 import BeautifulSoup
+
+# <a ... href=...> values (double-, single- or unquoted, one group each);
+# a regex scan instead of building a full DOM
+_A_HREF_RE = re.compile(
+    r'''<a\s(?:[^>]*?\s)?href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))''',
+    re.IGNORECASE,
+)
 
 url = "https://www.epa.gov/toxics-release-inventory-tri-program/tri-basic-data-files-calendar-years-1987-present"
 print(f"Fetching {url}...")
@@ -9,14 +18,12 @@ try:
     r = requests.get(url, headers=headers, timeout=15)
     print(f"Status: {r.status_code}")
     
-    soup = BeautifulSoup(r.text, 'html.parser')
-    
-    # Find all links
-    links = soup.find_all('a', href=True)
+    # Find all links (unescaped, as an HTML parser would return them)
+    links = [html.unescape("".join(h)) for h in _A_HREF_RE.findall(r.text)]
     print(f"Found {len(links)} links.")
     
     # Filter for CSV
-    csv_links = [l['href'] for l in links if "csv" in l['href'].lower() and "basic" in l['href'].lower()]
+    csv_links = [l for l in links if "csv" in l.lower() and "basic" in l.lower()]
     
     print("\nPotential CSV Links found:")
     for l in csv_links[:10]:
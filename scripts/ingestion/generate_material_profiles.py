@@ -6,74 +6,130 @@ Creates rich profiles for each material in the database for Portfolio LLM traini
 Output: exports/material_profiles.jsonl
 """
 import json
+import math
 import psycopg2
 from pathlib import Path
 from decimal import Decimal
 from collections import defaultdict
 from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Write buffer for the JSONL exports
+JSONL_BUFFER_SIZE = 256 * 1024
+
 def decimal_default(obj):
     if isinstance(obj, Decimal):
         return float(obj)
     raise TypeError(f'Object of type {type(obj)} is not JSON serializable')
 
+def _finite_or_none(obj):
+    """Copy of obj with NaN/Infinity (float or Decimal) replaced by None, as orjson writes them."""
+    if isinstance(obj, dict):
+        return {k: _finite_or_none(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite_or_none(v) for v in obj]
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    if isinstance(obj, Decimal) and not obj.is_finite():
+        return None
+    return obj
+
+def _json_dumps(r) -> str:
+    """json fallback producing the same text as orjson.dumps (compact, NaN -> null)."""
+    try:
+        return json.dumps(r, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=decimal_default)
+    except ValueError:
+        return json.dumps(_finite_or_none(r), ensure_ascii=False, separators=(",", ":"), default=decimal_default)
+
+def write_jsonl(path: Path, records) -> int:
+    """
+    Write records as JSON lines (UTF-8, non-ASCII kept) through a large buffer.
+    
+    Args:
+        path: Output file
+        records: Any iterable of dicts; generators are streamed, not materialized
+    
+    Returns:
+        Number of records written
+    """
+    count = 0
+    with open(path, "wb", buffering=JSONL_BUFFER_SIZE) as f:
+        if ORJSON_AVAILABLE:
+            for r in records:
+                f.write(orjson.dumps(r, default=decimal_default, option=orjson.OPT_APPEND_NEWLINE))
+                count += 1
+        else:
+            for r in records:
+                f.write((_json_dumps(r) + "\n").encode("utf-8"))
+                count += 1
+    return count
+
 def generate_profiles():
     conn = psycopg2.connect(dbname=POSTGRES_DB, user=POSTGRES_USER, password=POSTGRES_PASSWORD, host=POSTGRES_HOST, port=POSTGRES_PORT)
-    cur = conn.cursor()
     
     print("Generating Material Profiles...")
     
-    # Get all unique materials with aggregated stats
-    cur.execute("""
-        SELECT 
-            material,
-            COUNT(*) as record_count,
-            AVG(quantity_tons) as avg_quantity,
-            SUM(quantity_tons) as total_quantity,
-            array_agg(DISTINCT source_company) FILTER (WHERE source_company IS NOT NULL) as companies,
-            array_agg(DISTINCT source_location) FILTER (WHERE source_location IS NOT NULL) as locations,
-            array_agg(DISTINCT treatment_method) FILTER (WHERE treatment_method IS NOT NULL) as treatments,
-            MIN(year) as earliest_year,
-            MAX(year) as latest_year
-        FROM waste_listings
-        WHERE material IS NOT NULL AND material != ''
-        GROUP BY material
-        HAVING COUNT(*) >= 2
-        ORDER BY total_quantity DESC NULLS LAST
-        LIMIT 2000
-    """)
-    
+    # Get all unique materials with aggregated stats (categorized server-side).
+    # Arrays are trimmed in SQL to what the profile keeps, and rows stream
+    # through a server-side cursor instead of one fetchall().
+    category_sql, category_params = category_case_sql("material")
     profiles = []
-    for row in cur.fetchall():
-        material = row[0]
-        companies = row[4] if row[4] else []
-        locations = row[5] if row[5] else []
-        treatments = row[6] if row[6] else []
+    with conn.cursor(name="mat_profiles") as cur:
+        cur.itersize = 500
+        cur.execute(f"""
+            SELECT 
+                material,
+                COUNT(*) as record_count,
+                AVG(quantity_tons) as avg_quantity,
+                SUM(quantity_tons) as total_quantity,
+                (array_agg(DISTINCT LEFT(source_company, 50)) FILTER (WHERE source_company IS NOT NULL))[1:10] as companies,
+                (array_agg(DISTINCT source_location) FILTER (WHERE source_location IS NOT NULL))[1:5] as locations,
+                array_agg(DISTINCT treatment_method) FILTER (WHERE treatment_method IS NOT NULL) as treatments,
+                MIN(year) as earliest_year,
+                MAX(year) as latest_year,
+                {category_sql} as category
+            FROM waste_listings
+            WHERE material IS NOT NULL AND material != ''
+            GROUP BY material
+            HAVING COUNT(*) >= 2
+            ORDER BY total_quantity DESC NULLS LAST
+            LIMIT 2000
+        """, category_params)
         
-        # Categorize the material
-        category = categorize_material(material)
-        
-        # Build profile
-        profile = {
-            "material": material,
-            "category": category,
-            "record_count": row[1],
-            "avg_quantity_tons": round(row[2], 2) if row[2] else 0,
-            "total_quantity_tons": round(row[3], 2) if row[3] else 0,
-            "industry_sources": list(set([c[:50] for c in companies[:10]])) if companies else [],
-            "geographic_hotspots": list(set(locations[:5])) if locations else [],
-            "treatment_methods": list(set(treatments)) if treatments else [],
-            "year_range": f"{row[7]}-{row[8]}" if row[7] and row[8] else "Unknown",
-            "compatible_receivers": get_compatible_receivers(category),
-            "carbon_offset_potential": estimate_carbon_offset(category)
-        }
-        profiles.append(profile)
+        for row in cur:
+            material = row[0]
+            companies = row[4] or []
+            locations = row[5] or []
+            treatments = row[6] or []
+            
+            category = row[9]
+            
+            # Build profile
+            profile = {
+                "material": material,
+                "category": category,
+                "record_count": row[1],
+                "avg_quantity_tons": float(round(row[2], 2)) if row[2] else 0,
+                "total_quantity_tons": float(round(row[3], 2)) if row[3] else 0,
+                # Already distinct (and truncated) in SQL
+                "industry_sources": companies,
+                "geographic_hotspots": locations,
+                "treatment_methods": treatments,
+                "year_range": f"{row[7]}-{row[8]}" if row[7] and row[8] else "Unknown",
+                "compatible_receivers": get_compatible_receivers(category),
+                "carbon_offset_potential": estimate_carbon_offset(category)
+            }
+            profiles.append(profile)
+    conn.close()
     
     # Save to JSONL
     output_path = Path("exports/material_profiles.jsonl")
-    with open(output_path, "w", encoding="utf-8") as f:
-        for p in profiles:
-            f.write(json.dumps(p, ensure_ascii=False, default=decimal_default) + "\n")
+    write_jsonl(output_path, profiles)
     
     print(f"Generated {len(profiles)} material profiles")
     print(f"Saved to: {output_path.absolute()}")
@@ -81,27 +137,33 @@ def generate_profiles():
     # Also generate Portfolio Q&A training data
     generate_portfolio_qa(profiles)
 
-def categorize_material(material: str) -> str:
-    """Categorize material into industry sectors."""
-    m = material.lower()
-    if any(x in m for x in ["plastic", "polyethylene", "polypropylene", "pvc", "styrene", "polymer"]):
-        return "plastics"
-    elif any(x in m for x in ["lead", "zinc", "copper", "aluminum", "iron", "steel", "metal", "chromium"]):
-        return "metals"
-    elif any(x in m for x in ["organic", "food", "sludge", "manure", "bio"]):
-        return "organics"
-    elif any(x in m for x in ["chlor", "fluor", "brom", "acid", "solvent", "cyanide"]):
-        return "chemicals"
-    elif any(x in m for x in ["oil", "petroleum", "fuel", "benzene", "toluene"]):
-        return "hydrocarbons"
-    elif any(x in m for x in ["paper", "cardboard", "wood", "cellulose"]):
-        return "fibers"
-    elif any(x in m for x in ["glass", "silica", "sand"]):
-        return "glass"
-    elif any(x in m for x in ["hazard", "radioactive", "toxic"]):
-        return "hazardous"
-    else:
-        return "mixed"
+# Category keywords, matched as substrings in priority order (plastics
+# first); the first category with a matching keyword wins, else "mixed"
+_CATEGORY_KEYWORDS = (
+    ("plastics", ["plastic", "polyethylene", "polypropylene", "pvc", "styrene", "polymer"]),
+    ("metals", ["lead", "zinc", "copper", "aluminum", "iron", "steel", "metal", "chromium"]),
+    ("organics", ["organic", "food", "sludge", "manure", "bio"]),
+    ("chemicals", ["chlor", "fluor", "brom", "acid", "solvent", "cyanide"]),
+    ("hydrocarbons", ["oil", "petroleum", "fuel", "benzene", "toluene"]),
+    ("fibers", ["paper", "cardboard", "wood", "cellulose"]),
+    ("glass", ["glass", "silica", "sand"]),
+    ("hazardous", ["hazard", "radioactive", "toxic"]),
+)
+
+def category_case_sql(column: str) -> tuple:
+    """
+    SQL CASE expression that categorizes materials into industry sectors
+    from the keyword table, so PostgreSQL can categorize inside the GROUP BY.
+    
+    Returns:
+        (sql fragment, params) - pass params with the query
+    """
+    whens = []
+    params = []
+    for category, keywords in _CATEGORY_KEYWORDS:
+        whens.append(f"WHEN lower({column}) LIKE ANY(%s) THEN %s")
+        params.extend([[f"%{k}%" for k in keywords], category])
+    return "CASE " + " ".join(whens) + " ELSE 'mixed' END", params
 
 def get_compatible_receivers(category: str) -> list:
     """Get compatible receiver industries for symbiosis matching."""
@@ -135,8 +197,15 @@ def estimate_carbon_offset(category: str) -> str:
 
 def generate_portfolio_qa(profiles: list):
     """Generate Q&A training data for Portfolio LLM."""
-    qa_pairs = []
+    # Pairs are streamed straight to the file as they are built
+    output_path = Path("exports/portfolio_qa_training.jsonl")
+    count = write_jsonl(output_path, portfolio_qa_pairs(profiles))
     
+    print(f"Generated {count} Portfolio Q&A training pairs")
+    print(f"Saved to: {output_path.absolute()}")
+
+def portfolio_qa_pairs(profiles: list):
+    """Yield {"prompt", "completion"} pairs built from the material profiles."""
     # Group profiles by category for portfolio generation
     by_category = defaultdict(list)
     for p in profiles:
@@ -173,24 +242,18 @@ def generate_portfolio_qa(profiles: list):
                     })
                     total_potential += avg_qty
                 
-                answer = f"Based on industrial symbiosis data for {industry} in {location}, here are your top opportunities:\n\n"
-                for i, opp in enumerate(opportunities, 1):
-                    answer += f"{i}. **{opp['material']}**: Partner with {', '.join(opp['receivers'])} ({opp['estimated_volume']}, {opp['carbon_benefit']})\n"
-                answer += f"\nTotal symbiotic potential: ~{total_potential:.0f} tons/year with significant CO2 reduction."
+                parts = [f"Based on industrial symbiosis data for {industry} in {location}, here are your top opportunities:\n"]
+                parts.extend(
+                    f"{i}. **{opp['material']}**: Partner with {', '.join(opp['receivers'])} ({opp['estimated_volume']}, {opp['carbon_benefit']})"
+                    for i, opp in enumerate(opportunities, 1)
+                )
+                parts.append(f"\nTotal symbiotic potential: ~{total_potential:.0f} tons/year with significant CO2 reduction.")
+                answer = "\n".join(parts)
                 
-                qa_pairs.append({
+                yield {
                     "prompt": question,
                     "completion": answer
-                })
-    
-    # Save Q&A pairs
-    output_path = Path("exports/portfolio_qa_training.jsonl")
-    with open(output_path, "w", encoding="utf-8") as f:
-        for qa in qa_pairs:
-            f.write(json.dumps(qa, ensure_ascii=False, default=decimal_default) + "\n")
-    
-    print(f"Generated {len(qa_pairs)} Portfolio Q&A training pairs")
-    print(f"Saved to: {output_path.absolute()}")
+                }
 
 def get_industry_categories(industry: str) -> list:
     """Map industry to relevant waste categories."""
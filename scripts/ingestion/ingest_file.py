@@ -11,9 +11,9 @@ def ingest_file(file_path: str):
 
     print(f"📥 Ingesting manual file: {path.name}")
     
-    # Calculate hash
+    # Calculate hash (streamed - memory stays flat for large files)
     with open(path, "rb") as f:
-        content_hash = hashlib.sha256(f.read()).hexdigest()
+        content_hash = hashlib.file_digest(f, "sha256").hexdigest()
     
     # Check extension
     ext = path.suffix.lower().lstrip(".")
@@ -1,6 +1,8 @@
 import os
 import hashlib
+import json
 import psycopg2
+from psycopg2.extras import execute_values
 from pathlib import Path
 from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT, RAW_DIR
 
@@ -64,35 +66,43 @@ def ingest_manual_eu():
     count = 0
     skipped = 0
 
+    # 1-2. File info + ref-only hash (filename + size; content is NOT read).
+    # Kept as SHA-256 so hashes match documents ingested earlier.
+    file_info = {}
     for file_path in files:
         try:
-            # 1. Getting File Info (Do NOT read full content for large files)
             file_stats = file_path.stat()
-            size_mb = file_stats.st_size / (1024*1024)
-            
-            # 2. Hash: For huge files, maybe just hash filename + size to be fast? 
-            # Or read in chunks? Reading 500MB is fast on SSD.
-            # Let's read first 4KB for hash + filename (good enough for now)
-            hasher = hashlib.sha256()
-            hasher.update(file_path.name.encode())
-            hasher.update(str(file_stats.st_size).encode())
-            file_hash = hasher.hexdigest()
-            
-            # 3. Check if exists
-            cur.execute("SELECT id FROM documents WHERE content_hash = %s", (file_hash,))
-            if cur.fetchone():
+            file_hash = hashlib.sha256(file_path.name.encode() + str(file_stats.st_size).encode()).hexdigest()
+            file_info[file_path] = (file_stats.st_size / (1024*1024), file_hash)
+        except Exception as e:
+            log(f"   [ERROR] Error processing {file_path.name}: {e}")
+    
+    # 3. Check which already exist - one query instead of one per file
+    try:
+        cur.execute(
+            "SELECT content_hash FROM documents WHERE content_hash = ANY(%s)",
+            ([h for _, h in file_info.values()],),
+        )
+        existing = {r[0] for r in cur.fetchall()}
+    except Exception as e:
+        log(f"[ERROR] Failed to check existing documents: {e}")
+        existing = set()
+
+    new_docs = []
+    for file_path, (size_mb, file_hash) in file_info.items():
+        try:
+            if file_hash in existing:
                 log(f"   [WARN] Skipped (Already Ingested): {file_path.name}")
                 skipped += 1
                 continue
 
-            # 4. Insert into 'documents'
+            # 4. Build the 'documents' row
             # Content is EMPTY/NULL because 'documents' doesn't have content column in this schema version
             abs_path = file_path.resolve()
             # source_url is the key, not url
             abs_url = f"file://{abs_path}"
             
             # Metadata still useful
-            import json
             meta_json = json.dumps({
                 "manual_ingest": True, 
                 "filename": file_path.name,
@@ -100,24 +110,32 @@ def ingest_manual_eu():
             })
             
             # Using source_url and file_path columns
-            cur.execute("""
-                INSERT INTO documents (source, source_url, file_path, document_type, content_hash, status, metadata)
-                VALUES (%s, %s, %s, %s, %s, 'pending', %s)
-            """, (
+            new_docs.append((file_path, size_mb, (
                 "eprtr", 
                 abs_url, 
                 str(abs_path),
                 "csv",  # CRITICAL: Must be 'csv' for GovProcessor to handle it
                 file_hash,
                 meta_json
-            ))
-            
-            log(f"   [OK] Ingested (Ref Only): {file_path.name} ({size_mb:.2f} MB)")
-            count += 1
+            )))
+            existing.add(file_hash)
 
         except Exception as e:
             log(f"   [ERROR] Error processing {file_path.name}: {e}")
 
+    # 5. Insert all new documents in one multi-row statement
+    if new_docs:
+        try:
+            execute_values(cur, """
+                INSERT INTO documents (source, source_url, file_path, document_type, content_hash, status, metadata)
+                VALUES %s
+            """, [row for _, _, row in new_docs], template="(%s, %s, %s, %s, %s, 'pending', %s)", page_size=1000)
+            for file_path, size_mb, _ in new_docs:
+                log(f"   [OK] Ingested (Ref Only): {file_path.name} ({size_mb:.2f} MB)")
+            count = len(new_docs)
+        except Exception as e:
+            log(f"   [ERROR] Failed to insert {len(new_docs)} documents: {e}")
+
     log(f"\n[DONE] Manual Ingestion Complete.")
     log(f"   - Added:   {count}")
     log(f"   - Skipped: {skipped}")
@@ -1,15 +1,74 @@
 
+import csv
+import io
 import os
+import re
+import sys
+import unicodedata
+import numpy as np
 import pandas as pd
 import psycopg2
 import uuid
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from processors.pricing_processor import refresh_valuation_rollup
 from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
 
+# Rust-based calamine reader when installed (pandas >= 2.2); else pandas' default
+try:
+    import python_calamine
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Paths
 RAW_DIR = Path("data/raw/mena")
-RAW_DIR.mkdir(parents=True, exist_ok=True)
+
+# Files ingested concurrently (each worker opens its own connection)
+WORKERS = 4
+
+# Everything but digits and dots ("1,200 tons" -> "1200")
+_QTY_RE = re.compile(r'[^\d.]+')
+
+# Unicode decimal digits (Arabic-Indic '١٢٣', Persian, ...) -> ASCII, so
+# pd.to_numeric reads them the way float() does
+_ASCII_DIGITS = {
+    i: str(unicodedata.decimal(chr(i)))
+    for i in range(128, sys.maxunicode + 1)
+    if chr(i).isdecimal()
+}
+
+def parse_quantities(col):
+    """Quantity cells -> floats: units/commas removed, any-script digits; unparseable -> 0."""
+    qty_clean = col.map(str).str.replace(_QTY_RE, '', regex=True).str.translate(_ASCII_DIGITS)
+    return pd.to_numeric(qty_clean, errors='coerce').fillna(0.0)
+
+def parse_years(col):
+    """
+    Year cells -> ints, numerically instead of str()/isdigit(). Datetimes
+    give their year; digits in any script are read; non-integral, out of
+    INTEGER range or missing -> 2024.
+    """
+    if pd.api.types.is_datetime64_any_dtype(col):
+        year_num = col.dt.year
+    else:
+        if col.dtype == object:
+            col = col.map(str).str.translate(_ASCII_DIGITS)
+        year_num = pd.to_numeric(col, errors='coerce')
+    year_ok = (year_num >= 0) & (year_num < 2**31) & (year_num % 1 == 0)
+    return year_num.where(year_ok, 2024).astype(int)
 
 # Database Connection
 def get_db_connection():
@@ -21,16 +80,86 @@ def get_db_connection():
         port=POSTGRES_PORT
     )
 
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _valid_mask(mat_lens, qtys, out_mask):
+        for i in range(mat_lens.shape[0]):
+            out_mask[i] = mat_lens[i] > 2 and qtys[i] > 0
+else:
+    def _valid_mask(mat_lens, qtys, out_mask):
+        out_mask[:] = (mat_lens > 2) & (qtys > 0)
+
+def valid_row_mask(mat_lens, qtys):
+    """Rows with a material longer than 2 chars and a positive quantity."""
+    mat_lens = np.asarray(mat_lens, dtype=np.int64)
+    qtys = np.asarray(qtys, dtype=np.float64)
+    mask = np.empty(mat_lens.shape[0], dtype=np.bool_)
+    _valid_mask(mat_lens, qtys, mask)
+    return mask
+
+# Keyword Dictionary for Auto-Detection
+MAP_CONFIG = {
+    "material": ["waste", "type", "material", "item", "substance", "class"],
+    "quantity": ["qty", "quant", "weight", "ton", "amount", "volume", "total"],
+    "company": ["facility", "company", "generator", "source", "name", "entity"],
+    "location": ["city", "region", "location", "area", "zone", "address"],
+    "year": ["year", "date", "period"]
+}
+
+def _build_field_automaton():
+    """Aho-Corasick automaton mapping every header keyword to its fields."""
+    automaton = ahocorasick.Automaton()
+    fields_by_keyword = {}
+    for field, keywords in MAP_CONFIG.items():
+        for kw in keywords:
+            fields_by_keyword.setdefault(kw, []).append(field)
+    for kw, fields in fields_by_keyword.items():
+        automaton.add_word(kw, fields)
+    automaton.make_automaton()
+    return automaton
+
+_FIELD_AUTOMATON = _build_field_automaton() if AHOCORASICK_AVAILABLE else None
+
+def _clean_header(col):
+    return str(col).lower().strip().replace("_", "")
+
 # Fuzzy Header Matcher
 def identify_column(columns, candidates):
     """Finds the first column that matches any of the candidate keywords (case-insensitive)."""
     for col in columns:
-        clean_col = str(col).lower().strip().replace("_", "")
+        clean_col = _clean_header(col)
         for cand in candidates:
             if cand in clean_col:
                 return col
     return None
 
+def identify_columns(columns):
+    """
+    Map every MAP_CONFIG field to the first column containing one of its
+    keywords, same result as identify_column per field.
+    
+    With pyahocorasick each header is scanned once for all keywords.
+    
+    Returns:
+        {field: column} for the fields that matched
+    """
+    if _FIELD_AUTOMATON is None:
+        col_map = {}
+        for field, keywords in MAP_CONFIG.items():
+            found = identify_column(columns, keywords)
+            if found is not None:
+                col_map[field] = found
+        return col_map
+    
+    col_map = {}
+    for col in columns:
+        for _, fields in _FIELD_AUTOMATON.iter(_clean_header(col)):
+            for field in fields:
+                col_map.setdefault(field, col)
+        if len(col_map) == len(MAP_CONFIG):
+            break
+    return col_map
+
 def ingest_file(filepath):
     print(f"\nProcessing: {filepath.name}...")
     
@@ -45,7 +174,7 @@ def ingest_file(filepath):
     # 2. Load Data (Excel or CSV)
     try:
         if filepath.suffix in ['.xlsx', '.xls']:
-            df = pd.read_excel(filepath)
+            df = pd.read_excel(filepath, engine=EXCEL_ENGINE)
         else:
             df = pd.read_csv(filepath, encoding='utf-8', errors='replace')
     except Exception as e:
@@ -53,20 +182,10 @@ def ingest_file(filepath):
         return
 
     # 3. Map Columns (The Magic)
-    cols = df.columns
-    
-    # Keyword Dictionary for Auto-Detection
-    map_config = {
-        "material": ["waste", "type", "material", "item", "substance", "class"],
-        "quantity": ["qty", "quant", "weight", "ton", "amount", "volume", "total"],
-        "company": ["facility", "company", "generator", "source", "name", "entity"],
-        "location": ["city", "region", "location", "area", "zone", "address"],
-        "year": ["year", "date", "period"]
-    }
-    
     col_map = {}
-    for field, keywords in map_config.items():
-        found = identify_column(cols, keywords)
+    matches = identify_columns(df.columns)
+    for field in MAP_CONFIG:
+        found = matches.get(field)
         if found:
             col_map[field] = found
             print(f"   ✅ Mapped '{field}' -> '{found}'")
@@ -96,44 +215,94 @@ def ingest_file(filepath):
     except Exception as e:
         print(f"Doc error: {e}")
     
-    for idx, row in df.iterrows():
-        try:
-            # Extract Values
-            mat = str(row[col_map['material']]).strip() if 'material' in col_map else "Unspecified Waste"
-            
-            # Handle Quantity Cleaning (remove 'tons', commas)
-            qty_raw = str(row[col_map['quantity']]) if 'quantity' in col_map else "0"
-            qty_clean = re.sub(r'[^\d.]', '', qty_raw)
-            try:
-                qty = float(qty_clean)
-            except:
-                qty = 0.0
-                
-            comp = str(row[col_map['company']]).strip() if 'company' in col_map else "Anonymous Generator"
-            loc = str(row[col_map['location']]).strip() if 'location' in col_map else f"{country} (General)"
-            year = int(row[col_map['year']]) if 'year' in col_map and str(row[col_map['year']]).isdigit() else 2024
-            
-            if qty > 0 and len(mat) > 2:
-                cur.execute("""
-                    INSERT INTO waste_listings 
-                    (document_id, material, quantity_tons, source_company, source_location, source_country, year, material_category, treatment_method)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, 'MENA Industrial', 'Unknown')
-                    ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
-                """, (doc_id, mat, qty, comp, loc, country, year))
-                inserted_count += 1
-                
-        except Exception as e:
-            continue # Skip bad rows
-            
+    # Vectorized field extraction (whole columns instead of per-row Python).
+    # NUL bytes are stripped up front: a single one would abort the COPY.
+    def text_col(field):
+        return df[col_map[field]].map(str).str.replace('\x00', '', regex=False).str.strip()
+    
+    n = len(df)
+    mat = text_col('material')
+    
+    # Handle Quantity Cleaning (remove 'tons', commas); unparseable -> 0
+    qty = parse_quantities(df[col_map['quantity']])
+    
+    if 'company' in col_map:
+        comp = text_col('company')
+    else:
+        comp = pd.Series(["Anonymous Generator"] * n, index=df.index)
+    if 'location' in col_map:
+        loc = text_col('location')
+    else:
+        loc = pd.Series([f"{country} (General)"] * n, index=df.index)
+    if 'year' in col_map:
+        year = parse_years(df[col_map['year']])
+    else:
+        year = pd.Series([2024] * n, index=df.index)
+    
+    # Rows the waste_listings columns can't hold would fail the whole
+    # INSERT ... SELECT, so they are skipped here (as the per-row insert
+    # did): VARCHAR(100) material, VARCHAR(255) company/location, and
+    # DECIMAL(15,2) quantity_tons (nothing infinite or >= 1e13)
+    valid = valid_row_mask(mat.str.len(), qty)
+    fits = (
+        (mat.str.len() <= 100)
+        & (comp.str.len() <= 255)
+        & (loc.str.len() <= 255)
+        & (qty.round(2) < 1e13)
+    )
+    mask = valid & fits
+    oversized = int((valid & ~fits).sum())
+    if oversized:
+        print(f"   ⚠️ Skipped {oversized} rows with values too long/large for waste_listings")
+    buf = io.StringIO()
+    csv.writer(buf).writerows(zip(
+        mat[mask],
+        qty[mask].astype(float),
+        comp[mask],
+        loc[mask],
+        year[mask].astype(int).tolist(),
+    ))
+    buf.seek(0)
+    
+    # COPY into a temp staging table, then one INSERT ... SELECT so
+    # duplicates are still skipped by ON CONFLICT
+    conn.autocommit = False
+    try:
+        cur.execute("""
+            CREATE TEMP TABLE mena_stage (
+                material TEXT, quantity_tons DOUBLE PRECISION,
+                source_company TEXT, source_location TEXT, year INTEGER
+            ) ON COMMIT DROP
+        """)
+        cur.copy_expert("""
+            COPY mena_stage (material, quantity_tons, source_company, source_location, year)
+            FROM STDIN WITH (FORMAT CSV, FORCE_NOT_NULL (material, source_company, source_location))
+        """, buf)
+        cur.execute("""
+            INSERT INTO waste_listings 
+            (document_id, material, quantity_tons, source_company, source_location, source_country, year, material_category, treatment_method)
+            SELECT %s, material, quantity_tons, source_company, source_location, %s, year, 'MENA Industrial', 'Unknown'
+            FROM mena_stage
+            ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
+        """, (doc_id, country))
+        inserted_count = cur.rowcount
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        print(f"   ❌ Insert failed: {e}")
+    
     print(f"   🚀 Ingested {inserted_count} records from {filepath.name}")
     conn.close()
 
 if __name__ == "__main__":
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
     all_files = list(RAW_DIR.glob("*"))
     files = [f for f in all_files if f.suffix.lower() in ['.csv', '.xlsx', '.xls']]
     if not files:
         print(f"No files found in {RAW_DIR.absolute()}")
         print(f"Directory contents: {[f.name for f in all_files]}")
     else:
-        for f in files:
-            ingest_file(f)
+        # Overlap one file's Excel/CSV parsing with another's database load
+        with ThreadPoolExecutor(max_workers=min(WORKERS, len(files))) as executor:
+            list(executor.map(ingest_file, files))
+        refresh_valuation_rollup()
@@ -2,6 +2,8 @@
 import json
 import psycopg2
 import uuid
+from psycopg2.extras import execute_values
+from processors.pricing_processor import refresh_valuation_rollup
 from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
 
 # The User-Provided Data
@@ -27,36 +29,35 @@ def process():
     except Exception as e:
         pass
         
+    # We skip 'Total' because it duplicates the sum
+    # 'variable' is the treatment method (Burning, Landfill, Recycling)
+    rows = [
+        (doc_id, float(row['value']), int(row['year']), row['variable'])
+        for row in DATA
+        if row['variable'].lower() != 'total'
+    ]
+    skipped = len(DATA) - len(rows)
     inserted = 0
-    skipped = 0
     
-    for row in DATA:
-        year = int(row['year'])
-        # 'variable' is the treatment method (Burning, Landfill, Recycling)
-        method = row['variable']
-        quantity = float(row['value'])
-        
-        # We skip 'Total' because it duplicates the sum
-        if method.lower() == 'total':
-            skipped += 1
-            continue
-            
-        # Insert
-        # Since we don't have a specific material, we say "Industrial Waste (Aggregate)"
-        # We infer the treatment method
-        
-        try:
-            cur.execute("""
-                INSERT INTO waste_listings 
-                (document_id, material, quantity_tons, source_company, source_location, source_country, year, material_category, treatment_method)
-                VALUES (%s, 'Industrial Waste (Aggregate)', %s, 'Jubail Industrial City', 'Jubail, Saudi Arabia', 'SAU', %s, 'MENA Industrial', %s)
-                ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
-            """, (doc_id, quantity, year, method))
-            inserted += 1
-        except Exception as e:
-            print(f"Error: {e}")
+    # Insert all rows in one statement
+    # Since we don't have a specific material, we say "Industrial Waste (Aggregate)"
+    # We infer the treatment method
+    try:
+        result = execute_values(cur, """
+            INSERT INTO waste_listings 
+            (document_id, quantity_tons, year, treatment_method, material, source_company, source_location, source_country, material_category)
+            VALUES %s
+            ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
+            RETURNING id
+        """, rows, template="(%s, %s, %s, %s, 'Industrial Waste (Aggregate)', 'Jubail Industrial City', 'Jubail, Saudi Arabia', 'SAU', 'MENA Industrial')",
+            fetch=True)
+        inserted = len(result)
+    except Exception as e:
+        print(f"Error: {e}")
             
     print(f"✅ Ingested {inserted} records for Jubail (Saudi Arabia). Skipped {skipped} totals.")
+    if inserted:
+        refresh_valuation_rollup()
 
 if __name__ == "__main__":
     process()
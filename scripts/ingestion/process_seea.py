@@ -1,14 +1,56 @@
 
+import sys
+import unicodedata
 import pandas as pd
 import psycopg2
 import uuid
-import re
 from pathlib import Path
+from psycopg2.extras import execute_values
+from processors.pricing_processor import refresh_valuation_rollup
 from config import POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_HOST, POSTGRES_PORT
 
+# Rust-based calamine reader when installed (pandas >= 2.2); else pandas' default
+try:
+    import python_calamine
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
 # Absolute Path to the elusive file
 TARGET_FILE = Path(r"C:\Users\Imrry\Desktop\symbio_data_engine\data\raw\mena\SEEA Waste 2024-EN.xlsx")
 
+# Strings float() accepts that pd.to_numeric turns into NaN
+_FLOAT_SPECIALS = {"nan", "+nan", "-nan", "inf", "+inf", "-inf", "infinity", "+infinity", "-infinity"}
+
+# Unicode decimal digits (Arabic-Indic '١٢٣', Persian, ...) -> ASCII, so
+# pd.to_numeric reads them the way float() does
+_ASCII_DIGITS = {
+    i: str(unicodedata.decimal(chr(i)))
+    for i in range(128, sys.maxunicode + 1)
+    if chr(i).isdecimal()
+}
+
+
+def first_material_and_quantity(df):
+    """
+    Per row: the first cell that parses as a positive number (quantity) and
+    the first non-numeric text longer than 3 chars (material).
+    
+    Whole-frame column operations replace the per-cell float()/str() loop.
+    Rows without one of the two get NaN.
+    """
+    text = df.apply(lambda col: col.map(str).str.strip())
+    numbers = text.apply(lambda col: pd.to_numeric(col.str.translate(_ASCII_DIGITS), errors="coerce"))
+    is_number = numbers.notna() | text.apply(lambda col: col.str.lower().isin(_FLOAT_SPECIALS))
+    
+    positive = numbers.where(numbers > 0)
+    quantity = positive.bfill(axis=1).iloc[:, 0]
+    
+    is_material = ~is_number & text.apply(lambda col: (col.str.len() > 3) & ~col.str.isdigit())
+    material = text.where(is_material).bfill(axis=1).iloc[:, 0]
+    return material, quantity
+
+
 def process():
     print(f"Targeting file: {TARGET_FILE}")
     if not TARGET_FILE.exists():
@@ -19,7 +61,7 @@ def process():
     
     try:
         # Load Excel - usually the first sheet is the summary
-        df = pd.read_excel(TARGET_FILE)
+        df = pd.read_excel(TARGET_FILE, engine=EXCEL_ENGINE)
         print(f"Loaded {len(df)} rows.")
         
         conn = psycopg2.connect(
@@ -55,39 +97,39 @@ def process():
         
         cols = [str(c).lower() for c in df.columns]
         
-        # HACK: If we can't map it perfectly, we just grab row-by-row and look for a String + a Number
-        for idx, row in df.iterrows():
-            try:
-                # Heuristic: Find the first String column (Material) and first Number column (Quantity)
-                material = "Unknown"
-                quantity = 0.0
-                
-                for val in row.values:
-                    s_val = str(val).strip()
-                    # Check for float/int
-                    try:
-                        f_val = float(s_val)
-                        if f_val > 0 and quantity == 0:
-                            quantity = f_val
-                    except:
-                        # Check for string text (Material)
-                        if len(s_val) > 3 and material == "Unknown" and not s_val.isdigit():
-                            material = s_val
-                            
-                if quantity > 0 and material != "Unknown":
-                    # Insert
-                     cur.execute("""
-                        INSERT INTO waste_listings 
-                        (document_id, material, quantity_tons, source_company, source_location, source_country, year, material_category, treatment_method)
-                        VALUES (%s, %s, %s, 'Saudi Generic Industry', 'Saudi Arabia', 'SAU', 2024, 'MENA SEEA', 'Unknown')
-                        ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
-                    """, (doc_id, material, quantity))
-                     inserted += 1
-            except Exception as e:
-                continue
+        # HACK: If we can't map it perfectly, we just grab each row's first String + first Number
+        material, quantity = first_material_and_quantity(df)
+        # One bad value fails its whole INSERT page, so skip rows the columns
+        # can't hold up front (the per-row insert skipped them too): material
+        # is VARCHAR(100), quantity_tons is DECIMAL(15,2) (no inf, nothing
+        # that rounds to 1e13 or more)
+        material = material.str.replace('\x00', '', regex=False)
+        found = quantity.notna() & material.notna()
+        fits = (material.str.len() <= 100) & (quantity.round(2) < 1e13)
+        mask = found & fits
+        oversized = int((found & ~fits).sum())
+        if oversized:
+            print(f"⚠️ Skipped {oversized} rows with values too long/large for waste_listings")
+        rows = list(zip([doc_id] * int(mask.sum()), material[mask], quantity[mask].astype(float)))
+        
+        # One multi-row INSERT per 1000 rows instead of a round-trip per row
+        try:
+            result = execute_values(cur, """
+                INSERT INTO waste_listings 
+                (document_id, material, quantity_tons, source_company, source_location, source_country, year, material_category, treatment_method)
+                VALUES %s
+                ON CONFLICT (document_id, material, source_company, year, quantity_tons) DO NOTHING
+                RETURNING id
+            """, rows, template="(%s, %s, %s, 'Saudi Generic Industry', 'Saudi Arabia', 'SAU', 2024, 'MENA SEEA', 'Unknown')",
+                page_size=1000, fetch=True)
+            inserted = len(result)
+        except Exception as e:
+            print(f"❌ Insert failed: {e}")
 
         print(f"🚀 Ingested {inserted} records from SEEA Waste 2024.")
         conn.close()
+        if inserted:
+            refresh_valuation_rollup()
 
     except Exception as e:
         print(f"❌ Failed to process: {e}")
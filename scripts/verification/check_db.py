@@ -2,28 +2,34 @@ from store.postgres import execute_query
 
 print("=== Final Database Status ===\n")
 
+# Count, per-method totals and top samples in one round-trip; the total
+# comes from the GROUP BY rows instead of a second count(*) scan
+status = execute_query("""
+    WITH agg AS (
+        SELECT treatment_method, count(*) as cnt, SUM(quantity_tons) as total_tons
+        FROM waste_listings
+        GROUP BY treatment_method
+    ), top AS (
+        SELECT material, quantity_tons, source_company, treatment_method, year
+        FROM waste_listings
+        ORDER BY quantity_tons DESC
+        LIMIT 5
+    )
+    SELECT
+        (SELECT COALESCE(SUM(cnt), 0) FROM agg) as cnt,
+        (SELECT json_agg(agg ORDER BY cnt DESC) FROM agg) as methods,
+        (SELECT json_agg(top ORDER BY quantity_tons DESC) FROM top) as samples
+""")[0]
+
 # Waste listings count
-wl = execute_query("SELECT count(*) as cnt FROM waste_listings")
-print(f"📦 Total Waste Listings: {wl[0]['cnt']}")
+print(f"📦 Total Waste Listings: {status['cnt']}")
 
 # By treatment method
 print("\n=== By Treatment Method ===")
-methods = execute_query("""
-    SELECT treatment_method, count(*) as cnt, SUM(quantity_tons) as total_tons
-    FROM waste_listings 
-    GROUP BY treatment_method 
-    ORDER BY cnt DESC
-""")
-for m in methods:
+for m in status['methods'] or []:
     print(f"  {m['treatment_method']}: {m['cnt']} records, {m['total_tons']:.2f} tons")
 
 # Sample
 print("\n=== Sample Waste Listings ===")
-samples = execute_query("""
-    SELECT material, quantity_tons, source_company, treatment_method, year 
-    FROM waste_listings 
-    ORDER BY quantity_tons DESC
-    LIMIT 5
-""")
-for s in samples:
+for s in status['samples'] or []:
     print(f"  {s['material'][:25]:<25} | {s['quantity_tons']:>10.2f} tons | {s['treatment_method']:<18} | {s['year']}")
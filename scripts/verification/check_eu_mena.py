@@ -5,49 +5,52 @@ print("="*60)
 print("EU & MENA PIPELINE STATUS")
 print("="*60)
 
+# Everything below comes from one round-trip: per-source status counts,
+# an EU sample, and EU/MENA listing counts from a single join
+status = execute_query("""
+    WITH doc_stats AS (
+        SELECT source, status, COUNT(*) as cnt
+        FROM documents
+        GROUP BY source, status
+    ), eu_sample AS (
+        SELECT id, file_path, status, document_type
+        FROM documents
+        WHERE source = 'eprtr'
+        LIMIT 5
+    ), wl_counts AS (
+        SELECT
+            COUNT(*) FILTER (WHERE d.source = 'eprtr') as eu_records,
+            COUNT(*) FILTER (WHERE d.source = 'mena') as mena_records
+        FROM waste_listings w
+        JOIN documents d ON w.document_id = d.id
+        WHERE d.source IN ('eprtr', 'mena')
+    )
+    SELECT
+        (SELECT json_agg(doc_stats ORDER BY source, status) FROM doc_stats) as docs,
+        (SELECT json_agg(eu_sample) FROM eu_sample) as eu_docs,
+        (SELECT COALESCE(SUM(cnt), 0) FROM doc_stats WHERE source = 'mena') as mena_docs,
+        wl_counts.eu_records,
+        wl_counts.mena_records
+    FROM wl_counts
+""")[0]
+
 # Document status by source
 print("\n1. DOCUMENT STATUS BY SOURCE:")
-docs = execute_query("""
-    SELECT source, status, COUNT(*) as cnt
-    FROM documents 
-    GROUP BY source, status 
-    ORDER BY source, status
-""")
-for d in docs:
+for d in status['docs'] or []:
     print(f"   {d['source']}: {d['status']} = {d['cnt']}")
 
 # EU specific
 print("\n2. EU (EPRTR) DETAILS:")
-eu_docs = execute_query("""
-    SELECT id, file_path, status, document_type
-    FROM documents 
-    WHERE source = 'eprtr'
-    LIMIT 5
-""")
-for d in eu_docs:
+for d in status['eu_docs'] or []:
     fp = d['file_path'][-50:] if d['file_path'] else 'N/A'
     print(f"   [{d['status']}] {d['document_type']} - ...{fp}")
 
 # EU records in waste_listings
-eu_records = execute_query("""
-    SELECT COUNT(*) as cnt FROM waste_listings w
-    JOIN documents d ON w.document_id = d.id
-    WHERE d.source = 'eprtr'
-""")
-print(f"   -> EU waste_listings: {eu_records[0]['cnt']}")
+print(f"   -> EU waste_listings: {status['eu_records']}")
 
 # MENA specific
 print("\n3. MENA DETAILS:")
-mena_docs = execute_query("""
-    SELECT COUNT(*) as cnt FROM documents WHERE source = 'mena'
-""")
-print(f"   Documents: {mena_docs[0]['cnt']}")
-
-mena_records = execute_query("""
-    SELECT COUNT(*) as cnt FROM waste_listings w
-    JOIN documents d ON w.document_id = d.id
-    WHERE d.source = 'mena'
-""")
-print(f"   waste_listings: {mena_records[0]['cnt']}")
+print(f"   Documents: {status['mena_docs']}")
+print(f"   waste_listings: {status['mena_records']}")
 
 print("\n" + "="*60)
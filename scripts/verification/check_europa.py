@@ -5,7 +5,11 @@ print(f"Checking access to {url}...")
 
 try:
     with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(url)
+        # Headers only; fall back to GET on any non-2xx HEAD (servers that
+        # mishandle HEAD answer 403/404/501 as well as 405)
+        resp = client.head(url)
+        if not resp.is_success:
+            resp = client.get(url)
         print(f"Status: {resp.status_code}")
         if resp.status_code == 200:
             print("✅ Data.Europa.EU is accessible.")
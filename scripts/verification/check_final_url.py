@@ -1,19 +1,71 @@
+import json
 import httpx
+from config import DATA_DIR
 
 url = "https://www.eea.europa.eu/en/datahub/datahubitem-view/9405f714-8015-4b5b-a63c-280b82861b3d"
+KEYWORD = b"Industrial"
+
+# Validators (+ keyword result) from the last run; an unchanged page then
+# comes back as a bodiless 304 instead of a full download
+ETAG_CACHE = DATA_DIR / "cache" / "http_etags.json"
+
+
+def load_etags() -> dict:
+    try:
+        return json.loads(ETAG_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_etags(cache: dict):
+    ETAG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    ETAG_CACHE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+
+def stream_contains(resp, keyword: bytes) -> bool:
+    """Scan the body as it arrives and stop reading once keyword is seen."""
+    tail = b""
+    for chunk in resp.iter_bytes():
+        if keyword in tail + chunk:
+            return True
+        # Keep the last len-1 bytes seen, even across chunks shorter than that
+        tail = (tail + chunk)[-(len(keyword) - 1):]
+    return False
+
+
+etags = load_etags()
+cached = etags.get(url, {})
+conditional = {}
+if cached.get("etag"):
+    conditional["If-None-Match"] = cached["etag"]
+if cached.get("last_modified"):
+    conditional["If-Modified-Since"] = cached["last_modified"]
 
 print(f"Checking URL: {url} ...")
 try:
     with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-        resp = client.get(url)
-        print(f"Status: {resp.status_code}")
-        if resp.status_code == 200:
-            print("✅ Valid Link! This is likely the dataset page.")
-            # Verify if it contains "Industrial Reporting"
-            if "Industrial" in resp.text:
+        with client.stream("GET", url, headers=conditional) as resp:
+            print(f"Status: {resp.status_code}")
+            if resp.status_code == 304:
+                print("✅ Valid Link! (unchanged since last check)")
+                found = cached.get("has_keyword", False)
+            elif resp.status_code == 200:
+                print("✅ Valid Link! This is likely the dataset page.")
+                # Verify if it contains "Industrial Reporting"
+                found = stream_contains(resp, KEYWORD)
+                validators = {
+                    "etag": resp.headers.get("ETag"),
+                    "last_modified": resp.headers.get("Last-Modified"),
+                }
+                if any(validators.values()):
+                    etags[url] = {**validators, "has_keyword": found}
+                    save_etags(etags)
+            else:
+                print("❌ Invalid link.")
+                found = False
+
+            if found:
                 print("✅ Found keyword 'Industrial' in page content.")
-        else:
-            print("❌ Invalid link.")
 
 except Exception as e:
     print(f"Error: {e}")
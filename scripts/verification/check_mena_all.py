@@ -0,0 +1,14 @@
+"""
+Run the MENA/Saudi API probes over one shared httpx.Client, so repeated
+hosts (bayanat.ae is hit twice) reuse the TCP/TLS connection instead of
+each probe doing its own handshake.
+"""
+import httpx
+from check_saudi import check_saudi
+from debug_mena import check_bayanat
+from debug_mena_deep import debug_mena
+
+with httpx.Client(timeout=30.0, follow_redirects=True, limits=httpx.Limits(max_keepalive_connections=32)) as client:
+    check_bayanat(client)
+    debug_mena(client)
+    check_saudi(client)
@@ -1,3 +1,4 @@
+import asyncio
 import httpx
 
 links = [
@@ -6,18 +7,23 @@ links = [
     "https://sdi.eea.europa.eu/data/9f373400-35b7-4978-9a34-a3cf839e053f"
 ]
 
+
+async def probe_all(urls):
+    """HEAD all URLs concurrently over one pooled client; errors are returned, not raised."""
+    async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
+        return await asyncio.gather(*(client.head(u) for u in urls), return_exceptions=True)
+
+
 print("🔎 CHECKING SDI LINKS...")
-with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-    for url in links:
-        try:
-            print(f"\nLink: {url}")
-            resp = client.head(url)
-            ct = resp.headers.get("Content-Type", "Unknown")
-            cl = resp.headers.get("Content-Length", "Unknown")
-            print(f"   Status: {resp.status_code}")
-            print(f"   Type:   {ct}")
-            print(f"   Size:   {cl} bytes")
-            if "zip" in ct or "csv" in ct or "application/octet-stream" in ct:
-                print("   ✅ MATCH! This is a data file.")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+for url, resp in zip(links, asyncio.run(probe_all(links))):
+    print(f"\nLink: {url}")
+    if isinstance(resp, Exception):
+        print(f"   ❌ Error: {resp}")
+        continue
+    ct = resp.headers.get("Content-Type", "Unknown")
+    cl = resp.headers.get("Content-Length", "Unknown")
+    print(f"   Status: {resp.status_code}")
+    print(f"   Type:   {ct}")
+    print(f"   Size:   {cl} bytes")
+    if "zip" in ct or "csv" in ct or "application/octet-stream" in ct:
+        print("   ✅ MATCH! This is a data file.")
@@ -1,16 +1,23 @@
 from store.postgres import execute_query
 
+# Both breakdowns in one round-trip
+status = execute_query("""
+    SELECT
+        (SELECT json_agg(t) FROM (
+            SELECT source, count(*) as c FROM documents GROUP BY 1
+        ) t) as docs,
+        (SELECT json_agg(t) FROM (
+            SELECT d.source, count(*) as c
+            FROM waste_listings w
+            JOIN documents d ON w.document_id = d.id
+            GROUP BY 1
+        ) t) as listings
+""")[0]
+
 print("🔎 CHECKING DOCUMENT SOURCES:")
-rows = execute_query("SELECT source, count(*) as c FROM documents GROUP BY 1")
-for r in rows:
+for r in status['docs'] or []:
     print(f"   📂 '{r['source']}': {r['c']} docs")
 
 print("\n🔎 CHECKING WASTE LISTINGS BY SOURCE:")
-rows = execute_query("""
-    SELECT d.source, count(*) as c 
-    FROM waste_listings w 
-    JOIN documents d ON w.document_id = d.id 
-    GROUP BY 1
-""")
-for r in rows:
+for r in status['listings'] or []:
     print(f"   📂 '{r['source']}': {r['c']} listings")
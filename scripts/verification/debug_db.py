@@ -1,4 +1,8 @@
-from store.postgres import execute_query
+import sys
+from store.postgres import estimate_count, execute_query
+
+# --fast: planner estimates instead of COUNT(*) scans on the big tables
+FAST = "--fast" in sys.argv
 
 print("=== Government Documents (detailed) ===")
 gov = execute_query("SELECT id, source_url, document_type, status, file_path FROM documents WHERE source = 'government' LIMIT 5")
@@ -18,5 +22,8 @@ for p in pending:
     print(f"  {p['document_type']}: {p['cnt']}")
 
 print("\n=== Total Counts ===")
-wl = execute_query("SELECT count(*) as cnt FROM waste_listings")
-print(f"  Waste Listings: {wl[0]['cnt']}")
+if FAST:
+    print(f"  Waste Listings: ~{estimate_count('SELECT 1 FROM waste_listings')}")
+else:
+    wl = execute_query("SELECT count(*) as cnt FROM waste_listings")
+    print(f"  Waste Listings: {wl[0]['cnt']}")
@@ -3,7 +3,8 @@ from rich.console import Console
 
 console = Console()
 
-def debug_mena():
+def debug_mena(client: httpx.Client = None):
+    """Dump the Bayanat API response; pass a client to reuse its connections."""
     url = "https://bayanat.ae/api/explore/v2.1/catalog/datasets?where=theme%3D%22Environment%22&limit=50"
     console.print(f"[bold cyan]🔍 Debugging MENA API:[/bold cyan] {url}")
     
@@ -15,8 +16,11 @@ def debug_mena():
     
     try:
         # standard timeout
-        client = httpx.Client(timeout=30.0, follow_redirects=True)
-        response = client.get(url, headers=headers)
+        if client is None:
+            with httpx.Client(timeout=30.0, follow_redirects=True) as own_client:
+                response = own_client.get(url, headers=headers)
+        else:
+            response = client.get(url, headers=headers)
         
         console.print(f"\n[bold]Status Code:[/bold] {response.status_code}")
         console.print(f"[bold]Content-Type:[/bold] {response.headers.get('content-type', 'N/A')}")
@@ -14,18 +14,29 @@ key_cols = {
 non_zero_count = 0
 total_rows = 0
 with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-    reader = csv.DictReader(f)
+    reader = csv.reader(f)
+    # Column positions looked up once; rows stay plain lists (no dict per row)
+    pos = {col: i for i, col in enumerate(next(reader, []))}
+    key_idx = [(name, pos.get(col)) for name, col in key_cols.items()]
+    chemical_idx = pos.get("37. CHEMICAL")
+    facility_idx = pos.get("4. FACILITY NAME")
+    
+    def cell(row, i, default):
+        return row[i] if i is not None and i < len(row) else default
+    
     for row in reader:
+        if not row:
+            continue  # DictReader skips blank lines too
         total_rows += 1
-        for name, col in key_cols.items():
-            val = row.get(col, "0").strip().replace(",", "")
+        for name, i in key_idx:
+            val = cell(row, i, "0").strip().replace(",", "")
             try:
                 num = float(val)
                 if num > 0:
                     non_zero_count += 1
                     if non_zero_count <= 5:
-                        chemical = row.get("37. CHEMICAL", "?")
-                        facility = row.get("4. FACILITY NAME", "?")
+                        chemical = cell(row, chemical_idx, "?")
+                        facility = cell(row, facility_idx, "?")
                         print(f"Found non-zero: {name}={num}, chemical={chemical[:30]}, facility={facility[:30]}")
                     break
             except ValueError:
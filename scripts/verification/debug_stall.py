@@ -5,36 +5,41 @@ print("="*60)
 print("   🕵️ DEBUGGING STALLED COUNTS")
 print("="*60)
 
+# One round-trip; the two documents counts share a single scan
+status = execute_query("""
+    WITH pending AS (
+        SELECT source, document_type, count(*) as c
+        FROM documents
+        WHERE status = 'pending'
+        GROUP BY source, document_type
+    ), doc_counts AS (
+        SELECT
+            count(*) FILTER (WHERE status = 'processing') as stuck,
+            count(*) FILTER (WHERE ingested_at > NOW() - INTERVAL '30 minutes') as recent
+        FROM documents
+    )
+    SELECT
+        (SELECT json_agg(pending) FROM pending) as pending,
+        doc_counts.stuck,
+        doc_counts.recent,
+        (SELECT count(*) FROM waste_listings
+         WHERE created_at > NOW() - INTERVAL '30 minutes') as recent_extract
+    FROM doc_counts
+""")[0]
+
 # 1. QUEUE STATUS
 print("\n1️⃣ QUEUE COMPOSITION:")
-pending = execute_query("""
-    SELECT source, document_type, count(*) as c 
-    FROM documents 
-    WHERE status = 'pending' 
-    GROUP BY source, document_type
-""")
-for p in pending:
+for p in status['pending'] or []:
     print(f"   Pending: {p['source']} ({p['document_type']}) -> {p['c']}")
 
 # 2. PROCESSING STATE (Is things stuck in 'processing'?)
-stuck = execute_query("""
-    SELECT count(*) as c FROM documents WHERE status = 'processing'
-""")
-print(f"\n2️⃣ IN PROGRESS: {stuck[0]['c']} docs currently processing")
+print(f"\n2️⃣ IN PROGRESS: {status['stuck']} docs currently processing")
 
 # 3. RECENT ACTIVITY
 print("\n3️⃣ RECENT INGESTION (Last 30 mins):")
-recent = execute_query("""
-    SELECT count(*) as c FROM documents 
-    WHERE ingested_at > NOW() - INTERVAL '30 minutes'
-""")
-print(f"   New Docs Downloaded: {recent[0]['c']}")
+print(f"   New Docs Downloaded: {status['recent']}")
 
 # 4. RECENT EXTRACTIONS
-recent_extract = execute_query("""
-    SELECT count(*) as c FROM waste_listings 
-    WHERE created_at > NOW() - INTERVAL '30 minutes'
-""")
-print(f"   New Listings Extracted: {recent_extract[0]['c']}")
+print(f"   New Listings Extracted: {status['recent_extract']}")
 
 print("\n" + "="*60)
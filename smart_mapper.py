@@ -3,6 +3,7 @@ Smart material mapper with proper disaggregation.
 Doesn't dump everything into "Hazardous" - creates proper sub-categories.
 """
 from store.postgres import execute_query, get_connection
+from processors.pricing_processor import refresh_valuation_rollup
 from collections import defaultdict
 
 print("="*70)
@@ -231,6 +232,7 @@ with get_connection() as conn:
         conn.commit()
 
 print(f"[OK] {len(mapped)} mappings stored")
+refresh_valuation_rollup()
 
 # Summary
 print("\n" + "="*70)
@@ -4,13 +4,14 @@ Symbio Data Engine - Store Module
 Database layer for PostgreSQL and ChromaDB.
 """
 
-from .postgres import get_connection, init_database, execute_query
+from .postgres import get_connection, init_database, execute_query, session
 from .vectors import get_vectorstore, init_vectorstore
 
 __all__ = [
     "get_connection",
     "init_database", 
     "execute_query",
+    "session",
     "get_vectorstore",
     "init_vectorstore",
 ]
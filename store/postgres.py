@@ -9,6 +9,8 @@ Connection pooling, query helpers, and database initialization.
 - Stuck document recovery
 """
 
+import atexit
+import json
 import logging
 from contextlib import contextmanager
 from pathlib import Path
@@ -81,11 +83,30 @@ def get_connection():
         pool.putconn(conn)
 
 
+@contextmanager
+def session():
+    """
+    One pooled connection + dict cursor for a run of statements.
+    
+    Pass the cursor to execute_query(cursor=...) so a script issues all
+    its queries over one session instead of a pool checkout per query.
+    Commits once on exit.
+    
+    Usage:
+        with session() as cur:
+            total = execute_query("SELECT COUNT(*) AS c FROM documents", cursor=cur)[0]["c"]
+    """
+    with get_connection() as conn:
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            yield cur
+
+
 def execute_query(
     query: str,
     params: tuple = None,
     fetch: bool = True,
     as_dict: bool = True,
+    cursor=None,
 ) -> Optional[list[dict[str, Any]]]:
     """
     Execute a query and optionally fetch results.
@@ -95,20 +116,30 @@ def execute_query(
         params: Query parameters
         fetch: Whether to fetch results
         as_dict: Return results as dictionaries
+        cursor: Open cursor to run on (e.g. from session()); if None a
+                pooled connection is checked out for this query
     
     Returns:
         List of results if fetch=True, else None
     """
+    if cursor is not None:
+        return _run_query(cursor, query, params, fetch, as_dict)
+    
     with get_connection() as conn:
         cursor_factory = RealDictCursor if as_dict else None
         with conn.cursor(cursor_factory=cursor_factory) as cur:
-            cur.execute(query, params)
-            
-            if fetch:
-                results = cur.fetchall()
-                return [dict(row) for row in results] if as_dict else results
-            
-            return None
+            return _run_query(cur, query, params, fetch, as_dict)
+
+
+def _run_query(cur, query, params, fetch, as_dict):
+    """Execute on an open cursor and shape the results for execute_query."""
+    cur.execute(query, params)
+    
+    if fetch:
+        results = cur.fetchall()
+        return [dict(row) for row in results] if as_dict else results
+    
+    return None
 
 
 def execute_many(
@@ -231,24 +262,47 @@ def update_document_status(
     execute_query(query, (status, error_message, status, document_id), fetch=False)
 
 
+# Valid columns in waste_listings table (filter out Pydantic-only fields)
+WASTE_LISTING_COLUMNS = frozenset({
+    "document_id", "material", "material_category", "material_subcategory",
+    "cas_number", "quantity_tons", "quantity_unit", "price_per_ton", "currency",
+    "price_type", "source_company", "source_industry", "source_location",
+    "source_country", "quality_grade", "purity_percentage", "treatment_method",
+    "availability_status", "listing_date", "expiry_date", "extraction_confidence",
+    "data_source_url", "year", "source_quote"  # Added for Citation Rule
+})
+
+# Columns of idx_waste_listing_granular, the index ON CONFLICT targets
+_WASTE_LISTING_KEY = ("document_id", "material", "source_company", "year", "quantity_tons")
+
+_WASTE_LISTING_CONFLICT = """
+    ON CONFLICT (document_id, material, source_company, year, quantity_tons) 
+    WHERE document_id IS NOT NULL AND material IS NOT NULL
+    DO UPDATE SET
+        source_location = EXCLUDED.source_location,
+        extraction_confidence = EXCLUDED.extraction_confidence,
+        created_at = NOW()
+"""
+
+_CARBON_EMISSION_CONFLICT = """
+    ON CONFLICT (company, year) 
+    WHERE company IS NOT NULL AND year IS NOT NULL
+    DO UPDATE SET
+        co2_tons = COALESCE(EXCLUDED.co2_tons, carbon_emissions.co2_tons),
+        extraction_confidence = EXCLUDED.extraction_confidence,
+        created_at = NOW()
+"""
+
+
 def insert_waste_listing(data: dict) -> int:
     """
     Insert a waste listing with UPSERT support.
     
-    🛡️ ON CONFLICT: Updates if same document_id + material exists.
+    🛡️ ON CONFLICT: Updates if same document_id + material + source_company
+    + year + quantity_tons exists (idx_waste_listing_granular).
     """
-    # Valid columns in waste_listings table (filter out Pydantic-only fields)
-    VALID_COLUMNS = {
-        "document_id", "material", "material_category", "material_subcategory",
-        "cas_number", "quantity_tons", "quantity_unit", "price_per_ton", "currency",
-        "price_type", "source_company", "source_industry", "source_location",
-        "source_country", "quality_grade", "purity_percentage", "treatment_method",
-        "availability_status", "listing_date", "expiry_date", "extraction_confidence",
-        "data_source_url", "year", "source_quote"  # Added for Citation Rule
-    }
-    
     # Filter out None values AND columns not in database
-    data = {k: v for k, v in data.items() if v is not None and k in VALID_COLUMNS}
+    data = {k: v for k, v in data.items() if v is not None and k in WASTE_LISTING_COLUMNS}
     columns = list(data.keys())
     values = list(data.values())
     
@@ -256,14 +310,7 @@ def insert_waste_listing(data: dict) -> int:
     query = sql.SQL("""
         INSERT INTO waste_listings ({columns})
         VALUES ({placeholders})
-        ON CONFLICT (document_id, material) 
-        WHERE document_id IS NOT NULL AND material IS NOT NULL
-        DO UPDATE SET
-            quantity_tons = EXCLUDED.quantity_tons,
-            source_location = EXCLUDED.source_location,
-            source_company = EXCLUDED.source_company,
-            extraction_confidence = EXCLUDED.extraction_confidence,
-            created_at = NOW()
+    """ + _WASTE_LISTING_CONFLICT + """
         RETURNING id
     """).format(
         columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
@@ -290,12 +337,7 @@ def insert_carbon_emission(data: dict) -> int:
     query = sql.SQL("""
         INSERT INTO carbon_emissions ({columns})
         VALUES ({placeholders})
-        ON CONFLICT (company, year) 
-        WHERE company IS NOT NULL AND year IS NOT NULL
-        DO UPDATE SET
-            co2_tons = COALESCE(EXCLUDED.co2_tons, carbon_emissions.co2_tons),
-            extraction_confidence = EXCLUDED.extraction_confidence,
-            created_at = NOW()
+    """ + _CARBON_EMISSION_CONFLICT + """
         RETURNING id
     """).format(
         columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
@@ -309,6 +351,119 @@ def insert_carbon_emission(data: dict) -> int:
             return result[0] if result else None
 
 
+def insert_waste_listings(rows: list[dict], cursor=None, page_size: int = 1000) -> int:
+    """
+    Bulk variant of insert_waste_listing (same filtering and upsert).
+    
+    Args:
+        rows: Dicts as accepted by insert_waste_listing
+        cursor: Open cursor to run on (e.g. from session()); if None one
+                pooled connection is used and committed once
+        page_size: Rows per multi-row INSERT
+    
+    Returns:
+        Number of rows written (rows that fail on their own are skipped)
+    """
+    return _bulk_upsert(
+        "waste_listings", rows, _WASTE_LISTING_CONFLICT, _WASTE_LISTING_KEY,
+        valid_columns=WASTE_LISTING_COLUMNS, cursor=cursor, page_size=page_size,
+    )
+
+
+def insert_carbon_emissions(rows: list[dict], cursor=None, page_size: int = 1000) -> int:
+    """
+    Bulk variant of insert_carbon_emission (same upsert).
+    
+    Args:
+        rows: Dicts as accepted by insert_carbon_emission
+        cursor: Open cursor to run on (e.g. from session()); if None one
+                pooled connection is used and committed once
+        page_size: Rows per multi-row INSERT
+    
+    Returns:
+        Number of rows written (rows that fail on their own are skipped)
+    """
+    return _bulk_upsert(
+        "carbon_emissions", rows, _CARBON_EMISSION_CONFLICT, ("company", "year"),
+        cursor=cursor, page_size=page_size,
+    )
+
+
+def _bulk_upsert(
+    table: str,
+    rows: list[dict],
+    conflict: str,
+    conflict_key: tuple,
+    valid_columns: frozenset = None,
+    cursor=None,
+    page_size: int = 1000,
+) -> int:
+    """
+    execute_values upsert of dict rows, grouped by their non-None columns.
+    
+    Grouping keeps the single-row behaviour of omitting None values (so
+    column defaults apply). Within a group, later rows with the same
+    conflict key win, as with sequential upserts.
+    """
+    groups: dict[tuple, dict] = {}
+    for row in rows:
+        data = {
+            k: v for k, v in row.items()
+            if v is not None and (valid_columns is None or k in valid_columns)
+        }
+        if not data:
+            continue
+        group = groups.setdefault(tuple(data), {})
+        key = tuple(data.get(k) for k in conflict_key)
+        # Rows missing part of the key never conflict; keep them all
+        group[key if None not in key else len(group)] = tuple(data.values())
+    
+    if not groups:
+        return 0
+    
+    if cursor is None:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                return _bulk_upsert_groups(cur, table, groups, conflict, page_size)
+    return _bulk_upsert_groups(cursor, table, groups, conflict, page_size)
+
+
+def _bulk_upsert_groups(cur, table, groups, conflict, page_size) -> int:
+    """Run one INSERT ... VALUES %s per column group; returns rows written."""
+    written = 0
+    for columns, keyed in groups.items():
+        query = sql.SQL("INSERT INTO {table} ({columns}) VALUES %s " + conflict).format(
+            table=sql.Identifier(table),
+            columns=sql.SQL(", ").join(map(sql.Identifier, columns)),
+        ).as_string(cur)
+        written += _execute_values_bisect(cur, query, list(keyed.values()), page_size)
+    return written
+
+
+def _execute_values_bisect(cur, query: str, values: list[tuple], page_size: int) -> int:
+    """
+    execute_values under a savepoint; on error split the batch in halves
+    and retry, so one bad row only drops itself.
+    """
+    cur.execute("SAVEPOINT bulk_upsert")
+    try:
+        execute_values(cur, query, values, page_size=page_size)
+        cur.execute("RELEASE SAVEPOINT bulk_upsert")
+        return len(values)
+    except psycopg2.Error as e:
+        cur.execute("ROLLBACK TO SAVEPOINT bulk_upsert")
+        cur.execute("RELEASE SAVEPOINT bulk_upsert")
+        if len(values) == 1:
+            logger.debug(f"Skipping row that failed to insert: {e}")
+            return 0
+    
+    mid = len(values) // 2
+    return (
+        _execute_values_bisect(cur, query, values[:mid], page_size)
+        + _execute_values_bisect(cur, query, values[mid:], page_size)
+    )
+
+
 def insert_symbiosis_exchange(data: dict) -> int:
     """
     Insert a symbiosis exchange record with UPSERT support.
@@ -383,6 +538,30 @@ def get_pipeline_stats() -> dict:
     return result[0] if result else {}
 
 
+def estimate_count(query: str, params: tuple = None, cursor=None) -> int:
+    """
+    Planner row estimate for a query, without executing it.
+    
+    Runs EXPLAIN and returns the top plan node's row count, which comes
+    from table statistics (reltuples / ANALYZE histograms). Good enough
+    for monitoring scripts; use COUNT(*) when an exact number matters.
+    
+    Args:
+        query: SELECT whose result size to estimate (no COUNT(*) wrapper)
+        params: Query parameters
+        cursor: Open cursor to run on (e.g. from session())
+    
+    Returns:
+        Estimated number of rows
+    """
+    result = execute_query(f"EXPLAIN (FORMAT JSON) {query}", params, as_dict=False, cursor=cursor)
+    row = result[0]
+    plan = row["QUERY PLAN"] if isinstance(row, dict) else row[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 def close_pool() -> None:
     """Close the connection pool."""
     global _connection_pool
@@ -390,3 +569,7 @@ def close_pool() -> None:
         _connection_pool.closeall()
         _connection_pool = None
         logger.info("Connection pool closed")
+
+
+# Scripts that never call close_pool() still release their backends on exit
+atexit.register(close_pool)
@@ -9,7 +9,16 @@
 CREATE TABLE IF NOT EXISTS material_prices_raw (
     id SERIAL PRIMARY KEY,
     material_name VARCHAR(100) NOT NULL,
-    material_category VARCHAR(50),
+    -- Computed by Postgres on insert; same keywords/priority as
+    -- pricing_processor._categorize_material
+    material_category VARCHAR(50) GENERATED ALWAYS AS (
+        CASE
+            WHEN material_name ~* '(copper|cu|aluminum|aluminium|al|steel|iron|hms|brass|bronze|lead|pb|zinc|zn)' THEN 'metals'
+            WHEN material_name ~* '(plastic|hdpe|ldpe|pet|pvc|pp)' THEN 'plastics'
+            WHEN material_name ~* '(paper|cardboard|occ)' THEN 'paper'
+            ELSE 'other'
+        END
+    ) STORED,
     
     -- Pricing
     price_value DECIMAL(12,4) NOT NULL,
@@ -68,6 +77,19 @@ CREATE TABLE IF NOT EXISTS material_type_mapping (
 
 CREATE INDEX idx_mapping_waste ON material_type_mapping(waste_material);
 
+-- Expression indexes matching the valuation join key (case/whitespace-insensitive)
+CREATE INDEX IF NOT EXISTS idx_mtm_waste_lower ON material_type_mapping (lower(trim(waste_material)));
+CREATE INDEX IF NOT EXISTS idx_wl_material_lower ON waste_listings (lower(trim(material)));
+
+-- Covering indexes for the exact-match valuation join (sample_valuation.py):
+-- each side of the join is answerable from the index alone
+CREATE INDEX IF NOT EXISTS idx_wl_material_qty_covering ON waste_listings (material)
+    INCLUDE (quantity_tons, source_company) WHERE quantity_tons > 0;
+CREATE INDEX IF NOT EXISTS idx_mtm_waste_covering ON material_type_mapping (waste_material)
+    INCLUDE (material_type_id);
+CREATE INDEX IF NOT EXISTS idx_valuations_type_price ON material_valuations (material_type_id)
+    INCLUDE (price_per_ton_usd);
+
 -- ============================================
 -- VIEW: Instant valuation across all waste
 -- ============================================
@@ -86,6 +108,28 @@ SELECT
     mv.last_updated as price_updated,
     ROUND((wl.quantity_tons * mv.price_per_ton_usd)::numeric, 2) as estimated_value_usd
 FROM waste_listings wl
-LEFT JOIN material_type_mapping mtm ON LOWER(wl.material) = LOWER(mtm.waste_material)
+LEFT JOIN material_type_mapping mtm ON lower(trim(wl.material)) = lower(trim(mtm.waste_material))
 LEFT JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
 WHERE wl.quantity_tons IS NOT NULL AND wl.quantity_tons > 0;
+
+-- ============================================
+-- MATERIALIZED VIEW: Valuation rollup per price type
+-- ============================================
+-- Pre-aggregated waste x mapping x valuation join, so summaries read a
+-- few hundred rows instead of re-joining waste_listings.
+-- Refreshed by pricing_processor.refresh_valuation_rollup() after
+-- price, mapping or waste_listings updates.
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_valuation_rollup AS
+SELECT 
+    mv.material_type_id,
+    mv.material_name,
+    COUNT(*) as records,
+    SUM(wl.quantity_tons) as tons,
+    SUM(wl.quantity_tons * mv.price_per_ton_usd) as value
+FROM waste_listings wl
+JOIN material_type_mapping mtm ON lower(trim(wl.material)) = lower(trim(mtm.waste_material))
+JOIN material_valuations mv ON mtm.material_type_id = mv.material_type_id
+GROUP BY mv.material_type_id, mv.material_name;
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_valuation_rollup_type_id ON mv_valuation_rollup(material_type_id);
@@ -95,6 +95,9 @@ CREATE INDEX idx_waste_material ON waste_listings(material);
 CREATE INDEX idx_waste_category ON waste_listings(material_category);
 CREATE INDEX idx_waste_company ON waste_listings(source_company);
 CREATE INDEX idx_waste_year ON waste_listings(year);
+CREATE INDEX idx_waste_document ON waste_listings(document_id);
+-- Substring / regex material searches (e.g. material ~* 'zinc|copper')
+CREATE INDEX idx_waste_material_trgm ON waste_listings USING gin(material gin_trgm_ops);
 
 -- 🛡️ UNIQUE constraint for UPSERT support (Updated for CSV listings)
 CREATE UNIQUE INDEX idx_waste_listing_granular 
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Symbio Data Engine - Processing Test Suite
+==========================================
+Checks the optimized processing paths against the plain versions they
+replaced (citation matching, normalizer, scope review flag, CSR cache
+key, SEEA and MENA row parsing). No network or database needed.
+
+Run: python test_processing.py
+"""
+
+import math
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def test_citations():
+    """CitationIndex / quotes_in_text agree with the original substring check."""
+    print("\n" + "="*60)
+    print("[TEST 1] Citation Matching")
+    print("="*60)
+    
+    from processors.models import CitationIndex, quotes_in_text
+    
+    document = (
+        "BOROUGE SUSTAINABILITY REPORT 2023. In 2023, we recycled 45,000 tonnes "
+        "of plastic waste. Scope 1: 1,200,000 tCO2e. Scope 2: 850,000 tCO2e."
+    )
+    quotes = [
+        "we recycled 45,000 tonnes of plastic waste",
+        "  SCOPE 1: 1,200,000 TCO2E.  ",
+        "borouge sustainability report 2023",
+        "we recycled 46,000 tonnes",
+        "Scope 3: 450,000 tCO2e",
+        "",
+        None,
+    ]
+    
+    def old_check(quote):
+        # Substring check as validate_citation did it before the index
+        if not quote:
+            return False
+        return quote.lower().strip() in document.lower()
+    
+    expected = [old_check(q) for q in quotes]
+    index = CitationIndex(document)
+    indexed = [index.contains(q) for q in quotes]
+    batched = quotes_in_text(quotes, document)
+    
+    all_passed = True
+    for quote, want, got_index, got_batch in zip(quotes, expected, indexed, batched):
+        passed = got_index == want and got_batch == want
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} {quote!r}: expected {want}, index {got_index}, batch {got_batch}")
+        all_passed = all_passed and passed
+    
+    # Curly quotes in the source still match a straight-quoted citation
+    curly = "The plant’s “green” line cut waste."
+    passed = CitationIndex(curly).contains("plant's \"green\" line") and quotes_in_text(["plant's \"green\" line"], curly) == [True]
+    status = "[PASS]" if passed else "[FAIL]"
+    print(f"   {status} curly quotes normalized in both paths")
+    
+    return all_passed and passed
+
+
+def test_normalizer_outputs():
+    """normalize() leaves text as written; quantities and dates parse as expected."""
+    print("\n" + "="*60)
+    print("[TEST 2] Normalizer Outputs")
+    print("="*60)
+    
+    from processors.normalizer import Normalizer
+    
+    normalizer = Normalizer()
+    all_passed = True
+    
+    text = "Shipped 1,500 tons of slag and 2000 kg of copper in 2021."
+    passed = normalizer.normalize(text) == text
+    status = "[PASS]" if passed else "[FAIL]"
+    print(f"   {status} normalize() keeps the source text unchanged")
+    all_passed = all_passed and passed
+    
+    quantities = normalizer.extract_quantities(text)
+    expected_quantities = [
+        {"original_value": 1500.0, "original_unit": "tons", "metric_tons": 1360.7775},
+        {"original_value": 2000.0, "original_unit": "kg", "metric_tons": 2.0},
+    ]
+    passed = quantities == expected_quantities and normalizer.extract_quantities_batch([text, ""]) == [quantities, []]
+    status = "[PASS]" if passed else "[FAIL]"
+    print(f"   {status} extract_quantities -> {quantities}")
+    all_passed = all_passed and passed
+    
+    date_cases = [
+        ("2021-03-15", datetime(2021, 3, 15)),
+        ("15/03/2021", datetime(2021, 3, 15)),
+        ("March 15, 2021", datetime(2021, 3, 15)),
+        ("2019", datetime(2019, 1, 1)),
+        ("FY 2018 report", datetime(2018, 1, 1)),
+        ("not a date", None),
+        ("2020-02-30", datetime(2020, 1, 1)),
+        # Other ISO forms fall back to the year, with or without ciso8601
+        ("20200503", datetime(2020, 1, 1)),
+        ("2021-03", datetime(2021, 1, 1)),
+        ("2020-05-03T10:00:00", datetime(2020, 1, 1)),
+        ("2020-W10", datetime(2020, 1, 1)),
+    ]
+    for date_str, expected in date_cases:
+        result = normalizer.parse_date(date_str)
+        passed = result == expected
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} parse_date({date_str!r}) -> {result} (expected {expected})")
+        all_passed = all_passed and passed
+    
+    return all_passed
+
+
+def test_scope_review():
+    """Scope 1 + 2 above total sets requires_review in both model backends."""
+    print("\n" + "="*60)
+    print("[TEST 3] Scope Total Review Flag")
+    print("="*60)
+    
+    from processors.models import CarbonEmissionExtraction, validate_and_create
+    
+    try:
+        from processors.fast_models import CarbonEmissionExtractionFast, validate_and_create_fast
+    except ImportError:
+        CarbonEmissionExtractionFast = None
+    
+    text = "ADNOC reported 100 tonnes of CO2 in 2022."
+    cases = [
+        ({"co2_tons": 100, "co2_scope1": 80, "co2_scope2": 50}, True),   # 130 > 110
+        ({"co2_tons": 100, "co2_scope1": 60, "co2_scope2": 45}, False),  # within 10%
+        ({"co2_tons": 100, "co2_scope1": 80}, False),                    # scope 2 missing
+    ]
+    
+    all_passed = True
+    for scopes, expected in cases:
+        data = {
+            "company": "ADNOC",
+            "year": 2022,
+            "source_quote": "ADNOC reported 100 tonnes of CO2 in 2022.",
+            "extraction_confidence": 0.95,
+            **scopes,
+        }
+        flags = [validate_and_create(CarbonEmissionExtraction, data, text).requires_review]
+        if CarbonEmissionExtractionFast is not None:
+            flags.append(validate_and_create_fast(CarbonEmissionExtractionFast, data, text).requires_review)
+        passed = all(flag == expected for flag in flags)
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} {scopes} -> {flags} (expected {expected})")
+        all_passed = all_passed and passed
+    
+    # Fast path: msgspec's reason is kept and None fields are dumped like Pydantic's
+    if CarbonEmissionExtractionFast is not None:
+        from processors.fast_models import to_dict, validate_and_explain_fast
+        
+        data = {"company": "ADNOC", "year": 1800, "source_quote": text, "extraction_confidence": 0.95}
+        _, reason = validate_and_explain_fast(CarbonEmissionExtractionFast, data, text)
+        data["year"] = 2022
+        keys = set(to_dict(validate_and_create_fast(CarbonEmissionExtractionFast, data, text)))
+        ref = validate_and_create(CarbonEmissionExtraction, data, text)
+        ref_keys = set(ref.model_dump(exclude_unset=True)) | {"requires_review"}
+        passed = "$.year" in (reason or "") and keys == ref_keys
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} fast rejection reason: {reason!r}; dict keys match: {keys == ref_keys}")
+        all_passed = all_passed and passed
+    
+    return all_passed
+
+
+def test_csr_cache_key():
+    """Identical PDF bytes under another company/file name are a cache miss."""
+    print("\n" + "="*60)
+    print("[TEST 4] CSR Extraction Cache Key")
+    print("="*60)
+    
+    from run_csr_pipeline import EXTRACTOR_VERSION, _company_for, _open_extract_cache
+    
+    adnoc = Path("data/raw/csr_reports/adnoc/adnoc_2021.pdf")
+    sabic = Path("data/raw/csr_reports/sabic_2019.pdf")
+    sha1 = "0" * 40
+    lookup = (
+        "SELECT payload FROM csr_extract_results "
+        "WHERE sha1 = ? AND company = ? AND filename = ? AND extractor_version = ?"
+    )
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = _open_extract_cache(Path(tmpdir) / "csr_extract.sqlite")
+        with cache:
+            cache.execute(
+                "INSERT INTO csr_extract_results "
+                "(sha1, company, filename, extractor_version, payload) VALUES (?, ?, ?, ?, ?)",
+                (sha1, _company_for(adnoc), adnoc.name, EXTRACTOR_VERSION, b"adnoc"),
+            )
+        hit = cache.execute(lookup, (sha1, _company_for(adnoc), adnoc.name, EXTRACTOR_VERSION)).fetchone()
+        miss = cache.execute(lookup, (sha1, _company_for(sabic), sabic.name, EXTRACTOR_VERSION)).fetchone()
+        cache.close()
+    
+    passed = (
+        _company_for(adnoc) == "adnoc"
+        and _company_for(sabic) == "sabic"
+        and hit == (b"adnoc",)
+        and miss is None
+    )
+    status = "[PASS]" if passed else "[FAIL]"
+    print(f"   {status} same bytes: adnoc hit={hit is not None}, sabic hit={miss is not None}")
+    return passed
+
+
+def test_seea_first_material():
+    """first_material_and_quantity matches the original per-cell loop."""
+    print("\n" + "="*60)
+    print("[TEST 5] SEEA Material/Quantity Parsing")
+    print("="*60)
+    
+    import pandas as pd
+    
+    sys.path.insert(0, str(Path(__file__).parent / "scripts" / "ingestion"))
+    from process_seea import first_material_and_quantity
+    
+    df = pd.DataFrame({
+        "code": ["A1", "1234", "x", "Total", None, "nan", "٤٥", "B2"],
+        "label": ["Steel slag", "Fly ash", "Used oil", 0, "Sludge", "inf", "Ash waste", "Cement dust"],
+        "qty": [120.5, "-3", "1,200", "45", 7, 12, 0, "١٢٣"],
+        "extra": ["note", 9, 3.5, "Hazardous", "Paper", 0, 1, "٤٥٫٥"],
+    })
+    
+    def old_loop(row):
+        # Per-cell heuristic as process_seea ran it before vectorizing
+        material = "Unknown"
+        quantity = 0.0
+        for val in row.values:
+            s_val = str(val).strip()
+            try:
+                f_val = float(s_val)
+                if f_val > 0 and quantity == 0:
+                    quantity = f_val
+            except ValueError:
+                if len(s_val) > 3 and material == "Unknown" and not s_val.isdigit():
+                    material = s_val
+        return material, quantity
+    
+    material, quantity = first_material_and_quantity(df)
+    
+    all_passed = True
+    for i, (_, row) in enumerate(df.iterrows()):
+        expected = old_loop(row)
+        got = (
+            "Unknown" if pd.isna(material.iloc[i]) else material.iloc[i],
+            0.0 if pd.isna(quantity.iloc[i]) else float(quantity.iloc[i]),
+        )
+        passed = got[0] == expected[0] and (
+            got[1] == expected[1] or (math.isinf(got[1]) and math.isinf(expected[1]))
+        )
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} row {i}: {got} (expected {expected})")
+        all_passed = all_passed and passed
+    
+    return all_passed
+
+
+def test_mena_parsing():
+    """MENA quantity/year parsing reads digits in any script, like float()/int() did."""
+    print("\n" + "="*60)
+    print("[TEST 6] MENA Quantity/Year Parsing")
+    print("="*60)
+    
+    import re
+    import pandas as pd
+    
+    sys.path.insert(0, str(Path(__file__).parent / "scripts" / "ingestion"))
+    from ingest_manual_mena import parse_quantities, parse_years
+    
+    def old_quantity(val):
+        # re.sub + float() as ingest_file ran it per row
+        try:
+            return float(re.sub(r'[^\d.]', '', str(val)))
+        except ValueError:
+            return 0.0
+    
+    cells = ["١٢٣", "1200", "1,500 tons", "۴۵٫۵", "٢٬٥٠٠ طن", None, "n/a"]
+    quantities = parse_quantities(pd.Series(cells)).tolist()
+    
+    all_passed = True
+    for cell, got in zip(cells, quantities):
+        expected = old_quantity(cell)
+        passed = got == expected
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} quantity {cell!r} -> {got} (expected {expected})")
+        all_passed = all_passed and passed
+    
+    year_cells = ["٢٠١٩", "2021", 2020, "۱۳۹۹", "2019.5", "FY22", None]
+    expected_years = [2019, 2021, 2020, 1399, 2024, 2024, 2024]
+    years = parse_years(pd.Series(year_cells, dtype=object)).tolist()
+    for cell, got, expected in zip(year_cells, years, expected_years):
+        passed = got == expected
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status} year {cell!r} -> {got} (expected {expected})")
+        all_passed = all_passed and passed
+    
+    return all_passed
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("\n" + "="*60)
+    print("SYMBIO DATA ENGINE - PROCESSING TEST SUITE")
+    print("="*60)
+    
+    results = {
+        "Citations": test_citations(),
+        "Normalizer": test_normalizer_outputs(),
+        "Scope Review": test_scope_review(),
+        "CSR Cache Key": test_csr_cache_key(),
+        "SEEA Parsing": test_seea_first_material(),
+        "MENA Parsing": test_mena_parsing(),
+    }
+    
+    # Summary
+    print("\n" + "="*60)
+    print("TEST SUMMARY")
+    print("="*60)
+    
+    for name, passed in results.items():
+        status = "[PASS]" if passed else "[FAIL]"
+        print(f"   {status}: {name}")
+    
+    passed_count = sum(1 for v in results.values() if v)
+    print("\n" + "-"*60)
+    print(f"   Total: {passed_count}/{len(results)} tests passed")
+    
+    return passed_count == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_all_tests() else 1)
@@ -218,6 +218,19 @@ def test_normalizer():
         if not passed:
             all_passed = False
     
+    # Citations must still verify against the raw document after normalize()
+    from processors.extractor import Extractor
+    from processors.models import quotes_in_text
+    
+    raw_text = "In 2021 the smelter sold 2,500 kg of copper scrap. Output was flat."
+    normalized = normalizer.normalize(raw_text)
+    quote = Extractor(use_llm=False)._extract_waste_listing(normalized)["source_quote"]
+    passed = normalized == raw_text and quotes_in_text([quote], raw_text) == [True]
+    status = "[PASS]" if passed else "[FAIL]"
+    print(f"   {status} normalize() keeps quotes verifiable: {quote!r}")
+    if not passed:
+        all_passed = False
+    
     return all_passed
 
 